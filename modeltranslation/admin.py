@@ -4,6 +4,7 @@ from copy import deepcopy
 from django.contrib import admin
 from django.contrib.admin.options import BaseModelAdmin, flatten_fieldsets, InlineModelAdmin
 from django.contrib.contenttypes import generic
+from django.core.exceptions import ImproperlyConfigured
 
 # Ensure that models are registered for translation before TranslationAdmin
 # runs. The import is supposed to resolve a race condition between model import
@@ -12,7 +13,8 @@ import modeltranslation.models  # NOQA
 from modeltranslation.settings import DEFAULT_LANGUAGE
 from modeltranslation.translator import translator
 from modeltranslation.utils import (
-    get_translation_fields, build_css_class, build_localized_fieldname, get_language, unique)
+    get_translation_fields, build_css_class, build_localized_fieldname, get_language, unique,
+    substitute_language)
 
 
 class TranslationBaseModelAdmin(BaseModelAdmin):
@@ -21,6 +23,12 @@ class TranslationBaseModelAdmin(BaseModelAdmin):
     def __init__(self, *args, **kwargs):
         super(TranslationBaseModelAdmin, self).__init__(*args, **kwargs)
         self.trans_opts = translator.get_options_for_model(self.model)
+        stored = self.trans_opts.json_fields | self.trans_opts.table_fields
+        if stored:
+            # Forms are built of translation fields, which these storages don't add.
+            raise ImproperlyConfigured(
+                '%s can not edit fields with translations stored as JSON or in a table (%s).'
+                % (self.__class__.__name__, ', '.join(sorted(stored))))
         self._patch_prepopulated_fields()
 
     def _declared_fieldsets(self):
@@ -60,7 +68,9 @@ class TranslationBaseModelAdmin(BaseModelAdmin):
             # Add localized fieldname css class
             css_classes.append(build_css_class(db_field.name, 'mt-field'))
 
-            if db_field.language == DEFAULT_LANGUAGE:
+            default_language = substitute_language(
+                DEFAULT_LANGUAGE, self.trans_opts.get_field_languages(orig_field.name))
+            if db_field.language == default_language:
                 # Add another css class to identify a default modeltranslation
                 # widget.
                 css_classes.append('mt-default')
@@ -111,7 +121,8 @@ class TranslationBaseModelAdmin(BaseModelAdmin):
             for opt in option:
                 if opt in self.trans_opts.fields:
                     index = option_new.index(opt)
-                    option_new[index:index + 1] = get_translation_fields(opt)
+                    option_new[index:index + 1] = get_translation_fields(
+                        opt, self.trans_opts.get_field_languages(opt))
                 elif isinstance(opt, (tuple, list)) and (
                         [o for o in opt if o in self.trans_opts.fields]):
                     index = option_new.index(opt)
@@ -137,7 +148,8 @@ class TranslationBaseModelAdmin(BaseModelAdmin):
             for k, v in self.prepopulated_fields.items():
                 for i in v:
                     if i in self.trans_opts.fields.keys():
-                        translation_fields.append(build_localized_fieldname(i, lang))
+                        translation_fields.append(build_localized_fieldname(
+                            i, substitute_language(lang, self.trans_opts.get_field_languages(i))))
                 prepopulated_fields_new[k] = tuple(translation_fields)
             self.prepopulated_fields = prepopulated_fields_new
 
@@ -219,7 +231,8 @@ class TranslationAdmin(TranslationBaseModelAdmin, admin.ModelAdmin):
                 if field in self.trans_opts.fields:
                     index = editable_new.index(field)
                     display_index = display_new.index(field)
-                    translation_fields = get_translation_fields(field)
+                    translation_fields = get_translation_fields(
+                        field, self.trans_opts.get_field_languages(field))
                     editable_new[index:index + 1] = translation_fields
                     display_new[display_index:display_index + 1] = translation_fields
             self.list_editable = editable_new
@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
+import copy
+import json
+
 from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models
 from django.db.models import fields
+from django.utils.six import moves
 
 from modeltranslation import settings as mt_settings
 from modeltranslation.utils import (
-    get_language, build_localized_fieldname, build_localized_verbose_name, resolution_order)
+    get_language, build_localized_fieldname, build_localized_verbose_name, resolution_table,
+    fallbacks_enabled)
 
 
 SUPPORTED_FIELDS = (
@@ -55,14 +62,94 @@ def create_translation_field(model, field_name, lang):
     return translation_class(translated_field=field, language=lang)
 
 
+def check_stored_field(field, storage):
+    """
+    Raises ``ImproperlyConfigured`` if translations of the field can't be
+    kept in the given storage (relations and files can't be stored outside
+    of the model's columns).
+    """
+    cls_name = field.__class__.__name__
+    if not (isinstance(field, SUPPORTED_FIELDS) or cls_name in mt_settings.CUSTOM_FIELDS):
+        raise ImproperlyConfigured(
+            '%s is not supported by modeltranslation.' % cls_name)
+    if field.rel is not None or isinstance(field, fields.files.FileField):
+        raise ImproperlyConfigured(
+            '%s can not be translated with the %s storage.' % (cls_name, storage))
+
+
+def create_translations_field(model, field_name):
+    """
+    Returns a ``JSONTranslationsField`` storing all translations of the
+    field.
+    """
+    field = model._meta.get_field(field_name)
+    check_stored_field(field, 'JSON')
+    return JSONTranslationsField(translated_field=field)
+
+
+def create_translation_model(model, field_names, related_name):
+    """
+    Returns a model for the ``<table>_translation`` table, with a row for each
+    object (``parent``) and language, holding translations of the fields.
+    """
+    class Meta:
+        app_label = model._meta.app_label
+        db_table = '%s_translation' % model._meta.db_table
+        unique_together = (('parent', 'language'),)
+
+    attrs = {
+        '__module__': model.__module__,
+        'Meta': Meta,
+        'parent': models.ForeignKey(model, related_name=related_name),
+        'language': models.CharField(max_length=15),
+    }
+    for field_name in field_names:
+        field = model._meta.get_field(field_name)
+        check_stored_field(field, 'table')
+        # A copy of the field, freed of its model and column.
+        field = copy.copy(field)
+        field.creation_counter = fields.Field.creation_counter
+        fields.Field.creation_counter += 1
+        field.primary_key = field._unique = False
+        field.db_column = None
+        if not isinstance(field, fields.BooleanField):
+            field.null = True
+        field.blank = True
+        attrs[field_name] = field
+    return type(str('%sTranslation' % model._meta.object_name), (models.Model,), attrs)
+
+
+# Generated translation field classes (base field class -> subclass).
+_FIELD_CLASSES = {}
+
+
 def field_factory(baseclass):
+    """
+    Returns a subclass of ``TranslationField`` and the given field class.
+
+    A single subclass is created for each field class and reused for all
+    translation fields based on it.
+    """
+    try:
+        return _FIELD_CLASSES[baseclass]
+    except KeyError:
+        pass
+
     class TranslationFieldSpecific(TranslationField, baseclass):
         pass
 
     # Reflect baseclass name of returned subclass
     TranslationFieldSpecific.__name__ = 'Translation%s' % baseclass.__name__
 
-    return TranslationFieldSpecific
+    return _FIELD_CLASSES.setdefault(baseclass, TranslationFieldSpecific)
+
+
+def get_translation_field_classes():
+    """
+    Returns a dict of translation field classes generated so far, keyed by
+    the original field classes.
+    """
+    return dict(_FIELD_CLASSES)
 
 
 class TranslationField(object):
@@ -124,8 +211,8 @@ class TranslationField(object):
                 self.related_query_name = lambda: loc_related_query_name
             self.rel.related_name = build_localized_fieldname(current, self.language)
             self.rel.field = self  # Django 1.6
-            if hasattr(self.rel.to._meta, '_related_objects_cache'):
-                del self.rel.to._meta._related_objects_cache
+            # Caches of related objects of ``rel.to`` are deleted once the
+            # field is added (see ``Translator._patch_model``).
 
     # Django 1.5 changed definition of __hash__ for fields to be fine with hash requirements.
     # It spoiled our machinery, since TranslationField has the same creation_counter as its
@@ -159,8 +246,14 @@ class TranslationField(object):
         # things right:
         # Translated field is saved first, settings respective translation field value. Then
         # translation field is being saved without value - and we handle this here (only for
-        # active language).
-        if self.language == get_language() and getattr(instance, self.name) and not data:
+        # the field the translated field is assigned to, in the active language or its
+        # substitute).
+        descriptor = getattr(instance.__class__, self.translated_field.name, None)
+        if isinstance(descriptor, TranslationFieldDescriptor):
+            current = descriptor.get_translation_name(instance) == self.name
+        else:
+            current = self.language == get_language()
+        if current and getattr(instance, self.name) and not data:
             return
         super(TranslationField, self).save_form_data(instance, data)
 
@@ -181,40 +274,282 @@ class TranslationField(object):
         return (field_class, args, kwargs)
 
 
+def instance_language(instance):
+    """
+    Returns the language pinned for the instance (see
+    ``MultilingualQuerySet.language``) or the current one.
+    """
+    return instance.__dict__.get('_mt_language') or get_language()
+
+
+class JSONTranslationsField(fields.TextField):
+    """
+    Stores translations of a field as a JSON object (mapping languages to
+    values) in a single column.
+
+    The field value is the JSON text; it's decoded only when a translation
+    is accessed, and the decoded mapping is kept on the instance (and encoded
+    again when the instance is saved).
+    """
+    def __init__(self, translated_field, *args, **kwargs):
+        self.translated_field = translated_field
+        kwargs.update(null=True, blank=True, editable=False)
+        super(JSONTranslationsField, self).__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name):
+        super(JSONTranslationsField, self).contribute_to_class(cls, name)
+        self.cache_name = '_mt_%s' % name
+
+    def get_translations(self, instance):
+        """
+        Returns the mapping of languages to (JSON) values of the instance.
+        """
+        value = getattr(instance, self.attname)
+        cache = instance.__dict__.get(self.cache_name)
+        if cache is None or cache[0] is not value:
+            cache = (value, json.loads(value) if value else {})
+            instance.__dict__[self.cache_name] = cache
+        return cache[1]
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        cache = model_instance.__dict__.get(self.cache_name)
+        if cache is not None and cache[0] is value:
+            # Translations may have been changed since they were decoded.
+            value = self.encode(cache[1])
+            setattr(model_instance, self.attname, value)
+            model_instance.__dict__[self.cache_name] = (value, cache[1])
+        return value
+
+    def encode(self, translations):
+        """
+        Returns the JSON text for a mapping of languages to values.
+        """
+        return json.dumps(translations, cls=DjangoJSONEncoder, sort_keys=True)
+
+    def south_field_triple(self):
+        return ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'})
+
+
+class TranslationTable(object):
+    """
+    Stores translations of fields of a model in a generated model (and its
+    table), with a row for each object and language.
+
+    Translations of an instance are loaded when one of them is first accessed
+    (from rows prefetched with ``related_name``, or with a single query), and
+    rows of the changed languages are saved after the instance.
+    """
+    def __init__(self, model, field_names):
+        self.related_name = '%s_translations' % model._meta.module_name
+        self.cache_name = '_mt_%s' % self.related_name
+        self.changed_name = '_mt_%s_changed' % self.related_name
+        self.field_names = tuple(field_names)
+        self.model = create_translation_model(model, self.field_names, self.related_name)
+
+    def get_translations(self, instance):
+        """
+        Returns a mapping of languages to dicts of translations (by field
+        name) of the instance.
+        """
+        try:
+            return instance.__dict__[self.cache_name]
+        except KeyError:
+            pass
+        names = ('language',) + self.field_names
+        prefetched = getattr(instance, '_prefetched_objects_cache', {})
+        if self.related_name in prefetched:
+            rows = [dict((name, getattr(row, name)) for name in names)
+                    for row in prefetched[self.related_name]]
+        elif instance.pk is None:
+            rows = []
+        else:
+            rows = self.model._default_manager.using(instance._state.db).filter(
+                parent=instance.pk).values(*names)
+        translations = dict((row.pop('language'), row) for row in rows)
+        instance.__dict__[self.cache_name] = translations
+        return translations
+
+    def set_translation(self, instance, language, field_name, value):
+        self.get_translations(instance).setdefault(language, {})[field_name] = value
+        instance.__dict__.setdefault(self.changed_name, set()).add(language)
+
+    def save_translations(self, sender, instance, using=None, **kwargs):
+        """
+        Saves rows of languages changed since the instance was loaded (meant
+        to be connected to ``post_save`` of the model).
+        """
+        changed = instance.__dict__.pop(self.changed_name, None)
+        if not changed:
+            return
+        manager = self.model._default_manager.using(using)
+        translations = self.get_translations(instance)
+        for language in changed:
+            values = translations[language]
+            if not manager.filter(parent=instance.pk, language=language).update(**values):
+                manager.create(parent_id=instance.pk, language=language, **values)
+
+    def update_translations(self, pks, language, values, using=None):
+        """
+        Sets translations of a language of objects with the given primary
+        keys (meant for ``update()``), changing existing rows and inserting
+        missing ones.
+        """
+        manager = self.model._default_manager.using(using)
+        batch_size = max(connections[manager.db].ops.bulk_batch_size(['parent'], pks), 1)
+        for start in moves.range(0, len(pks), batch_size):
+            batch = pks[start:start + batch_size]
+            rows = manager.filter(parent__in=batch, language=language)
+            rows.update(**values)
+            existing = set(rows.values_list('parent', flat=True))
+            manager.bulk_create([self.model(parent_id=pk, language=language, **values)
+                                 for pk in batch if pk not in existing])
+
+    def get_bulk_rows(self, instances):
+        """
+        Returns (unsaved) rows of the changed languages of instances about
+        to be bulk created (``bulk_create`` doesn't send ``post_save``).
+
+        Instances with changed translations need to have their primary keys
+        set, as they are not returned by the bulk insert.
+        """
+        rows = []
+        for instance in instances:
+            changed = instance.__dict__.get(self.changed_name)
+            if not changed:
+                continue
+            if instance.pk is None:
+                raise ValueError(
+                    'Translations of %s stored in a table can only be bulk created for '
+                    'objects with primary keys set.' % instance._meta.object_name)
+            translations = self.get_translations(instance)
+            rows.extend(self.model(parent_id=instance.pk, language=language,
+                                   **translations[language]) for language in changed)
+        return rows
+
+    def bulk_save_translations(self, instances, rows, using=None):
+        """
+        Inserts rows returned by ``get_bulk_rows``, once the instances are.
+        """
+        if rows:
+            self.model._default_manager.using(using).bulk_create(rows)
+        for instance in instances:
+            instance.__dict__.pop(self.changed_name, None)
+
+
+class TranslationAttribute(object):
+    """
+    Base of descriptors standing in for translation fields with storages
+    that don't add them as model fields.
+    """
+    def __init__(self, translated_field, language):
+        self.translated_field = translated_field
+        self.language = language
+        self.name = self.attname = build_localized_fieldname(translated_field.name, language)
+
+
+class TableTranslationDescriptor(TranslationAttribute):
+    """
+    Provides access to a translation stored in a ``TranslationTable``.
+    """
+    def __init__(self, table, translated_field, language):
+        super(TableTranslationDescriptor, self).__init__(translated_field, language)
+        self.table = table
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        translations = self.table.get_translations(instance).get(self.language, {})
+        return translations.get(self.translated_field.name)
+
+    def __set__(self, instance, value):
+        self.table.set_translation(instance, self.language, self.translated_field.name, value)
+
+
+class JSONTranslationDescriptor(TranslationAttribute):
+    """
+    Provides access to a translation stored by a ``JSONTranslationsField``.
+    """
+    def __init__(self, translations_field, language):
+        super(JSONTranslationDescriptor, self).__init__(
+            translations_field.translated_field, language)
+        self.translations_field = translations_field
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.translations_field.get_translations(instance).get(self.language)
+        if value is None:
+            return None
+        return self.translated_field.to_python(value)
+
+    def __set__(self, instance, value):
+        if value is not None:
+            # Stored as it would be in a column (and JSON lookups expect).
+            value = self.translated_field.to_python(value)
+        self.translations_field.get_translations(instance)[self.language] = value
+
+
 class TranslationFieldDescriptor(object):
     """
     A descriptor used for the original translated field.
     """
-    def __init__(self, field, fallback_value=None, fallback_languages=None):
+    def __init__(self, field, fallback_value=None, fallback_languages=None, languages=None):
         """
         The ``name`` is the name of the field (which is not available in the
         descriptor by default - this is Python behaviour).
+
+        The ``languages`` the field is translated into default to all
+        available languages.
         """
         self.field = field
         self.fallback_value = fallback_value
         self.fallback_languages = fallback_languages
+        self.languages = languages
+        self._compile()
+
+    def _compile(self):
+        """
+        Precomputes localized attribute names to check for every language.
+        """
+        attnames = dict((lang, build_localized_fieldname(self.field.name, lang))
+                        for lang in self.languages or mt_settings.AVAILABLE_LANGUAGES)
+        self._fallbacks = mt_settings.FALLBACK_LANGUAGES
+        self._resolution_table = resolution_table(attnames, self.fallback_languages)
 
     def __set__(self, instance, value):
         if getattr(instance, '_mt_init', False):
             # When assignment takes place in model instance constructor, don't set value.
             # This is essential for only/defer to work, but I think it's sensible anyway.
             return
-        lang = get_language()
-        loc_field_name = build_localized_fieldname(self.field.name, lang)
-        # also update the translation field of the current language
-        setattr(instance, loc_field_name, value)
+        # also update the translation field of the current language (or its substitute)
+        setattr(instance, self.get_translation_name(instance), value)
+
+    def get_translation_name(self, instance):
+        """
+        Returns the name of the translation field assignments to the field
+        go to (of the instance's language or its substitute).
+        """
+        if self._fallbacks is not mt_settings.FALLBACK_LANGUAGES:
+            self._compile()
+        return self._resolution_table[instance_language(instance)][0]
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        langs = resolution_order(get_language(), self.fallback_languages)
-        for lang in langs:
-            loc_field_name = build_localized_fieldname(self.field.name, lang)
-            val = getattr(instance, loc_field_name, None)
+        if self._fallbacks is not mt_settings.FALLBACK_LANGUAGES:
+            # Settings have been reloaded (this should only happen in tests).
+            self._compile()
+        attnames = self._resolution_table[instance_language(instance)]
+        enable_fallbacks = fallbacks_enabled()
+        if not enable_fallbacks:
+            attnames = attnames[:1]
+        for attname in attnames:
+            val = getattr(instance, attname, None)
             # Here we check only for None and '', because e.g. 0 should not fall back.
             if val is not None and val != '':
                 return val
-        if self.fallback_value is None or not mt_settings.ENABLE_FALLBACKS:
+        if self.fallback_value is None or not enable_fallbacks:
             return self.field.get_default()
         else:
             return self.fallback_value
@@ -225,26 +560,35 @@ class TranslatedRelationIdDescriptor(object):
     A descriptor used for the original '_id' attribute of a translated
     ForeignKey field.
     """
-    def __init__(self, field_name, fallback_languages):
+    def __init__(self, field_name, fallback_languages, attnames):
+        """
+        The ``attnames`` should map languages to attribute names of
+        respective translation fields (those with the '_id' suffix).
+        """
         self.field_name = field_name  # The name of the original field (excluding '_id')
         self.fallback_languages = fallback_languages
+        self.attnames = attnames
+        self._compile()
+
+    def _compile(self):
+        self._fallbacks = mt_settings.FALLBACK_LANGUAGES
+        self._resolution_table = resolution_table(self.attnames, self.fallback_languages)
 
     def __set__(self, instance, value):
-        lang = get_language()
-        loc_field_name = build_localized_fieldname(self.field_name, lang)
-        # Localized field name with '_id'
-        loc_attname = instance._meta.get_field(loc_field_name).get_attname()
-        setattr(instance, loc_attname, value)
+        if self._fallbacks is not mt_settings.FALLBACK_LANGUAGES:
+            self._compile()
+        setattr(instance, self._resolution_table[instance_language(instance)][0], value)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        langs = resolution_order(get_language(), self.fallback_languages)
-        for lang in langs:
-            loc_field_name = build_localized_fieldname(self.field_name, lang)
-            # Localized field name with '_id'
-            loc_attname = instance._meta.get_field(loc_field_name).get_attname()
-            val = getattr(instance, loc_attname, None)
+        if self._fallbacks is not mt_settings.FALLBACK_LANGUAGES:
+            self._compile()
+        attnames = self._resolution_table[instance_language(instance)]
+        if not fallbacks_enabled():
+            attnames = attnames[:1]
+        for attname in attnames:
+            val = getattr(instance, attname, None)
             if val is not None:
                 return val
         return None
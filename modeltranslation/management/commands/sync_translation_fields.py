@@ -9,42 +9,29 @@ You will need to execute this command in two cases:
 
 Credits: Heavily inspired by django-transmeta's sync_transmeta_db command.
 """
+from optparse import make_option
+
 from django.conf import settings
 from django.core.management.base import NoArgsCommand
 from django.core.management.color import no_style
 from django.db import connection, transaction
+from django.utils.datastructures import SortedDict
 from django.utils.six import moves
 
 from modeltranslation.translator import translator
-from modeltranslation.utils import build_localized_fieldname
-
-
-def ask_for_confirmation(sql_sentences, model_full_name):
-    print('\nSQL to synchronize "%s" schema:' % model_full_name)
-    for sentence in sql_sentences:
-        print('   %s' % sentence)
-    while True:
-        prompt = '\nAre you sure that you want to execute the previous SQL: (y/n) [n]: '
-        answer = moves.input(prompt).strip()
-        if answer == '':
-            return False
-        elif answer not in ('y', 'n', 'yes', 'no'):
-            print('Please answer yes or no')
-        elif answer == 'y' or answer == 'yes':
-            return True
-        else:
-            return False
-
-
-def print_missing_langs(missing_langs, field_name, model_name):
-    print('Missing languages in "%s" field from "%s" model: %s' % (
-        field_name, model_name, ", ".join(missing_langs)))
+from modeltranslation.utils import build_localized_fieldname, build_translations_fieldname
 
 
 class Command(NoArgsCommand):
     help = ('Detect new translatable fields or new available languages and'
             ' sync database structure. Does not remove columns of removed'
             ' languages or undeclared fields.')
+    option_list = NoArgsCommand.option_list + (
+        make_option('--noinput', action='store_false', dest='interactive', default=True,
+                    help='Do NOT prompt the user for input of any kind.'),
+        make_option('--sql-only', action='store_true', dest='sql_only', default=False,
+                    help='Only print the SQL, without executing it.'),
+    )
 
     def handle_noargs(self, **options):
         """
@@ -52,66 +39,146 @@ class Command(NoArgsCommand):
         """
         self.cursor = connection.cursor()
         self.introspection = connection.introspection
+        self.interactive = options['interactive']
+        self.sql_only = options['sql_only']
+        self.table_fields = {}
 
         found_missing_fields = False
         models = translator.get_registered_models(abstract=False)
         for model in models:
-            db_table = model._meta.db_table
             model_full_name = '%s.%s' % (model._meta.app_label, model._meta.module_name)
             opts = translator.get_options_for_model(model)
-            for field_name in opts.local_fields.iterkeys():
-                missing_langs = list(self.get_missing_languages(field_name, db_table))
+            missing_fields = []
+            for field_name in opts.local_fields.keys():
+                missing_langs = list(self.get_missing_languages(field_name, model))
                 if missing_langs:
-                    found_missing_fields = True
-                    print_missing_langs(missing_langs, field_name, model_full_name)
-                    sql_sentences = self.get_sync_sql(field_name, missing_langs, model)
-                    execute_sql = ask_for_confirmation(sql_sentences, model_full_name)
-                    if execute_sql:
-                        print('Executing SQL...')
-                        for sentence in sql_sentences:
-                            self.cursor.execute(sentence)
-                        print('Done')
-                    else:
-                        print('SQL not executed')
+                    missing_fields.append((field_name, missing_langs))
+                    if not self.sql_only:
+                        self.print_missing_langs(missing_langs, field_name, model_full_name)
+            if not missing_fields:
+                continue
+            found_missing_fields = True
+            sql_sentences = self.get_sync_sql(model, missing_fields)
+            if self.sql_only:
+                for sentence in sql_sentences:
+                    self.stdout.write('%s\n' % sentence)
+            elif not self.interactive or self.ask_for_confirmation(sql_sentences,
+                                                                   model_full_name):
+                self.stdout.write('Executing SQL...\n')
+                for sentence in sql_sentences:
+                    self.cursor.execute(sentence)
+                # The table has changed, introspect it again if needed.
+                self.table_fields.pop(model._meta.db_table, None)
+                self.stdout.write('Done\n')
+            else:
+                self.stdout.write('SQL not executed\n')
 
         transaction.commit_unless_managed()
 
-        if not found_missing_fields:
-            print('No new translatable fields detected')
+        if not found_missing_fields and not self.sql_only:
+            self.stdout.write('No new translatable fields detected\n')
+
+    def ask_for_confirmation(self, sql_sentences, model_full_name):
+        self.stdout.write('\nSQL to synchronize "%s" schema:\n' % model_full_name)
+        for sentence in sql_sentences:
+            self.stdout.write('   %s\n' % sentence)
+        while True:
+            prompt = '\nAre you sure that you want to execute the previous SQL: (y/n) [n]: '
+            answer = moves.input(prompt).strip()
+            if answer == '':
+                return False
+            elif answer not in ('y', 'n', 'yes', 'no'):
+                self.stdout.write('Please answer yes or no\n')
+            elif answer == 'y' or answer == 'yes':
+                return True
+            else:
+                return False
+
+    def print_missing_langs(self, missing_langs, field_name, model_name):
+        self.stdout.write('Missing languages in "%s" field from "%s" model: %s\n' % (
+            field_name, model_name, ", ".join(missing_langs)))
 
     def get_table_fields(self, db_table):
         """
-        Gets table fields from schema.
+        Gets table fields from schema (each table is introspected only once).
         """
-        db_table_desc = self.introspection.get_table_description(self.cursor, db_table)
-        return [t[0] for t in db_table_desc]
+        if db_table not in self.table_fields:
+            db_table_desc = self.introspection.get_table_description(self.cursor, db_table)
+            self.table_fields[db_table] = set(t[0] for t in db_table_desc)
+        return self.table_fields[db_table]
 
-    def get_missing_languages(self, field_name, db_table):
+    def get_missing_languages(self, field_name, model):
         """
         Gets only missings fields.
+
+        Translations stored as JSON are all missing if their column is, as are
+        translations stored in a table (unless it doesn't exist yet, it's
+        created by ``syncdb`` then).
         """
-        db_table_fields = self.get_table_fields(db_table)
-        for lang_code, lang_name in settings.LANGUAGES:
-            if build_localized_fieldname(field_name, lang_code) not in db_table_fields:
+        opts = translator.get_options_for_model(model)
+        if field_name in opts.table_fields:
+            translation_model = self.get_translation_model(model, field_name)
+            db_table = translation_model._meta.db_table
+            if db_table in self.introspection.table_names(self.cursor):
+                field = translation_model._meta.get_field(field_name)
+                if field.column not in self.get_table_fields(db_table):
+                    for lang_code in opts.get_field_languages(field_name):
+                        yield lang_code
+            return
+        db_table_fields = self.get_table_fields(model._meta.db_table)
+        if field_name in opts.json_fields:
+            field = model._meta.get_field(build_translations_fieldname(field_name))
+            if field.column not in db_table_fields:
+                for lang_code in opts.get_field_languages(field_name):
+                    yield lang_code
+            return
+        for lang_code in opts.get_field_languages(field_name):
+            field = model._meta.get_field(build_localized_fieldname(field_name, lang_code))
+            if field.column not in db_table_fields:
                 yield lang_code
 
-    def get_sync_sql(self, field_name, missing_langs, model):
+    def get_translation_model(self, model, field_name):
+        """
+        Returns the model of the table storing translations of the field.
         """
-        Returns SQL needed for sync schema for a new translatable field.
+        return getattr(model, build_localized_fieldname(
+            field_name, translator.get_options_for_model(model).languages[0])).table.model
+
+    def get_sync_sql(self, model, missing_fields):
+        """
+        Returns SQL needed for sync schema for new translatable fields.
+
+        ``missing_fields`` is a list of (field name, missing languages) pairs.
+        All columns of a table are added with a single ``ALTER TABLE``
+        statement, except for SQLite, which can only add one column at a time.
         """
         qn = connection.ops.quote_name
         style = no_style()
-        sql_output = []
-        db_table = model._meta.db_table
-        for lang in missing_langs:
-            new_field = build_localized_fieldname(field_name, lang)
-            f = model._meta.get_field(new_field)
-            col_type = f.db_type(connection=connection)
-            field_sql = [style.SQL_FIELD(qn(f.column)), style.SQL_COLTYPE(col_type)]
-            # column creation
-            sql_output.append("ALTER TABLE %s ADD COLUMN %s;" % (qn(db_table), ' '.join(field_sql)))
-            if not f.null and lang == settings.LANGUAGE_CODE:
-                sql_output.append(
-                    ("ALTER TABLE %s MODIFY COLUMN %s %s %s;" % (
-                        qn(db_table), qn(f.column), col_type, style.SQL_KEYWORD('NOT NULL'))))
-        return sql_output
+        alterations = SortedDict()
+        opts = translator.get_options_for_model(model)
+        for field_name, missing_langs in missing_fields:
+            if field_name in opts.table_fields:
+                # A single column in the table of translations.
+                new_fields = [(self.get_translation_model(model, field_name), field_name, None)]
+            elif field_name in opts.json_fields:
+                # A single column for all languages.
+                new_fields = [(model, build_translations_fieldname(field_name), None)]
+            else:
+                new_fields = [(model, build_localized_fieldname(field_name, lang), lang)
+                              for lang in missing_langs]
+            for new_model, new_field, lang in new_fields:
+                table_alterations = alterations.setdefault(new_model._meta.db_table, [])
+                f = new_model._meta.get_field(new_field)
+                col_type = f.db_type(connection=connection)
+                field_sql = [style.SQL_FIELD(qn(f.column)), style.SQL_COLTYPE(col_type)]
+                # column creation
+                table_alterations.append("ADD COLUMN %s" % ' '.join(field_sql))
+                if not f.null and lang == settings.LANGUAGE_CODE:
+                    table_alterations.append("MODIFY COLUMN %s %s %s" % (
+                        qn(f.column), col_type, style.SQL_KEYWORD('NOT NULL')))
+        if connection.vendor == 'sqlite':
+            return ["ALTER TABLE %s %s;" % (qn(db_table), alteration)
+                    for db_table, table_changes in alterations.items()
+                    for alteration in table_changes]
+        return ["ALTER TABLE %s %s;" % (qn(db_table), ', '.join(table_changes))
+                for db_table, table_changes in alterations.items()]
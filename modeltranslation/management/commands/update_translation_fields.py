@@ -1,33 +1,315 @@
 # -*- coding: utf-8 -*-
-from django.db.models import F, Q
-from django.core.management.base import NoArgsCommand
+import sys
+import threading
+import time
+from optparse import make_option
 
+from django.db import connections, router, transaction
+from django.db.models import F, Q, Min, Max, get_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import six
+from django.utils.six import moves
+
+from modeltranslation.manager import get_json_set_sql
 from modeltranslation.settings import DEFAULT_LANGUAGE
-from modeltranslation.translator import translator
-from modeltranslation.utils import build_localized_fieldname
+from modeltranslation.translator import translator, NotRegistered
+from modeltranslation.utils import (build_localized_fieldname, build_translations_fieldname,
+                                    substitute_language)
 
 
-class Command(NoArgsCommand):
+class Command(BaseCommand):
     help = ('Updates empty values of default translation fields using'
-            ' values from original fields (in all translated models).')
+            ' values from original fields (in all translated models or'
+            ' just the given ones).')
+    args = '[app_label.ModelName[.field_name] ...]'
+    option_list = BaseCommand.option_list + (
+        make_option('--chunk-size', type='int', dest='chunk_size', default=0, metavar='SIZE',
+                    help='Update rows in primary key ranges of SIZE, each in a separate query '
+                    '(by default all rows of a field are updated at once).'),
+        make_option('--dry-run', action='store_true', dest='dry_run', default=False,
+                    help='Only count rows that would be updated.'),
+        make_option('--jobs', type='int', dest='jobs', default=1, metavar='N',
+                    help='Process up to N models concurrently, each in a thread with its own '
+                    'database connection.'),
+    )
+
+    def handle(self, *args, **options):
+        self.verbosity = int(options['verbosity'])
+        self.chunk_size = options['chunk_size']
+        self.dry_run = options['dry_run']
+        jobs = options['jobs']
+        if self.chunk_size < 0:
+            raise CommandError('Chunk size has to be a positive number.')
+        if jobs < 1:
+            raise CommandError('Number of jobs has to be a positive number.')
+        self.output_lock = threading.Lock()
 
-    def handle_noargs(self, **options):
-        verbosity = int(options['verbosity'])
-        if verbosity > 0:
+        if self.verbosity > 0:
             self.stdout.write("Using default language: %s\n" % DEFAULT_LANGUAGE)
-        models = translator.get_registered_models(abstract=False)
-        for model in models:
-            if verbosity > 0:
-                self.stdout.write("Updating data of model '%s'\n" % model)
-            opts = translator.get_options_for_model(model)
-            for field_name in opts.fields.keys():
-                def_lang_fieldname = build_localized_fieldname(field_name, DEFAULT_LANGUAGE)
-
-                # We'll only update fields which do not have an existing value
-                q = Q(**{def_lang_fieldname: None})
-                field = model._meta.get_field(field_name)
-                if field.empty_strings_allowed:
-                    q |= Q(**{def_lang_fieldname: ""})
-
-                model.objects.filter(q).rewrite(False).update(
-                    **{def_lang_fieldname: F(field_name)})
+        work = self.get_models_and_fields(args)
+        if jobs > 1 and any(self.uses_memory_database(model) for model, _ in work):
+            # Every thread would see its own, empty database.
+            self.stderr.write("In-memory databases can't be shared between threads, "
+                              "models will be processed serially.\n")
+            jobs = 1
+        if jobs == 1:
+            results = [self.process_model(model, field_names) for model, field_names in work]
+        else:
+            results = self.process_concurrently(work, jobs)
+
+        if self.verbosity > 0 and results:
+            self.stdout.write("Summary:\n")
+            for model, rows, seconds in results:
+                self.stdout.write("  %s: %d rows %s in %.2fs\n" % (
+                    model._meta.object_name, rows,
+                    'would be updated' if self.dry_run else 'updated', seconds))
+            self.stdout.write("  Total: %d rows\n" % sum(rows for _, rows, _ in results))
+
+    def write(self, msg):
+        with self.output_lock:
+            self.stdout.write(msg)
+
+    def uses_memory_database(self, model):
+        connection = connections[router.db_for_write(model)]
+        return connection.vendor == 'sqlite' and connection.settings_dict['NAME'] in (
+            '', ':memory:')
+
+    def process_model(self, model, field_names):
+        """
+        Updates (or counts) rows of the given fields of ``model``.
+
+        Returns a (model, rows, seconds) tuple.
+        """
+        start = time.time()
+        rows = 0
+        if self.verbosity > 0:
+            self.write("Updating data of model '%s'\n" % model)
+        for field_name in field_names:
+            if self.dry_run:
+                field_rows = self.get_queryset(model, field_name).count()
+                if self.verbosity > 0:
+                    self.write("  %s.%s: %d rows would be updated\n" % (
+                        model._meta.object_name, field_name, field_rows))
+            else:
+                field_rows = self.update_field(model, field_name, self.chunk_size)
+            rows += field_rows
+        return model, rows, time.time() - start
+
+    def process_concurrently(self, work, jobs):
+        """
+        Processes models using a pool of threads. Results are returned in the
+        order of ``work``.
+        """
+        results = {}
+        errors = []
+        pending = list(enumerate(work))
+        pending.reverse()
+        pending_lock = threading.Lock()
+
+        def worker():
+            try:
+                while not errors:
+                    with pending_lock:
+                        if not pending:
+                            return
+                        index, (model, field_names) = pending.pop()
+                    try:
+                        results[index] = self.process_model(model, field_names)
+                    except Exception:
+                        errors.append(sys.exc_info())
+            finally:
+                # Connections are thread-local, close the ones this thread opened.
+                for connection in connections.all():
+                    connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(min(jobs, len(work)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            six.reraise(*errors[0])
+        return [results[index] for index in sorted(results)]
+
+    def get_models_and_fields(self, labels):
+        """
+        Returns a list of (model, field names) pairs to update.
+        """
+        if not labels:
+            return [(model, list(translator.get_options_for_model(model).fields.keys()))
+                    for model in translator.get_registered_models(abstract=False)]
+        result = []
+        for label in labels:
+            bits = label.split('.')
+            if len(bits) not in (2, 3):
+                raise CommandError('Invalid model label: %s' % label)
+            app_label, model_name = bits[:2]
+            field_name = bits[2] if len(bits) == 3 else None
+            model = get_model(app_label, model_name)
+            if model is None:
+                raise CommandError('Unknown model: %s.%s' % (app_label, model_name))
+            try:
+                opts = translator.get_options_for_model(model)
+            except NotRegistered:
+                opts = None
+            if opts is None or not opts.registered:
+                raise CommandError('Model %s is not registered for translation.' % label)
+            if field_name is None:
+                result.append((model, list(opts.fields.keys())))
+            elif field_name in opts.fields:
+                result.append((model, [field_name]))
+            else:
+                raise CommandError('Field %s is not translated.' % label)
+        return result
+
+    def get_default_language(self, model, field_name):
+        """
+        Returns the default language (or a substitute if the field isn't
+        translated into it).
+        """
+        languages = translator.get_options_for_model(model).get_field_languages(field_name)
+        return substitute_language(DEFAULT_LANGUAGE, languages)
+
+    def get_default_fieldname(self, model, field_name):
+        """
+        Returns the name of the default translation field.
+        """
+        return build_localized_fieldname(field_name,
+                                         self.get_default_language(model, field_name))
+
+    def uses_expressions(self, model, field_name):
+        # Translations stored as JSON or in a table are looked up with SQL expressions.
+        opts = translator.get_options_for_model(model)
+        return field_name in opts.json_fields or field_name in opts.table_fields
+
+    def get_queryset(self, model, field_name):
+        """
+        Returns a queryset of rows with empty default translation field.
+        """
+        if self.uses_expressions(model, field_name):
+            # Lookups on the translated field are rewritten by the manager.
+            qs = model.objects.language(self.get_default_language(model, field_name))
+            if model._meta.get_field(field_name).empty_strings_allowed:
+                return qs.exclude(**{'%s__gt' % field_name: ''}).rewrite(False)
+            return qs.filter(**{field_name: None}).rewrite(False)
+        def_lang_fieldname = self.get_default_fieldname(model, field_name)
+
+        # We'll only update fields which do not have an existing value
+        q = Q(**{def_lang_fieldname: None})
+        field = model._meta.get_field(field_name)
+        if field.empty_strings_allowed:
+            q |= Q(**{def_lang_fieldname: ""})
+        return model.objects.filter(q).rewrite(False)
+
+    def update_field(self, model, field_name, chunk_size):
+        opts = translator.get_options_for_model(model)
+        if field_name in opts.table_fields:
+            update = self.update_table_rows
+        elif field_name in opts.json_fields:
+            update = self.update_json_rows
+        else:
+            update = self.update_rows
+        qs = self.get_queryset(model, field_name)
+        if not chunk_size:
+            rows = update(model, field_name, qs)
+            if self.verbosity > 1:
+                self.write("  %s.%s: %d rows updated\n" % (
+                    model._meta.object_name, field_name, rows))
+            return rows
+
+        bounds = qs.aggregate(low=Min('pk'), high=Max('pk'))
+        low, high = bounds['low'], bounds['high']
+        if low is None:
+            return 0
+        if not isinstance(low, six.integer_types):
+            raise CommandError('Chunking is only supported for integer primary keys '
+                               '(model %s).' % model._meta.object_name)
+        rows = 0
+        for start in moves.range(low, high + 1, chunk_size):
+            rows += update(model, field_name,
+                           qs.filter(pk__gte=start, pk__lt=start + chunk_size))
+            if self.verbosity > 0:
+                done = min(start + chunk_size - 1, high) - low + 1
+                self.write("  %s.%s: %d rows updated (primary keys %d%% done)\n" % (
+                    model._meta.object_name, field_name, rows, 100 * done // (high - low + 1)))
+        return rows
+
+    def update_rows(self, model, field_name, qs):
+        def_lang_fieldname = self.get_default_fieldname(model, field_name)
+        return qs.update(**{def_lang_fieldname: F(field_name)})
+
+    def get_pk_subquery(self, qs, connection):
+        """
+        Returns a (sql, params) pair selecting primary keys of the queryset.
+        """
+        sql, params = qs.order_by().values_list('pk').query.get_compiler(
+            connection=connection).as_sql()
+        if not connection.features.update_can_self_select:
+            # MySQL can't select from the updated table (unless in a derived table).
+            sql = 'SELECT * FROM (%s) mt_pks' % sql
+        return sql, params
+
+    def update_json_rows(self, model, field_name, qs):
+        """
+        Sets the default language translations stored as JSON, with a single
+        ``UPDATE`` changing the JSON in the database.
+        """
+        using = router.db_for_write(model)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        opts = model._meta
+        table = qn(opts.db_table)
+        column = qn(opts.get_field(build_translations_fieldname(field_name)).column)
+        value = '%s.%s' % (table, qn(opts.get_field(field_name).column))
+        json_sql = get_json_set_sql('%s.%s' % (table, column),
+                                    self.get_default_language(model, field_name), value,
+                                    connection)
+        pks_sql, params = self.get_pk_subquery(qs, connection)
+        cursor = connection.cursor()
+        cursor.execute('UPDATE %s SET %s = %s WHERE %s IN (%s)' % (
+            table, column, json_sql, qn(opts.pk.column), pks_sql), params)
+        transaction.commit_unless_managed(using=using)
+        return cursor.rowcount
+
+    def update_table_rows(self, model, field_name, qs):
+        """
+        Sets the default language translations stored in a table, with an
+        ``UPDATE`` of existing translation rows (copying values with a
+        correlated subquery) and an ``INSERT`` of the missing ones.
+        """
+        lang = self.get_default_language(model, field_name)
+        table_model = getattr(model, build_localized_fieldname(field_name, lang)).table.model
+        using = router.db_for_write(model)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        opts, table_opts = model._meta, table_model._meta
+        table, translation_table = qn(opts.db_table), qn(table_opts.db_table)
+        pk = '%s.%s' % (table, qn(opts.pk.column))
+        value = '%s.%s' % (table, qn(opts.get_field(field_name).column))
+        column = qn(table_opts.get_field(field_name).column)
+        parent = '%s.%s' % (translation_table, qn(table_opts.get_field('parent').column))
+        language = '%s.%s' % (translation_table, qn(table_opts.get_field('language').column))
+        pks_sql, pks_params = self.get_pk_subquery(qs, connection)
+        cursor = connection.cursor()
+        cursor.execute(
+            'UPDATE %s SET %s = (SELECT %s FROM %s WHERE %s = %s) WHERE %s = %%s AND %s IN (%s)' % (
+                translation_table, column, value, table, pk, parent, language, parent, pks_sql),
+            [lang] + list(pks_params))
+        rows = cursor.rowcount
+        # Other translations of new rows get their defaults.
+        others = [f for f in table_opts.local_fields if not f.primary_key and
+                  f.name not in ('parent', 'language', field_name)]
+        columns = [qn(table_opts.get_field('parent').column),
+                   qn(table_opts.get_field('language').column), column]
+        columns.extend(qn(f.column) for f in others)
+        values = [pk, '%s', value] + ['%s'] * len(others)
+        params = [lang] + [f.get_db_prep_save(f.get_default(), connection) for f in others]
+        cursor.execute(
+            'INSERT INTO %s (%s) SELECT %s FROM %s WHERE %s IN (%s) AND NOT EXISTS '
+            '(SELECT 1 FROM %s WHERE %s = %s AND %s = %%s)' % (
+                translation_table, ', '.join(columns), ', '.join(values), table, pk, pks_sql,
+                translation_table, parent, pk, language),
+            params + list(pks_params) + [lang])
+        rows += cursor.rowcount
+        transaction.commit_unless_managed(using=using)
+        return rows
@@ -5,14 +5,26 @@ django-linguo by Zach Mathew
 
 https://github.com/zmathew/django-linguo
 """
-from django.db import models
+import copy
+import json
+import threading
+
+from django.core.exceptions import FieldError
+from django.db import models, connections, transaction
+from django.db.models import sql
+from django.db.models.query import ValuesQuerySet, ValuesListQuerySet
 from django.db.models.fields.related import RelatedField, RelatedObject
-from django.db.models.sql.where import Constraint
+from django.db.models.sql.expressions import SQLEvaluator
+from django.db.models.sql.where import AND, Constraint, ExtraWhere
+from django.utils.datastructures import SortedDict
+from django.utils.six.moves import copyreg
 from django.utils.tree import Node
 
 from modeltranslation import settings
-from modeltranslation.utils import (build_localized_fieldname, get_language,
-                                    auto_populate)
+from modeltranslation.fields import JSONTranslationDescriptor, TranslationAttribute
+from modeltranslation.utils import (build_localized_fieldname, build_translations_fieldname,
+                                    get_language, auto_populate, auto_populate_mode,
+                                    fallbacks_enabled, resolution_order, substitute_language)
 
 
 def get_translatable_fields_for_model(model):
@@ -23,7 +35,66 @@ def get_translatable_fields_for_model(model):
         return None
 
 
-def rewrite_lookup_key(model, lookup_key):
+def get_field_language(model, field_name, lang):
+    """
+    Returns the language of the translation field of ``field_name`` to use
+    for ``lang`` (a substitute, if the field isn't translated into it).
+    """
+    from modeltranslation.translator import translator
+    opts = translator.get_options_for_model(model)
+    if field_name not in opts.fields:
+        # Related lookup names.
+        return lang
+    return substitute_language(lang, opts.get_field_languages(field_name),
+                               getattr(opts, 'fallback_languages', None))
+
+
+# Rewritten lookup keys, indexed by (model, lookup key, language).
+_REWRITE_CACHE = {}
+_REWRITE_CACHE_SIZE = 4096
+_REWRITE_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def rewrite_cache_info():
+    """
+    Returns a dict with hit / miss counters and the current size of the
+    lookup key rewrite cache.
+    """
+    return dict(_REWRITE_CACHE_STATS, size=len(_REWRITE_CACHE), maxsize=_REWRITE_CACHE_SIZE)
+
+
+def clear_rewrite_cache():
+    """
+    Forgets all rewritten lookup keys and relations to translatable models.
+
+    Needs to be called whenever the set of registered models changes.
+    """
+    _REWRITE_CACHE.clear()
+    _F2TM_CACHE.clear()
+    _ORDERING_CACHE.clear()
+    _REWRITE_CACHE_STATS['hits'] = _REWRITE_CACHE_STATS['misses'] = 0
+
+
+def rewrite_lookup_key(model, lookup_key, lang=None):
+    if lang is None:
+        lang = get_language()
+    cache_key = (model, lookup_key, lang)
+    try:
+        new_key = _REWRITE_CACHE[cache_key]
+    except KeyError:
+        _REWRITE_CACHE_STATS['misses'] += 1
+        new_key = _rewrite_lookup_key(model, lookup_key, lang)
+        if len(_REWRITE_CACHE) >= _REWRITE_CACHE_SIZE:
+            # Simplest possible bound -- the working set is usually small
+            # and gets rebuilt quickly.
+            _REWRITE_CACHE.clear()
+        _REWRITE_CACHE[cache_key] = new_key
+    else:
+        _REWRITE_CACHE_STATS['hits'] += 1
+    return new_key
+
+
+def _rewrite_lookup_key(model, lookup_key, lang):
     pieces = lookup_key.split('__', 1)
     original_key = pieces[0]
 
@@ -33,7 +104,8 @@ def rewrite_lookup_key(model, lookup_key):
         # we want to rewrite it to the actual field name
         # For example, we want to rewrite "name__startswith" to "name_fr__startswith"
         if pieces[0] in translatable_fields:
-            pieces[0] = build_localized_fieldname(pieces[0], get_language())
+            pieces[0] = build_localized_fieldname(
+                pieces[0], get_field_language(model, pieces[0], lang))
 
     if len(pieces) > 1:
         # Check if we are doing a lookup to a related trans model
@@ -41,19 +113,61 @@ def rewrite_lookup_key(model, lookup_key):
         for field_to_trans, transmodel in fields_to_trans_models:
             # Check ``original key``, as pieces[0] may have been already rewritten.
             if original_key == field_to_trans:
-                pieces[1] = rewrite_lookup_key(transmodel, pieces[1])
+                pieces[1] = _rewrite_lookup_key(transmodel, pieces[1], lang)
                 break
     return '__'.join(pieces)
 
 
-def rewrite_order_lookup_key(model, lookup_key):
+def rewrite_order_lookup_key(model, lookup_key, lang=None):
     if lookup_key.startswith('-'):
-        return '-' + rewrite_lookup_key(model, lookup_key[1:])
+        return '-' + rewrite_lookup_key(model, lookup_key[1:], lang)
     else:
-        return rewrite_lookup_key(model, lookup_key)
+        return rewrite_lookup_key(model, lookup_key, lang)
 
 _F2TM_CACHE = {}
 
+# Rewritten ``Meta.ordering``, indexed by (model, language).
+_ORDERING_CACHE = {}
+
+
+def get_default_ordering(model, lang=None):
+    """
+    Returns the default ordering of the model with lookup keys rewritten for
+    the given (by default the current) language.
+    """
+    if lang is None:
+        lang = get_language()
+    cache_key = (model, lang)
+    try:
+        return _ORDERING_CACHE[cache_key]
+    except KeyError:
+        ordering = tuple(rewrite_order_lookup_key(model, key, lang)
+                         for key in model._meta.ordering)
+        _ORDERING_CACHE[cache_key] = ordering
+        return ordering
+
+
+class MultilingualQuery(sql.Query):
+    """
+    Applies the model's default ordering, rewritten for the language active
+    when the query is compiled (or the one set with ``language()``, as for
+    lookups), only then (and if the ordering wasn't cleared, as it is for
+    ``count``, ``exists`` or ``aggregate``, nor overridden in the meantime).
+    """
+    language = None
+
+    def clone(self, klass=None, memo=None, **kwargs):
+        kwargs.setdefault('language', self.language)
+        return super(MultilingualQuery, self).clone(klass, memo, **kwargs)
+
+    def get_compiler(self, using=None, connection=None):
+        if (self.default_ordering and not self.order_by and not self.extra_order_by and
+                self.model._meta.ordering):
+            query = self.clone()
+            query.order_by = list(get_default_ordering(self.model, self.language))
+            return query.get_compiler(using, connection)
+        return super(MultilingualQuery, self).get_compiler(using, connection)
+
 
 def get_fields_to_translatable_models(model):
     if model not in _F2TM_CACHE:
@@ -72,6 +186,374 @@ def get_fields_to_translatable_models(model):
     return _F2TM_CACHE[model]
 
 
+# Database backends with the JSON functions needed by the JSON storage.
+JSON_VENDORS = ('sqlite', 'mysql', 'postgresql')
+
+# Types to cast JSON values of fields to with MySQL (its CAST only knows a few).
+_MYSQL_CAST_TYPES = {
+    'BooleanField': 'SIGNED',
+    'NullBooleanField': 'SIGNED',
+    'IntegerField': 'SIGNED',
+    'BigIntegerField': 'SIGNED',
+    'SmallIntegerField': 'SIGNED',
+    'PositiveIntegerField': 'UNSIGNED',
+    'PositiveSmallIntegerField': 'UNSIGNED',
+    'FloatField': 'DECIMAL(65, 30)',
+    'DateField': 'DATE',
+    'DateTimeField': 'DATETIME(6)',
+    'TimeField': 'TIME(6)',
+}
+
+
+def get_json_cast_type(field, connection):
+    """
+    Returns the type to cast a value of the field extracted from JSON to (so
+    it's compared and sorted as in a column of its own), or ``None`` if the
+    extracted value can be used as it is.
+    """
+    if field.empty_strings_allowed:
+        # Text.
+        return None
+    internal_type = field.get_internal_type()
+    if connection.vendor == 'mysql':
+        if internal_type == 'DecimalField':
+            return 'DECIMAL(%d, %d)' % (field.max_digits, field.decimal_places)
+        return _MYSQL_CAST_TYPES.get(internal_type)
+    if connection.vendor == 'sqlite' and internal_type in ('DateField', 'DateTimeField',
+                                                           'TimeField'):
+        # Stored as text by SQLite too.
+        return None
+    # Without column checks (of positive integers).
+    return field.db_type(connection=connection).split(' CHECK')[0]
+
+
+def get_json_sql(column, lang, connection, field=None):
+    """
+    Returns an expression extracting the ``lang`` key of JSON stored in the
+    (quoted) ``column``, cast to the type of ``field`` (if given).
+
+    Only ``JSON_VENDORS`` are supported.
+    """
+    if connection.vendor == 'sqlite':
+        sql = "json_extract(%s, '$.\"%s\"')" % (column, lang)
+    elif connection.vendor == 'mysql':
+        # JSON null would be unquoted to the 'null' string.
+        sql = "JSON_UNQUOTE(NULLIF(JSON_EXTRACT(%s, '$.\"%s\"'), CAST('null' AS JSON)))" % (
+            column, lang)
+    else:
+        sql = "(%s::json ->> '%s')" % (column, lang)
+    cast_type = field is not None and get_json_cast_type(field, connection)
+    if cast_type:
+        sql = 'CAST(%s AS %s)' % (sql, cast_type)
+    return sql
+
+
+def get_json_set_sql(column, lang, value, connection):
+    """
+    Returns an expression giving JSON stored in the (quoted) ``column``
+    with the ``lang`` key set to the ``value`` expression (NULL is stored as
+    JSON null).
+    """
+    current = "COALESCE(NULLIF(%s, ''), '{}')" % column
+    if connection.vendor == 'sqlite':
+        return "json_set(%s, '$.\"%s\"', %s)" % (current, lang, value)
+    elif connection.vendor == 'mysql':
+        return "JSON_SET(%s, '$.\"%s\"', %s)" % (current, lang, value)
+    return "(%s::jsonb || jsonb_build_object('%s', %s))::text" % (current, lang, value)
+
+
+def get_fallback_sql(model, field_name, connection, lang=None, fallbacks=True,
+                     relations=False, alias=None, single=False):
+    """
+    Returns a (sql, params) pair with an expression giving the same value as
+    reading the translated field (with fallbacks) for the given (by default
+    the current) language,
+    or ``None`` if the field has no fallbacks (unless ``single`` is set, then
+    the language's column is returned) or is not supported (relations
+    are only with ``relations``, giving the related primary key).
+
+    Fields inherited from a concrete base are read with a subquery. For
+    fields stored as JSON or in a table an expression is always returned
+    (without fallbacks if ``fallbacks`` is false). Columns are qualified with
+    the model's table name or the given ``alias`` of the table.
+    """
+    from modeltranslation.translator import translator, NotRegistered
+    try:
+        opts = translator.get_options_for_model(model)
+    except NotRegistered:
+        return None
+    if field_name not in opts.fields:
+        return None
+    field = model._meta.get_field(field_name)
+    if field.rel is not None and not relations:
+        return None
+    if lang is None:
+        lang = get_language()
+    langs = resolution_order(lang, getattr(opts, 'fallback_languages', None),
+                             opts.get_field_languages(field_name))
+    if not fallbacks:
+        langs = langs[:1]
+    qn = connection.ops.quote_name
+    table = model_table = qn(alias or model._meta.db_table)
+    source = model
+    if (field.model._meta.db_table != model._meta.db_table and
+            field_name not in opts.table_fields):
+        # Columns of the base's table (under an alias of its own).
+        source, table = field.model, qn('mt_base')
+    if field_name in opts.json_fields:
+        json_column = '%s.%s' % (table, qn(source._meta.get_field(
+            build_translations_fieldname(field_name)).column))
+        expressions = [(get_json_sql(json_column, l, connection, field), []) for l in langs]
+    elif field_name in opts.table_fields:
+        # The language row is selected with a correlated subquery.
+        descriptor = getattr(model, build_localized_fieldname(field_name, langs[0]))
+        translation_opts = descriptor.table.model._meta
+        subquery = '(SELECT %s FROM %s WHERE %s = %s.%s AND %s = %%s)' % (
+            qn(translation_opts.get_field(field_name).column), qn(translation_opts.db_table),
+            qn(translation_opts.get_field('parent').column), table, qn(model._meta.pk.column),
+            qn(translation_opts.get_field('language').column))
+        expressions = [(subquery, [l]) for l in langs]
+    elif len(langs) < 2 and not single:
+        return None
+    else:
+        expressions = [('%s.%s' % (table, qn(source._meta.get_field(
+            build_localized_fieldname(field_name, l)).column)), []) for l in langs]
+    if len(expressions) == 1:
+        sql, params = expressions[0]
+    else:
+        columns, params = [], []
+        for column, column_params in expressions:
+            if field.empty_strings_allowed:
+                # Empty strings fall back just like NULLs.
+                column = "NULLIF(%s, '')" % column
+            columns.append(column)
+            params.extend(column_params)
+        descriptor = getattr(model, field_name)
+        value = getattr(descriptor, 'fallback_value', None)
+        if value is None:
+            value = field.get_default()
+        if value is not None:
+            columns.append('%s')
+            params.append(field.get_db_prep_value(value, connection))
+        sql = 'COALESCE(%s)' % ', '.join(columns)
+    if source is not model:
+        # Rows of tables of inherited models share primary keys.
+        sql = '(SELECT %s FROM %s %s WHERE %s.%s = %s.%s)' % (
+            sql, qn(source._meta.db_table), table, table, qn(source._meta.pk.column),
+            model_table, qn(model._meta.pk.column))
+    return sql, params
+
+
+def get_fallback_lookup_sql(model, lookup_key, value, connection, negate=False, lang=None,
+                            fallbacks=True, alias=None, single=False):
+    """
+    Returns a (sql, params) pair for a WHERE condition equivalent to filtering
+    by ``lookup_key`` with fallbacks applied, or ``None`` if that's not
+    possible (the lookup needs to be handled without fallbacks then).
+
+    Conditions for exclusion (to be negated) also check that the value is
+    not NULL, as Django does. Values may be compared with an ``SQLExpression``
+    (with ``exact`` and comparison lookups). The ``alias`` of the model's
+    table and ``single`` are passed to ``get_fallback_sql``.
+    """
+    pieces = lookup_key.split('__')
+    if len(pieces) > 2:
+        return None
+    field_name = pieces[0]
+    attribute = getattr(model, field_name, None)
+    if isinstance(attribute, TranslationAttribute):
+        # A translation stored as JSON or in a table (``title_de``).
+        field_name, lang, fallbacks = attribute.translated_field.name, attribute.language, False
+    lookup_type = pieces[1] if len(pieces) == 2 else 'exact'
+    if lookup_type not in connection.operators and lookup_type not in ('in', 'isnull'):
+        return None
+    if isinstance(value, SQLExpression):
+        if lookup_type not in ('exact', 'gt', 'gte', 'lt', 'lte'):
+            return None
+    elif hasattr(value, 'evaluate') or hasattr(value, 'as_sql'):
+        # Expressions and subqueries.
+        return None
+    fallback = get_fallback_sql(model, field_name, connection, lang, fallbacks, alias=alias,
+                                single=single)
+    if fallback is None:
+        return None
+    expression, expression_params = fallback
+    if lookup_type == 'exact' and value is None:
+        lookup_type, value = 'isnull', True
+    if lookup_type == 'isnull':
+        return '%s IS %sNULL' % (expression, '' if value else 'NOT '), expression_params
+    if isinstance(value, SQLExpression):
+        sql = '%s %s' % (expression, connection.operators[lookup_type] % value.sql)
+        params = expression_params + value.params
+        if negate:
+            sql = '%s AND %s IS NOT NULL' % (sql, expression)
+            params += expression_params
+        return sql, params
+    field = model._meta.get_field(field_name)
+    value = field.get_prep_lookup(lookup_type, value)
+    lookup_params = field.get_db_prep_lookup(lookup_type, value, connection=connection,
+                                             prepared=True)
+    lhs = connection.ops.lookup_cast(lookup_type) % expression
+    if lookup_type == 'in':
+        if not lookup_params:
+            return None
+        sql = '%s IN (%s)' % (lhs, ', '.join(['%s'] * len(lookup_params)))
+    else:
+        sql = '%s %s' % (lhs, connection.operators[lookup_type] % '%s')
+    params = expression_params + list(lookup_params)
+    if negate:
+        sql = '%s AND %s IS NOT NULL' % (sql, expression)
+        params += expression_params
+    return sql, params
+
+
+class SQLExpression(object):
+    """
+    SQL (with parameters) that can be used in query expressions (in place of
+    ``F()`` references to translations stored as JSON or in tables, which are
+    not columns) and as an ``update()`` value.
+    """
+    def __init__(self, sql, params):
+        self.sql = sql
+        self.params = list(params)
+
+    def prepare_database_save(self, field):
+        return self
+
+    def prepare(self, evaluator, query, allow_joins):
+        pass
+
+    def evaluate(self, evaluator, qn, connection):
+        return self.sql, self.params
+
+
+class SQLSubquery(object):
+    """
+    A subquery (SQL with parameters) that can be used as a lookup value.
+
+    The ``lookup`` (a key and a value) it was built for can be remembered, to
+    build it again for another language.
+    """
+    def __init__(self, sql, params, lookup=None):
+        self.sql = sql
+        self.params = list(params)
+        self.lookup = lookup
+
+    def _prepare(self):
+        return self
+
+    def _as_sql(self, connection):
+        return self.sql, self.params
+
+
+class FallbackWhere(ExtraWhere):
+    """
+    A WHERE condition made of lookups done in SQL (with fallbacks, or on
+    translations stored as JSON or in tables), given as (sql, params) pairs.
+
+    The lookups are remembered, to build the condition again for another
+    language.
+    """
+    def __init__(self, lookups, conditions, negate=False):
+        sql = ' AND '.join('(%s)' % c[0] for c in conditions)
+        if negate:
+            sql = 'NOT (%s)' % sql
+        super(FallbackWhere, self).__init__([sql], [p for c in conditions for p in c[1]])
+        self.lookups = lookups
+        self.negate = negate
+
+
+class JSONSetExpression(SQLExpression):
+    """
+    Sets translations stored by the ``translations_field`` (a
+    ``JSONTranslationsField``) for an ``update()``. Values are given as
+    (language, value or expression) pairs.
+    """
+    def __init__(self, translations_field, values):
+        self.translations_field = translations_field
+        self.values = []
+        for lang, value in values:
+            if not hasattr(value, 'evaluate'):
+                # Converted and encoded as when set through the descriptor.
+                if value is not None:
+                    value = translations_field.translated_field.to_python(value)
+                value = json.loads(translations_field.encode(value))
+            self.values.append((lang, value))
+
+    def prepare(self, evaluator, query, allow_joins):
+        for lang, value in self.values:
+            if hasattr(value, 'prepare'):
+                value.prepare(evaluator, query, allow_joins)
+
+    def evaluate(self, evaluator, qn, connection):
+        field = self.translations_field
+        quote_name = connection.ops.quote_name
+        sql = '%s.%s' % (quote_name(field.model._meta.db_table), quote_name(field.column))
+        params = []
+        for lang, value in self.values:
+            if hasattr(value, 'evaluate'):
+                value_sql, value_params = value.evaluate(evaluator, qn, connection)
+            else:
+                value_sql, value_params = '%s', [value]
+                if connection.vendor == 'postgresql':
+                    # Parameters of JSON functions need to be typed.
+                    value_sql = 'CAST(%%s AS %s)' % (get_json_cast_type(
+                        field.translated_field, connection) or 'text')
+            sql = get_json_set_sql(sql, lang, value_sql, connection)
+            params = params + list(value_params)
+        return sql, params
+
+
+# Prefix of aliases of extra selects added to order by translated fields.
+ORDER_ALIAS_PREFIX = '_mt_order_'
+
+
+# Classes created by ``combined_class``, indexed by their bases.
+_COMBINED_CLASSES = {}
+_COMBINED_CLASSES_LOCK = threading.Lock()
+
+
+def combined_class(name, bases):
+    """
+    Returns a class with the given name and bases, creating it only on the
+    first call for the bases (used to mix multilingual managers and query
+    sets into custom ones).
+
+    Classes are made attributes of this module (under a unique name, suffixed
+    with a number if it's taken). Their instances are pickled with the name
+    and bases instead of a reference to the class, so they can be unpickled
+    in a process that hasn't created it (or gave it another name).
+    """
+    try:
+        return _COMBINED_CLASSES[bases]
+    except KeyError:
+        with _COMBINED_CLASSES_LOCK:
+            if bases not in _COMBINED_CLASSES:
+                module = globals()
+                unique_name, number = name, 1
+                while unique_name in module:
+                    number += 1
+                    unique_name = '%s%d' % (name, number)
+                cls = type(str(unique_name), bases, {
+                    '__module__': __name__, '__reduce_ex__': _reduce_combined,
+                    '_mt_combined': (name, bases)})
+                module[unique_name] = _COMBINED_CLASSES[bases] = cls
+            return _COMBINED_CLASSES[bases]
+
+
+def _reduce_combined(self, protocol):
+    cls = _COMBINED_CLASSES[self._mt_combined[1]]
+    reduced = super(cls, self).__reduce_ex__(max(protocol, 2))
+    if reduced[0] is not copyreg.__newobj__ or reduced[1][0] is not cls:
+        return reduced
+    return (_new_combined,) + ((self._mt_combined,) + reduced[1][1:],) + reduced[2:]
+
+
+def _new_combined(name_bases, *args):
+    cls = combined_class(*name_bases)
+    return cls.__new__(cls, *args)
+
+
 class MultilingualQuerySet(models.query.QuerySet):
     def __init__(self, *args, **kwargs):
         super(MultilingualQuerySet, self).__init__(*args, **kwargs)
@@ -80,19 +562,30 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _post_init(self):
         self._rewrite = True
         self._populate = None
-        if self.model and (not self.query.order_by):
-            if self.model._meta.ordering:
-                # If we have default ordering specified on the model, set it now so that
-                # it can be rewritten. Otherwise sql.compiler will grab it directly from _meta
-                ordering = []
-                for key in self.model._meta.ordering:
-                    ordering.append(rewrite_order_lookup_key(self.model, key))
-                self.query.add_ordering(*ordering)
+        self._defer_inactive = None
+        self._sql_fallbacks = False
+        self._language = None
+        self._applied_ordering = None
+        if self.model and self.model._meta.ordering:
+            query = self.query
+            if not isinstance(query, MultilingualQuery):
+                # If we have default ordering specified on the model, it needs to be
+                # rewritten. Otherwise sql.compiler would grab it directly from _meta.
+                if query.__class__ is sql.Query:
+                    query.__class__ = MultilingualQuery
+                else:
+                    query.__class__ = combined_class(
+                        'Multilingual%s' % query.__class__.__name__,
+                        (MultilingualQuery, query.__class__))
 
     # This method was not present in django-linguo
     def _clone(self, *args, **kwargs):
         kwargs.setdefault('_rewrite', self._rewrite)
         kwargs.setdefault('_populate', self._populate)
+        kwargs.setdefault('_defer_inactive', self._defer_inactive)
+        kwargs.setdefault('_sql_fallbacks', self._sql_fallbacks)
+        kwargs.setdefault('_language', self._language)
+        kwargs.setdefault('_applied_ordering', self._applied_ordering)
         return super(MultilingualQuerySet, self)._clone(*args, **kwargs)
 
     # This method was not present in django-linguo
@@ -106,10 +599,114 @@ class MultilingualQuerySet(models.query.QuerySet):
         """
         return self._clone(_populate=mode)
 
+    # This method was not present in django-linguo
+    def language(self, language_code=None):
+        """
+        Pins the language used to rewrite lookups and ordering of this query
+        set and to resolve translated fields of the instances it yields
+        (``None`` restores the active language).
+
+        Filters and ordering applied before (also by a custom manager) are
+        rewritten for the pinned language too.
+        """
+        if language_code is not None and language_code not in settings.AVAILABLE_LANGUAGES:
+            raise ValueError('Language %s is not available.' % language_code)
+        clone = self._clone(_language=language_code)
+        if isinstance(clone.query, MultilingualQuery):
+            clone.query.language = language_code
+        clone._rewrite_where(clone.query.where)
+        clone._rewrite_where(clone.query.having)
+        ordering = clone._get_applied_ordering()
+        if ordering is not None:
+            clone = clone.order_by(*ordering)
+        return clone
+
+    def _get_language(self):
+        if self._language is None:
+            return get_language()
+        return self._language
+
+    # This method was not present in django-linguo
+    def defer_inactive_languages(self, mode=True):
+        """
+        Defers loading of translation fields other than those of the current
+        language and its fallbacks. Overrides the model's
+        ``defer_inactive_languages`` translation option.
+        """
+        return self._clone(_defer_inactive=mode)
+
+    # This method was not present in django-linguo
+    def sql_fallbacks(self, mode=True):
+        """
+        Applies fallbacks in the database for keyword lookups and ordering
+        on translated fields (by comparing or sorting on a ``COALESCE`` of
+        the field's translations in the resolution order).
+
+        Ordering is rewritten immediately, so the model's default ordering
+        gets fallbacks too, unless some ordering has already been set.
+        """
+        clone = self._clone(_sql_fallbacks=mode)
+        query = clone.query
+        if (mode and clone._rewrite and not query.order_by and not query.extra_order_by and
+                query.default_ordering and self.model._meta.ordering):
+            clone = clone.order_by(*self.model._meta.ordering)
+        return clone
+
+    def _get_inactive_fields(self):
+        """
+        Returns names of translation fields that are not needed to read the
+        translated fields in the current language (if they should be deferred).
+        """
+        from modeltranslation.translator import translator, NotRegistered
+        try:
+            opts = translator.get_options_for_model(self.model)
+        except NotRegistered:
+            return []
+        defer = self._defer_inactive
+        if defer is None:
+            defer = getattr(opts, 'defer_inactive_languages', False)
+        if not defer:
+            return []
+        lang = self._get_language()
+        fallback_languages = getattr(opts, 'fallback_languages', None)
+        inactive = []
+        for field_name in opts.fields.keys():
+            if field_name in opts.json_fields or field_name in opts.table_fields:
+                # Translations are not in columns of their own.
+                continue
+            languages = opts.get_field_languages(field_name)
+            active = resolution_order(lang, fallback_languages, languages)
+            inactive.extend(build_localized_fieldname(field_name, l)
+                            for l in languages if l not in active)
+        return inactive
+
+    # This method was not present in django-linguo
+    def iterator(self):
+        inactive = self._get_inactive_fields()
+        if not inactive:
+            objs = super(MultilingualQuerySet, self).iterator()
+        else:
+            # Deferred loading is applied to a copy, so that language (and
+            # fallbacks) are checked when the query set is evaluated.
+            clone = self._clone()
+            clone.query.add_deferred_loading(inactive)
+            objs = super(MultilingualQuerySet, clone).iterator()
+        if self._language is None:
+            return objs
+        return self._pin_language(objs)
+
+    def _pin_language(self, objs):
+        for obj in objs:
+            obj._mt_language = self._language
+            yield obj
+
     def _rewrite_applied_operations(self):
         """
         Rewrite fields in already applied filters/ordering.
         Useful when converting any QuerySet into MultilingualQuerySet.
+
+        Untranslated names are remembered, so the operations can be rewritten
+        again for another language.
         """
         self._rewrite_where(self.query.where)
         self._rewrite_where(self.query.having)
@@ -118,37 +715,150 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _rewrite_where(self, q):
         """
         Rewrite field names inside WHERE tree.
+
+        Conditions added by ``_filter_with_fallbacks`` and subqueries of
+        ``_lookup_subquery`` are built again for the current language.
         """
-        if isinstance(q, tuple) and isinstance(q[0], Constraint):
-            c = q[0]
-            new_name = rewrite_lookup_key(self.model, c.field.name)
-            if c.field.name != new_name:
-                c.field = self.model._meta.get_field(new_name)
-                c.col = c.field.column
-        if isinstance(q, Node):
-            for child in q.children:
+        columns, checks = {}, []
+        for i, child in enumerate(q.children):
+            if isinstance(child, Node):
                 self._rewrite_where(child)
+            elif isinstance(child, FallbackWhere):
+                q.children[i] = FallbackWhere(child.lookups, [
+                    self._fallback_condition(key, val, child.negate)
+                    for key, val in child.lookups], child.negate)
+            elif isinstance(child, tuple) and isinstance(child[0], Constraint):
+                c = child[0]
+                if c.field is None:
+                    checks.append(c)
+                    continue
+                column = (c.alias, c.col)
+                self._rewrite_constraint(c)
+                columns[column] = c.col
+                value = child[3]
+                if isinstance(value, SQLSubquery) and value.lookup is not None:
+                    q.children[i] = child[:3] + (self._lookup_subquery(*value.lookup),)
+        for c in checks:
+            # NULL checks of exclusions follow columns of their lookups.
+            c.col = columns.get((c.alias, c.col), c.col)
+
+    def _rewrite_constraint(self, c):
+        """
+        Points the constraint to the translation field of the current
+        language, unless it's marked as one that shouldn't be rewritten
+        (``mt_field_name`` set to ``None``, see ``_mark_where``).
+        """
+        name = getattr(c, 'mt_field_name', c.field.name)
+        if name is None:
+            return
+        model = c.field.model
+        new_name = rewrite_lookup_key(model, name, self._get_language())
+        c.mt_field_name = name
+        if c.field.name != new_name:
+            c.field = model._meta.get_field(new_name)
+            c.col = c.field.column
+
+    def _mark_where(self, q, derived):
+        """
+        Remembers untranslated names of new constraints on translation fields
+        that lookups were rewritten to (``derived``), and marks other new
+        constraints as not to be rewritten.
+        """
+        for child in q.children:
+            if isinstance(child, Node):
+                self._mark_where(child, derived)
+            elif isinstance(child, tuple) and isinstance(child[0], Constraint):
+                c = child[0]
+                if c.field is None or hasattr(c, 'mt_field_name'):
+                    continue
+                translated_field = getattr(c.field, 'translated_field', None)
+                if translated_field is not None and c.field.name in derived:
+                    c.mt_field_name = translated_field.name
+                else:
+                    c.mt_field_name = None
 
     def _rewrite_order(self):
-        self.query.order_by = [rewrite_order_lookup_key(self.model, field_name)
-                               for field_name in self.query.order_by]
+        lang = self._get_language()
+        order_by = self._get_applied_ordering()
+        if order_by is None:
+            order_by = self.query.order_by
+        self.query.order_by = [rewrite_order_lookup_key(self.model, field_name, lang)
+                               for field_name in order_by]
+        self._set_applied_ordering(order_by)
+
+    def _set_applied_ordering(self, field_names):
+        """
+        Remembers untranslated ordering, together with the ordering of the
+        query it was rewritten to.
+        """
+        self._applied_ordering = (tuple(field_names), list(self.query.order_by),
+                                  list(self.query.extra_order_by))
+
+    def _get_applied_ordering(self):
+        """
+        Returns the untranslated ordering if the query's ordering hasn't
+        changed since it was rewritten, ``None`` otherwise.
+        """
+        if self._applied_ordering is None:
+            return None
+        field_names, order_by, extra_order_by = self._applied_ordering
+        query = self.query
+        if (order_by, extra_order_by) != (list(query.order_by), list(query.extra_order_by)):
+            return None
+        return field_names
 
     # This method was not present in django-linguo
     def _rewrite_q(self, q):
-        """Rewrite field names inside Q call."""
+        """
+        Rewrite field names inside Q call.
+
+        Lookups on translations stored as JSON or in tables become lookups of
+        primary keys in a subquery (see ``_lookup_subquery``).
+        """
         if isinstance(q, tuple) and len(q) == 2:
-            return rewrite_lookup_key(self.model, q[0]), q[1]
+            if self._uses_expressions([q[0]]):
+                return 'pk__in', self._lookup_subquery(q[0], q[1])
+            return rewrite_lookup_key(self.model, q[0], self._get_language()), q[1]
         if isinstance(q, Node):
             q.children = list(map(self._rewrite_q, q.children))
         return q
 
+    def _lookup_subquery(self, key, val):
+        """
+        Returns a subquery selecting primary keys of objects matching a
+        lookup on a field with translations stored as JSON or in a table
+        (with the condition ``_filter_with_fallbacks`` would use).
+        """
+        connection = connections[self.db]
+        alias = 'mt_lookup'
+        lookup = None
+        if not hasattr(val, 'evaluate'):
+            lookup = get_fallback_lookup_sql(self.model, key, val, connection,
+                                             lang=self._get_language(),
+                                             fallbacks=self._sql_fallbacks, alias=alias)
+        if lookup is None:
+            raise FieldError(
+                "Lookup '%s' is not supported for translations of %s stored as JSON or in a "
+                "table." % (key, self.model._meta.object_name))
+        qn = connection.ops.quote_name
+        return SQLSubquery('SELECT %s.%s FROM %s %s WHERE %s' % (
+            qn(alias), qn(self.model._meta.pk.column), qn(self.model._meta.db_table), qn(alias),
+            lookup[0]), lookup[1], (key, val))
+
     # This method was not present in django-linguo
     def _rewrite_f(self, q):
         """
         Rewrite field names inside F call.
+
+        References to translations stored as JSON or in tables are replaced
+        with expressions selecting them.
         """
         if isinstance(q, models.F):
-            q.name = rewrite_lookup_key(self.model, q.name)
+            lang = self._get_language()
+            expression = self._get_expression_sql(q.name, lang)
+            if expression is not None:
+                return SQLExpression(*expression)
+            q.name = rewrite_lookup_key(self.model, q.name, lang)
             return q
         if isinstance(q, Node):
             q.children = list(map(self._rewrite_f, q.children))
@@ -157,12 +867,147 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _filter_or_exclude(self, negate, *args, **kwargs):
         if not self._rewrite:
             return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
-        args = map(self._rewrite_q, args)
-        for key, val in kwargs.items():
-            new_key = rewrite_lookup_key(self.model, key)
+        if (kwargs and not (negate and args) and
+                (self._sql_fallbacks or self._uses_expressions(kwargs))):
+            clone = self._filter_with_fallbacks(negate, kwargs)
+            if clone is not None:
+                return clone._filter_or_exclude(negate, *args, **kwargs)
+        lang = self._get_language()
+        derived = self._derived_names(list(_lookup_keys(args)) + list(kwargs.keys()), lang)
+        args = list(map(self._rewrite_q, args))
+        for key, val in list(kwargs.items()):
             del kwargs[key]
+            if self._uses_expressions([key]):
+                # Lookups that couldn't be moved to an extra condition.
+                args.append(models.Q(pk__in=self._lookup_subquery(key, val)))
+                continue
+            new_key = rewrite_lookup_key(self.model, key, lang)
             kwargs[new_key] = self._rewrite_f(val)
-        return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
+        clone = super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
+        clone._mark_where(clone.query.where, derived)
+        return clone
+
+    def _derived_names(self, keys, lang):
+        """
+        Returns names of translation fields that lookup keys are rewritten
+        to, leaving out names also used explicitly.
+        """
+        derived, explicit = set(), set()
+        for key in keys:
+            pieces = key.split('__')
+            explicit.update(pieces)
+            derived.update(new for old, new in zip(
+                pieces, rewrite_lookup_key(self.model, key, lang).split('__')) if new != old)
+        return derived - explicit
+
+    def _uses_expressions(self, keys):
+        """
+        Tells if any of the lookup keys refers to a field with translations
+        stored as JSON or in a table or to one of such translations (looked up
+        with SQL expressions).
+        """
+        from modeltranslation.translator import translator, NotRegistered
+        try:
+            opts = translator.get_options_for_model(self.model)
+        except NotRegistered:
+            return False
+        fields = opts.json_fields | opts.table_fields
+        if not fields:
+            return False
+        for key in keys:
+            name = key.lstrip('-').split('__', 1)[0]
+            if name in fields or isinstance(getattr(self.model, name, None),
+                                            TranslationAttribute):
+                return True
+        return False
+
+    def _get_expression_sql(self, name, lang):
+        """
+        Returns a (sql, params) pair selecting a translated field (in the
+        given language) or a translation (``title_de``) stored as JSON or in
+        a table, or ``None`` for other fields.
+        """
+        connection = connections[self.db]
+        attribute = getattr(self.model, name, None) if '__' not in name else None
+        if isinstance(attribute, TranslationAttribute):
+            return get_fallback_sql(self.model, attribute.translated_field.name, connection,
+                                    attribute.language, fallbacks=False)
+        if self._uses_expressions([name]):
+            return get_fallback_sql(self.model, name, connection, lang, self._sql_fallbacks)
+        return None
+
+    def _filter_with_fallbacks(self, negate, kwargs):
+        """
+        Moves lookups that can be done with fallbacks (or on fields stored as
+        JSON or in tables) from ``kwargs`` to a ``FallbackWhere`` condition.
+        Returns a filtered clone or ``None`` if no lookup was moved.
+
+        Exclusions are only done this way if all lookups can be moved.
+        """
+        lookups, conditions = [], []
+        for key, val in list(kwargs.items()):
+            condition = self._fallback_condition(key, val, negate)
+            if condition is None:
+                if negate:
+                    return None
+                continue
+            del kwargs[key]
+            lookups.append((key, val))
+            conditions.append(condition)
+        if not conditions:
+            return None
+        assert self.query.can_filter(), \
+            "Cannot filter a query once a slice has been taken."
+        clone = self._clone()
+        clone.query.where.add(FallbackWhere(lookups, conditions, negate), AND)
+        return clone
+
+    def _fallback_condition(self, key, val, negate):
+        """
+        Returns a (sql, params) pair for a lookup done with fallbacks in the
+        current language (see ``get_fallback_lookup_sql``), or ``None``.
+        """
+        connection = connections[self.db]
+        if hasattr(val, 'evaluate') and self._uses_expressions([key]):
+            val = self._evaluate(val, connection)
+        return get_fallback_lookup_sql(self.model, key, val, connection, negate,
+                                       self._get_language(), self._sql_fallbacks, single=True)
+
+    def _evaluate(self, expression, connection):
+        """
+        Returns an ``SQLExpression`` with SQL of a query expression (``F()``
+        references to translated fields are rewritten first).
+        """
+        query = self.query.clone()
+        evaluator = SQLEvaluator(self._rewrite_f(copy.deepcopy(expression)), query,
+                                 allow_joins=False)
+        return SQLExpression(*evaluator.as_sql(
+            query.get_compiler(connection=connection).quote_name_unless_alias, connection))
+
+    def _order_with_fallbacks(self, field_names):
+        """
+        Orders by fallback expressions of translated fields (or expressions
+        selecting translations stored as JSON or in tables) as extra columns,
+        other keys are rewritten as usual.
+        """
+        connection = connections[self.db]
+        lang = self._get_language()
+        select, select_params, ordering = SortedDict(), [], []
+        for key in field_names:
+            desc = key.startswith('-')
+            name = key[1:] if desc else key
+            fallback = get_fallback_sql(self.model, name, connection, lang, self._sql_fallbacks)
+            if fallback is None:
+                ordering.append(rewrite_order_lookup_key(self.model, key, lang))
+                continue
+            alias = ORDER_ALIAS_PREFIX + name
+            select[alias] = fallback[0]
+            select_params.extend(fallback[1])
+            ordering.append('-%s' % alias if desc else alias)
+        clone = super(MultilingualQuerySet, self).order_by(*([] if select else ordering))
+        if not select:
+            return clone
+        return clone.extra(select=select, select_params=select_params, order_by=ordering)
 
     def order_by(self, *field_names):
         """
@@ -171,19 +1016,61 @@ class MultilingualQuerySet(models.query.QuerySet):
         """
         if not self._rewrite:
             return super(MultilingualQuerySet, self).order_by(*field_names)
-        new_args = []
-        for key in field_names:
-            new_args.append(rewrite_order_lookup_key(self.model, key))
-        return super(MultilingualQuerySet, self).order_by(*new_args)
+        if self._sql_fallbacks or self._uses_expressions(field_names):
+            clone = self._order_with_fallbacks(field_names)
+        else:
+            lang = self._get_language()
+            new_args = []
+            for key in field_names:
+                new_args.append(rewrite_order_lookup_key(self.model, key, lang))
+            clone = super(MultilingualQuerySet, self).order_by(*new_args)
+        # Kept to be rewritten again if the language gets pinned.
+        clone._set_applied_ordering(field_names)
+        return clone
 
     def update(self, **kwargs):
+        """
+        Updates translation fields of the current language (or the given
+        translation fields).
+
+        Translations stored as JSON are set in their JSON columns (with a
+        single ``UPDATE``), translations stored in a table are set in rows of
+        the objects matched before the update (expressions can't be used).
+        """
         if not self._rewrite:
             return super(MultilingualQuerySet, self).update(**kwargs)
-        for key, val in kwargs.items():
-            new_key = rewrite_lookup_key(self.model, key)
+        lang = self._get_language()
+        json_values, table_values = SortedDict(), SortedDict()
+        for key, val in list(kwargs.items()):
+            new_key = rewrite_lookup_key(self.model, key, lang)
             del kwargs[key]
-            kwargs[new_key] = self._rewrite_f(val)
-        return super(MultilingualQuerySet, self).update(**kwargs)
+            val = self._rewrite_f(val)
+            attribute = getattr(self.model, new_key, None)
+            if isinstance(attribute, JSONTranslationDescriptor):
+                json_values.setdefault(attribute.translations_field, []).append(
+                    (attribute.language, val))
+            elif isinstance(attribute, TranslationAttribute):
+                if hasattr(val, 'evaluate') or hasattr(val, 'prepare_database_save'):
+                    raise FieldError(
+                        "Translations of %s stored in a table can't be updated with "
+                        "expressions." % self.model._meta.object_name)
+                table_values.setdefault((attribute.table, attribute.language), {})[
+                    attribute.translated_field.name] = val
+            else:
+                kwargs[new_key] = val
+        for translations_field, values in json_values.items():
+            kwargs[translations_field.name] = JSONSetExpression(translations_field, values)
+        if not table_values:
+            return super(MultilingualQuerySet, self).update(**kwargs)
+        self._for_write = True
+        with transaction.commit_on_success(using=self.db):
+            pks = list(self.order_by().values_list('pk', flat=True))
+            rows = len(pks)
+            if kwargs:
+                rows = super(MultilingualQuerySet, self).update(**kwargs)
+            for (table, language), values in table_values.items():
+                table.update_translations(pks, language, values, using=self.db)
+        return rows
     update.alters_data = True
 
     # This method was not present in django-linguo
@@ -191,24 +1078,247 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _populate_mode(self):
         # Populate can be set using a global setting or a manager method.
         if self._populate is None:
-            return settings.AUTO_POPULATE
+            return auto_populate_mode()
         return self._populate
 
+    def _rewrite_create_kwargs(self, kwargs, lookup=False):
+        """
+        Rewrites translated field names to fields of the pinned language
+        (the constructor would otherwise use the active language), after
+        populating other translation fields.
+
+        For ``lookup`` (``get_or_create``) keyword arguments populated
+        values go to ``defaults``, so they don't restrict the lookup.
+        """
+        if self._language is None:
+            return kwargs
+        from modeltranslation.translator import populate_translation_fields
+        kwargs = dict(kwargs)
+        if not lookup:
+            populate_translation_fields(self.model, kwargs)
+            return self._rewrite_keys(kwargs)
+        defaults = kwargs.pop('defaults', {})
+        params = dict((key, val) for key, val in kwargs.items() if '__' not in key)
+        params.update(defaults)
+        populated = dict(params)
+        populate_translation_fields(self.model, populated)
+        kwargs['defaults'] = self._rewrite_keys(dict(
+            defaults, **dict((key, val) for key, val in populated.items() if key not in params)))
+        return self._rewrite_keys(kwargs)
+
+    def _rewrite_keys(self, kwargs):
+        # Like in the constructor, values given for translation fields win.
+        rewritten = {}
+        for key, val in kwargs.items():
+            new_key = key if key == 'defaults' else rewrite_lookup_key(
+                self.model, key, self._language)
+            if new_key == key:
+                rewritten[key] = val
+            else:
+                rewritten.setdefault(new_key, val)
+        return rewritten
+
     # This method was not present in django-linguo
     def create(self, **kwargs):
         """
         Allows to override population mode with a ``populate`` method.
+
+        Objects created through a query set pinned to a language get its
+        values for their translated fields and resolve them in that language.
         """
         with auto_populate(self._populate_mode):
-            return super(MultilingualQuerySet, self).create(**kwargs)
+            obj = super(MultilingualQuerySet, self).create(**self._rewrite_create_kwargs(kwargs))
+        if self._language is not None:
+            obj._mt_language = self._language
+        return obj
 
     # This method was not present in django-linguo
     def get_or_create(self, **kwargs):
         """
         Allows to override population mode with a ``populate`` method.
+
+        The lookup and the created object use the pinned language (if any).
         """
         with auto_populate(self._populate_mode):
-            return super(MultilingualQuerySet, self).get_or_create(**kwargs)
+            obj, created = super(MultilingualQuerySet, self).get_or_create(
+                **self._rewrite_create_kwargs(kwargs, lookup=True))
+        if self._language is not None:
+            obj._mt_language = self._language
+        return obj, created
+
+    # This method was not present in django-linguo
+    def bulk_create(self, objs, batch_size=None):
+        """
+        Populates translation fields of all objects (in one pass) according to
+        the population mode of this query set, before inserting them.
+
+        Translations stored in tables are inserted afterwards (also in bulk),
+        which requires primary keys of the objects to be set.
+        """
+        from modeltranslation.translator import (
+            populate_translation_instances, translator, NotRegistered)
+        populate_translation_instances(self.model, objs, self._populate_mode)
+        try:
+            tables = translator.get_options_for_model(self.model).tables
+        except NotRegistered:
+            tables = ()
+        rows = [(table, table.get_bulk_rows(objs)) for table in tables]
+        objs = super(MultilingualQuerySet, self).bulk_create(objs, batch_size)
+        for table, table_rows in rows:
+            table.bulk_save_translations(objs, table_rows, using=self.db)
+        return objs
+
+    # This method was not present in django-linguo
+    def values(self, *fields):
+        """
+        Translated field names select translation fields of the current
+        language and its fallbacks; rows are keyed by the given names, with
+        fallbacks applied.
+        """
+        plan = self._values_plan(fields)
+        if plan is None:
+            return super(MultilingualQuerySet, self).values(*fields)
+        return self._select_expressions(plan)._clone(
+            klass=MultilingualValuesQuerySet, setup=True, _fields=_values_columns(plan),
+            _mt_values=plan)._select_order_aliases()
+
+    # This method was not present in django-linguo
+    def values_list(self, *fields, **kwargs):
+        """
+        Like ``values``, but yields tuples (or single values for ``flat``).
+        """
+        plan = self._values_plan(fields)
+        if plan is None:
+            return super(MultilingualQuerySet, self).values_list(*fields, **kwargs)
+        flat = kwargs.pop('flat', False)
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments to values_list: %s'
+                            % (list(kwargs),))
+        if flat and len(fields) > 1:
+            raise TypeError("'flat' is not valid when values_list is called with more "
+                            "than one field.")
+        return self._select_expressions(plan)._clone(
+            klass=MultilingualValuesListQuerySet, setup=True, flat=False,
+            _fields=_values_columns(plan), _mt_values=plan, _mt_flat=flat)._select_order_aliases()
+
+    def _values_plan(self, fields):
+        """
+        Returns a list of (name, column, translated, default) tuples for
+        ``values`` fields or ``None`` if nothing needs to be rewritten.
+        """
+        if not self._rewrite or not fields:
+            return None
+        from modeltranslation.translator import translator, NotRegistered
+        try:
+            opts = translator.get_options_for_model(self.model)
+        except NotRegistered:
+            opts = None
+        lang = self._get_language()
+        plan = []
+        rewritten = False
+        for name in fields:
+            if opts is not None and name in opts.fields:
+                column, default = self._translated_values(opts, name, lang)
+                plan.append((name, column, True, default))
+                rewritten = True
+            else:
+                column = rewrite_lookup_key(self.model, name, lang)
+                plan.append((name, column, False, None))
+                rewritten = rewritten or column != name
+        return plan if rewritten or self._order_aliases() else None
+
+    def _order_aliases(self):
+        """
+        Returns aliases of extra selects of translated fields (see
+        ``_order_with_fallbacks``) the query set is ordered by.
+        """
+        ordering = set(key.lstrip('-') for key in self.query.extra_order_by)
+        return [alias for alias in self.query.extra
+                if alias in ordering and alias.startswith(ORDER_ALIAS_PREFIX)]
+
+    def _select_order_aliases(self):
+        """
+        Keeps the extra selects the query set is ordered by selected (the
+        ``values`` setup masks extra selects that are not among its fields),
+        they're left out of rows.
+        """
+        aliases = self._order_aliases()
+        if aliases:
+            self.query.set_extra_mask(list(self.extra_names) + aliases)
+        return self
+
+    def _translated_values(self, opts, name, lang):
+        """
+        Returns the column to select and the default value for reading a
+        translated field in the given language.
+
+        Unless only a single translation field needs to be read, a single
+        expression resolving fallbacks in SQL (see ``get_fallback_sql``) is
+        selected, given as an (alias, sql, params, translated field name) tuple,
+        so rows can be grouped (with ``annotate``) or made distinct by the
+        value, and subqueries select the same values.
+        """
+        enable_fallbacks = fallbacks_enabled()
+        default = None
+        if enable_fallbacks:
+            default = getattr(getattr(self.model, name), 'fallback_value', None)
+        field = self.model._meta.get_field(name)
+        if default is None:
+            default = field.get_default()
+        fallback = get_fallback_sql(self.model, name, connections[self.db], lang,
+                                    enable_fallbacks, relations=True)
+        if fallback is None:
+            # Just the field of the language (or its substitute).
+            lang = resolution_order(lang, getattr(opts, 'fallback_languages', None),
+                                    opts.get_field_languages(name))[0]
+            return build_localized_fieldname(name, lang), default
+        alias = '_mt_%s' % build_localized_fieldname(name, lang)
+        return (alias, fallback[0], fallback[1], name), default
+
+    def _select_expressions(self, plan):
+        """
+        Returns a clone selecting expressions needed by the values plan (as
+        extra selects).
+        """
+        select, select_params = SortedDict(), []
+        for name, column, translated, default in plan:
+            if isinstance(column, tuple) and column[0] not in select:
+                select[column[0]] = column[1]
+                select_params.extend(column[2])
+        if not select:
+            return self
+        return self.extra(select=select, select_params=select_params)
+
+    # This method was not present in django-linguo
+    def translations(self, *languages):
+        """
+        Yields a dict for each object, with the primary key and a mapping of
+        languages (all available by default) to values (with fallbacks) for
+        each translated field, selecting just the needed columns.
+        """
+        from modeltranslation.translator import translator
+        opts = translator.get_options_for_model(self.model)
+        for lang in languages:
+            if lang not in settings.AVAILABLE_LANGUAGES:
+                raise ValueError('Language %s is not available.' % lang)
+        plan = [('pk', 'pk', False, None)]
+        for name in opts.fields.keys():
+            for lang in languages or settings.AVAILABLE_LANGUAGES:
+                column, default = self._translated_values(opts, name, lang)
+                plan.append(((name, lang), column, True, default))
+        return self._select_expressions(plan)._clone(
+            klass=MultilingualTranslationsQuerySet, setup=True, _fields=_values_columns(plan),
+            _mt_values=plan)
+
+    # This method was not present in django-linguo
+    def prefetch_translations(self):
+        """
+        Prefetches translations stored in tables (with a query for each
+        table), so instances don't load them one by one.
+        """
+        from modeltranslation.translator import translator
+        opts = translator.get_options_for_model(self.model)
+        return self.prefetch_related(*[table.related_name for table in opts.tables])
 
     def _append_translated(self, fields):
         "If translated field is encountered, add also all its translation fields."
@@ -216,7 +1326,12 @@ class MultilingualQuerySet(models.query.QuerySet):
         from modeltranslation.translator import translator
         opts = translator.get_options_for_model(self.model)
         for key, translated in opts.fields.items():
-            if key in fields:
+            if key not in fields or key in opts.table_fields:
+                # Translations stored in a table are loaded separately anyway.
+                continue
+            if key in opts.json_fields:
+                fields.add(build_translations_fieldname(key))
+            else:
                 fields = fields.union(f.name for f in translated)
         return fields
 
@@ -231,6 +1346,102 @@ class MultilingualQuerySet(models.query.QuerySet):
         return super(MultilingualQuerySet, self).only(*fields)
 
 
+def _lookup_keys(q):
+    """
+    Yields lookup keys of (possibly nested) ``Q`` objects.
+    """
+    for child in q:
+        if isinstance(child, Node):
+            for key in _lookup_keys(child.children):
+                yield key
+        elif isinstance(child, tuple) and len(child) == 2:
+            yield child[0]
+
+
+def _values_columns(plan):
+    columns = []
+    for name, column, translated, default in plan:
+        if isinstance(column, tuple):
+            # An expression.
+            column = column[0]
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+
+class MultilingualValuesQuerySet(ValuesQuerySet, MultilingualQuerySet):
+    """
+    Yields dicts keyed by the field names given to ``values``, with values of
+    translated fields resolved as by their descriptors.
+    """
+    def _clone(self, *args, **kwargs):
+        kwargs.setdefault('_mt_values', self._mt_values)
+        return super(MultilingualValuesQuerySet, self)._clone(*args, **kwargs)
+
+    def _resolved_rows(self):
+        hidden = _values_columns(self._mt_values) + self._order_aliases()
+        connection = connections[self.db]
+        for row in ValuesQuerySet.iterator(self):
+            # Extra selects and aggregates are kept as they are.
+            values = dict((k, v) for k, v in row.items() if k not in hidden)
+            for name, column, translated, default in self._mt_values:
+                if isinstance(column, tuple):
+                    alias, sql, params, field_name = column
+                    value = row[alias]
+                    if value is not None:
+                        # Fields are looked up by name, so the plan can be pickled.
+                        field = self.model._meta.get_field(field_name)
+                        # Values of expressions are not converted by the backend.
+                        value = field.to_python(connection.ops.convert_values(value, field))
+                else:
+                    value = row[column]
+                # Only None and '' fall back, as with the field descriptors.
+                if translated and (value is None or value == ''):
+                    value = default
+                values[name] = value
+            yield values
+
+    def iterator(self):
+        return self._resolved_rows()
+
+    def _as_sql(self, connection):
+        if not self._order_aliases():
+            return super(MultilingualValuesQuerySet, self)._as_sql(connection)
+        # Subqueries select just the values (and don't need to be ordered).
+        clone = self._clone()
+        clone.query.clear_ordering(force_empty=True)
+        clone.query.set_extra_mask(clone.extra_names)
+        return super(MultilingualValuesQuerySet, clone)._as_sql(connection)
+
+
+class MultilingualValuesListQuerySet(ValuesListQuerySet, MultilingualValuesQuerySet):
+    def _clone(self, *args, **kwargs):
+        kwargs.setdefault('_mt_flat', self._mt_flat)
+        return super(MultilingualValuesListQuerySet, self)._clone(*args, **kwargs)
+
+    def iterator(self):
+        names = [name for name, _, _, _ in self._mt_values]
+        names += [name for name in self.query.aggregate_select if name not in names]
+        for row in self._resolved_rows():
+            if self._mt_flat:
+                yield row[names[0]]
+            else:
+                yield tuple(row[name] for name in names)
+
+
+class MultilingualTranslationsQuerySet(MultilingualValuesQuerySet):
+    def iterator(self):
+        for row in self._resolved_rows():
+            values = {}
+            for key, value in row.items():
+                if isinstance(key, tuple):
+                    # (field name, language) keys.
+                    values.setdefault(key[0], {})[key[1]] = value
+                else:
+                    values[key] = value
+            yield values
+
+
 class MultilingualManager(models.Manager):
     use_for_related_fields = True
 
@@ -240,15 +1451,31 @@ class MultilingualManager(models.Manager):
     def populate(self, *args, **kwargs):
         return self.get_query_set().populate(*args, **kwargs)
 
+    def language(self, *args, **kwargs):
+        return self.get_query_set().language(*args, **kwargs)
+
+    def translations(self, *args, **kwargs):
+        return self.get_query_set().translations(*args, **kwargs)
+
+    def prefetch_translations(self, *args, **kwargs):
+        return self.get_query_set().prefetch_translations(*args, **kwargs)
+
+    def defer_inactive_languages(self, *args, **kwargs):
+        return self.get_query_set().defer_inactive_languages(*args, **kwargs)
+
+    def sql_fallbacks(self, *args, **kwargs):
+        return self.get_query_set().sql_fallbacks(*args, **kwargs)
+
     def get_query_set(self):
         qs = super(MultilingualManager, self).get_query_set()
         if qs.__class__ == models.query.QuerySet:
             qs.__class__ = MultilingualQuerySet
         else:
-            class NewClass(qs.__class__, MultilingualQuerySet):
-                pass
-            NewClass.__name__ = 'Multilingual%s' % qs.__class__.__name__
-            qs.__class__ = NewClass
+            qs.__class__ = combined_class('Multilingual%s' % qs.__class__.__name__,
+                                          (qs.__class__, MultilingualQuerySet))
         qs._post_init()
-        qs._rewrite_applied_operations()
+        query = qs.query
+        if query.where.children or query.having.children or query.order_by:
+            # Custom managers may filter or order the query set.
+            qs._rewrite_applied_operations()
         return qs
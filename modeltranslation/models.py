@@ -16,27 +16,29 @@ def autodiscover():
     from modeltranslation.translator import translator
     from modeltranslation.settings import TRANSLATION_FILES, DEBUG
 
-    for app in settings.INSTALLED_APPS:
-        mod = import_module(app)
-        # Attempt to import the app's translation module.
-        module = '%s.translation' % app
-        before_import_registry = copy.copy(translator._registry)
-        try:
-            import_module(module)
-        except:
-            # Reset the model registry to the state before the last import as
-            # this import will have to reoccur on the next request and this
-            # could raise NotRegistered and AlreadyRegistered exceptions
-            translator._registry = before_import_registry
+    # Caches of related models are invalidated once all models are registered.
+    with translator.batch():
+        for app in settings.INSTALLED_APPS:
+            mod = import_module(app)
+            # Attempt to import the app's translation module.
+            module = '%s.translation' % app
+            before_import_registry = copy.copy(translator._registry)
+            try:
+                import_module(module)
+            except:
+                # Reset the model registry to the state before the last import as
+                # this import will have to reoccur on the next request and this
+                # could raise NotRegistered and AlreadyRegistered exceptions
+                translator._registry = before_import_registry
 
-            # Decide whether to bubble up this error. If the app just
-            # doesn't have an translation module, we can ignore the error
-            # attempting to import it, otherwise we want it to bubble up.
-            if module_has_submodule(mod, 'translation'):
-                raise
+                # Decide whether to bubble up this error. If the app just
+                # doesn't have an translation module, we can ignore the error
+                # attempting to import it, otherwise we want it to bubble up.
+                if module_has_submodule(mod, 'translation'):
+                    raise
 
-    for module in TRANSLATION_FILES:
-        import_module(module)
+        for module in TRANSLATION_FILES:
+            import_module(module)
 
     # In debug mode, print a list of registered models and pid to stdout.
     # Note: Differing model order is fine, we don't rely on a particular
@@ -18,6 +18,9 @@ CUSTOM_FIELDS = getattr(settings, 'MODELTRANSLATION_CUSTOM_FIELDS', ())
 # Don't change this setting unless you really know what you are doing
 ENABLE_REGISTRATIONS = getattr(settings, 'MODELTRANSLATION_ENABLE_REGISTRATIONS', settings.USE_I18N)
 
+# Postpone patching of registered models until they are first used
+LAZY_REGISTRATION = getattr(settings, 'MODELTRANSLATION_LAZY_REGISTRATION', False)
+
 # Modeltranslation specific debug setting
 DEBUG = getattr(settings, 'MODELTRANSLATION_DEBUG', False)
 
@@ -2,18 +2,21 @@
 import datetime
 from decimal import Decimal
 import os
+import pickle
 import shutil
 import imp
+import json
+import threading
 
 from django import forms
 from django.conf import settings as django_settings
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError, ImproperlyConfigured
+from django.core.exceptions import ValidationError, ImproperlyConfigured, FieldError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.management import call_command
-from django.db.models import Q, F
+from django.db.models import Q, F, Count
 from django.db.models.loading import AppCache
 from django.test import TestCase
 from django.test.utils import override_settings
@@ -37,7 +40,7 @@ from modeltranslation.utils import (build_css_class, build_localized_fieldname,
 request = None
 
 # How many models are registered for tests.
-TEST_MODELS = 24
+TEST_MODELS = 28
 
 
 class reload_override_settings(override_settings):
@@ -228,6 +231,162 @@ class ModeltranslationTest(ModeltranslationTestBase):
         self.assertRaises(translator.DescendantRegistered,
                           translator.translator.unregister, models.Slugged)
 
+    def test_lazy_registration(self):
+        from django.db import connection
+        from django.db.models import Model, CharField
+        from modeltranslation.fields import TranslationFieldDescriptor
+
+        class LazyModel(Model):
+            title = CharField(max_length=255)
+
+            class Meta:
+                app_label = 'lazy'
+
+        class LazyModel2(Model):
+            title = CharField(max_length=255)
+
+            class Meta:
+                app_label = 'lazy'
+
+        class LazyTranslationOptions(translator.TranslationOptions):
+            fields = ('title',)
+
+        trans = translator.translator
+        with reload_override_settings(MODELTRANSLATION_LAZY_REGISTRATION=True):
+            trans.register([LazyModel, LazyModel2], LazyTranslationOptions)
+        try:
+            self.assertEqual(set([LazyModel, LazyModel2]), trans._pending)
+            self.assertTrue(LazyModel in trans.get_registered_models())
+            self.assertFalse('title' in LazyModel.__dict__)
+            self.assertFalse('title' in LazyModel2.__dict__)
+
+            # Patched on first use
+            obj = LazyModel(title='foo')
+            self.assertEqual('foo', obj.title_de)
+            self.assertEqual(None, obj.title_en)
+            self.assertEqual(set([LazyModel2]), trans._pending)
+            self.assertTrue(isinstance(LazyModel.__dict__['title'], TranslationFieldDescriptor))
+            self.assertIn('%s = foo' % connection.ops.quote_name('title_de'),
+                          str(LazyModel.objects.filter(title='foo').query))
+
+            # Or explicitly
+            trans.materialize()
+            self.assertEqual(set(), trans._pending)
+            self.assertEqual(['title', 'title_de', 'title_en'],
+                             [f.name for f in LazyModel2._meta.fields][1:])
+        finally:
+            trans.unregister([LazyModel, LazyModel2])
+
+    def test_lazy_registration_relatives(self):
+        from django.db.models import Model, CharField, ForeignKey
+        from modeltranslation.fields import TranslationFieldDescriptor
+        from modeltranslation.manager import MultilingualManager
+
+        class LazyTarget(Model):
+            name = CharField(max_length=255)
+
+            class Meta:
+                app_label = 'lazy'
+
+        class LazySource(Model):
+            title = CharField(max_length=255)
+            target = ForeignKey(LazyTarget, null=True)
+
+            class Meta:
+                app_label = 'lazy'
+
+        class LazyBase(Model):
+            title = CharField(max_length=255)
+
+            class Meta:
+                app_label = 'lazy'
+
+        class LazySourceTranslationOptions(translator.TranslationOptions):
+            fields = ('title', 'target')
+
+        class LazyBaseTranslationOptions(translator.TranslationOptions):
+            fields = ('title',)
+
+        trans = translator.translator
+        with reload_override_settings(MODELTRANSLATION_LAZY_REGISTRATION=True):
+            trans.register(LazySource, LazySourceTranslationOptions)
+        try:
+            # Using a model related to by translated fields applies the registration
+            # (adding reverse accessors and a multilingual manager to the model)
+            self.assertTrue(isinstance(LazyTarget.objects, MultilingualManager))
+            self.assertEqual(set(), trans._pending)
+            self.assertEqual(['lazysource_set', 'lazysource_set_de', 'lazysource_set_en'],
+                             sorted(r.get_accessor_name() for r in
+                                    LazyTarget._meta.get_all_related_objects()))
+            self.assertEqual(['lazysource'],
+                             trans.get_options_for_model(LazyTarget).related_fields)
+
+            # As does using a (not registered) subclass of a registered model
+            # (created while patching, so without accessing the base options)
+            with reload_override_settings(MODELTRANSLATION_LAZY_REGISTRATION=True):
+                trans.register(LazyBase, LazyBaseTranslationOptions)
+            trans._local.materializing = True
+            try:
+                class LazyChild(LazyBase):
+                    class Meta:
+                        app_label = 'lazy'
+            finally:
+                trans._local.materializing = False
+            self.assertEqual(set([LazyBase]), trans._pending)
+            LazyChild(title='foo')
+            self.assertEqual(set(), trans._pending)
+            self.assertTrue(isinstance(LazyBase.__dict__['title'], TranslationFieldDescriptor))
+        finally:
+            trans.unregister([LazySource, LazyBase])
+
+    def test_register_many(self):
+        from django.db import connection
+        from django.db.models import Model, CharField, ForeignKey
+
+        class BatchModel(Model):
+            title = CharField(max_length=255)
+
+            class Meta:
+                app_label = 'batch'
+
+        class BatchModel2(Model):
+            title = CharField(max_length=255)
+            parent = ForeignKey(BatchModel)
+
+            class Meta:
+                app_label = 'batch'
+
+        class BatchTranslationOptions(translator.TranslationOptions):
+            fields = ('title',)
+
+        class BatchTranslationOptions2(translator.TranslationOptions):
+            fields = ('title', 'parent')
+
+        calls = []
+        old_invalidate_caches = translator.invalidate_caches
+
+        def invalidate_caches(models, targets):
+            calls.append((list(models), targets))
+            old_invalidate_caches(models, targets)
+
+        trans = translator.translator
+        translator.invalidate_caches = invalidate_caches
+        try:
+            with trans.batch():
+                trans.register_many([(BatchModel, BatchTranslationOptions),
+                                     (BatchModel2, BatchTranslationOptions2)])
+                # Caches are invalidated at the end of the outer batch
+                self.assertEqual([], calls)
+            self.assertEqual([([BatchModel, BatchModel2], set([BatchModel]))], calls)
+            self.assertEqual(['batchmodel2_set', 'batchmodel2_set_de', 'batchmodel2_set_en'],
+                             sorted(r.get_accessor_name() for r in
+                                    BatchModel._meta.get_all_related_objects()))
+            self.assertIn('%s = 1' % connection.ops.quote_name('parent_de_id'),
+                          str(BatchModel2.objects.filter(parent=1).query))
+        finally:
+            translator.invalidate_caches = old_invalidate_caches
+            trans.unregister([BatchModel, BatchModel2])
+
     def test_fields(self):
         field_names = dir(models.TestModel())
         self.assertTrue('id' in field_names)
@@ -244,6 +403,19 @@ class ModeltranslationTest(ModeltranslationTestBase):
         self.assertTrue('email_de' in field_names)
         self.assertTrue('email_en' in field_names)
 
+    def test_get_language(self):
+        from modeltranslation.utils import get_language as mt_get_language
+        self.assertEqual('de', mt_get_language())
+        with override('en'):
+            self.assertEqual('en', mt_get_language())
+        with override('en-us'):
+            self.assertEqual('en', mt_get_language())
+            # Normalization is memoized
+            self.assertEqual('en', mt_get_language())
+        with override('fr'):
+            self.assertEqual(mt_settings.DEFAULT_LANGUAGE, mt_get_language())
+        self.assertEqual('de', mt_get_language())
+
     def test_verbose_name(self):
         verbose_name = models.TestModel._meta.get_field('title_de').verbose_name
         self.assertEqual(six.text_type(verbose_name), 'title [de]')
@@ -499,6 +671,20 @@ class FallbackTests(ModeltranslationTestBase):
             self.assertEqual(('en',), resolution_order('en', config))
             self.assertEqual(('de',), resolution_order('de', config))
 
+    def test_resolution_table(self):
+        from modeltranslation.utils import resolution_table
+        attnames = {'de': 'title_de', 'en': 'title_en'}
+        with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
+            self.assertEqual({'de': ('title_de', 'title_en'), 'en': ('title_en', 'title_de')},
+                             resolution_table(attnames))
+            # Overriding
+            config = {'default': ()}
+            self.assertEqual({'de': ('title_de', 'title_en'), 'en': ('title_en',)},
+                             resolution_table(attnames, config))
+            # Languages without attribute are skipped
+            self.assertEqual({'de': ('title_de',), 'en': ('title_de',)},
+                             resolution_table({'de': 'title_de'}))
+
     def test_fallback_languages(self):
         with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
             title_de = 'title de'
@@ -536,6 +722,24 @@ class FallbackTests(ModeltranslationTestBase):
                 with override('en'):
                     self.assertEqual(m.title, '')  # '' is the default
 
+    def test_fallbacks_toggle_thread(self):
+        with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=self.test_fallback):
+            m = models.TestModel(title='foo')
+            titles = []
+
+            def read_title():
+                with override('en'):
+                    titles.append(m.title)
+
+            with fallbacks(False):
+                with override('en'):
+                    self.assertEqual(m.title, '')
+                # Other threads are not affected
+                thread = threading.Thread(target=read_title)
+                thread.start()
+                thread.join()
+            self.assertEqual(['foo'], titles)
+
 
 class FileFieldsTest(ModeltranslationTestBase):
 
@@ -848,12 +1052,60 @@ class ForeignKeyFieldsTest(ModeltranslationTestBase):
         self.assertEqual(manager.filter(test_fks__title='f_title_de').count(), 0)
         self.assertEqual(manager.filter(test_fks__title_de='f_title_de').count(), 1)
 
+    def test_translated_relation_id_descriptor(self):
+        from modeltranslation.fields import TranslatedRelationIdDescriptor
+        self.assertTrue(isinstance(models.ForeignKeyModel.__dict__['test_id'],
+                                   TranslatedRelationIdDescriptor))
+        test_inst1 = models.TestModel.objects.create(title_en='title1_en')
+        test_inst2 = models.TestModel.objects.create(title_en='title2_en')
+        inst = models.ForeignKeyModel(test_de=test_inst1)
+
+        # The '_id' attribute resolves to the current language field
+        trans_real.activate("en")
+        self.assertEqual(None, inst.test_id)
+        with override('de'):
+            self.assertEqual(test_inst1.pk, inst.test_id)
+            inst.test_id = test_inst2.pk
+        self.assertEqual((test_inst2.pk, None), (inst.test_de_id, inst.test_en_id))
+        inst.test_id = test_inst1.pk
+        self.assertEqual((test_inst2.pk, test_inst1.pk), (inst.test_de_id, inst.test_en_id))
+
+        # Or the language instances are pinned to
+        inst.save()
+        inst = models.ForeignKeyModel.objects.language('de').get(pk=inst.pk)
+        self.assertEqual(test_inst2.pk, inst.test_id)
+
+        # Fallbacks apply when the current language field is empty
+        inst.test_en_id = None
+        del inst._mt_language
+        self.assertEqual(None, inst.test_id)
+        with default_fallback():
+            self.assertEqual(test_inst2.pk, inst.test_id)
+            with fallbacks(False):
+                self.assertEqual(None, inst.test_id)
+            # Setting never falls back
+            inst.test_id = test_inst1.pk
+            self.assertEqual((test_inst2.pk, test_inst1.pk), (inst.test_de_id, inst.test_en_id))
+
     def assertQuerysetsEqual(self, qs1, qs2):
         pk = lambda o: o.pk
         return self.assertEqual(sorted(qs1, key=pk), sorted(qs2, key=pk))
 
 
 class OtherFieldsTest(ModeltranslationTestBase):
+    def test_translation_field_classes(self):
+        from django.db.models import CharField, PositiveIntegerField
+        from modeltranslation.fields import get_translation_field_classes
+        title_de = models.TestModel._meta.get_field('title_de')
+        self.assertEqual('TranslationCharField', type(title_de).__name__)
+        # A single class is created for every field class
+        self.assertTrue(type(title_de) is type(models.TestModel._meta.get_field('title_en')))
+        self.assertTrue(type(title_de) is type(models.FallbackModel._meta.get_field('title_de')))
+        classes = get_translation_field_classes()
+        self.assertTrue(classes[CharField] is type(title_de))
+        self.assertTrue(classes[PositiveIntegerField] is
+                        type(models.OtherFieldsModel._meta.get_field('int_de')))
+
     def test_translated_models(self):
         inst = models.OtherFieldsModel.objects.create()
         field_names = dir(inst)
@@ -1621,6 +1873,125 @@ class UpdateCommandTest(ModeltranslationTestBase):
         self.assertEqual('initial', obj1.title_de)
         self.assertEqual('already', obj2.title_de)
 
+    def test_update_command_chunks(self):
+        pks = [models.TestModel.objects.create(title_de='', text_de=None).pk for i in range(5)]
+        models.TestModel.objects.filter(pk=pks[2]).rewrite(False).update(title_de='already')
+        models.TestModel.objects.all().rewrite(False).update(title='initial', text='text')
+
+        # Dry run just counts
+        out = six.StringIO()
+        call_command('update_translation_fields', 'tests.TestModel.title', dry_run=True,
+                     stdout=out)
+        self.assertIn('TestModel.title: 4 rows would be updated', out.getvalue())
+        self.assertEqual(0, models.TestModel.objects.filter(title_de='initial').count())
+
+        # Only the selected field is updated, in chunks of 2 primary keys
+        out = six.StringIO()
+        call_command('update_translation_fields', 'tests.TestModel.title', chunk_size=2,
+                     stdout=out)
+        self.assertIn('TestModel.title: 4 rows updated (primary keys 100% done)',
+                      out.getvalue())
+        self.assertEqual(4, models.TestModel.objects.filter(title_de='initial').count())
+        self.assertEqual('already', models.TestModel.objects.get(pk=pks[2]).title_de)
+        self.assertEqual(5, models.TestModel.objects.filter(text_de=None).count())
+
+        call_command('update_translation_fields', 'tests.TestModel', chunk_size=2, verbosity=0)
+        self.assertEqual(5, models.TestModel.objects.filter(text_de='text').count())
+
+        from django.core.management.base import CommandError
+        self.assertRaises(CommandError, call_command, 'update_translation_fields',
+                          'tests.TestModel.foo', verbosity=0)
+        self.assertRaises(CommandError, call_command, 'update_translation_fields',
+                          'tests.NonTranslated', verbosity=0)
+
+    def test_update_command_jobs(self):
+        models.TestModel.objects.create(title_de='')
+        models.TestModel.objects.all().rewrite(False).update(title='initial')
+
+        # The test database lives in memory, so models are processed serially
+        out, err = six.StringIO(), six.StringIO()
+        call_command('update_translation_fields', 'tests.TestModel.title', 'tests.FallbackModel',
+                     jobs=2, stdout=out, stderr=err)
+        self.assertIn('processed serially', err.getvalue())
+        self.assertIn('TestModel: 1 rows updated in', out.getvalue())
+        self.assertIn('FallbackModel: 0 rows updated in', out.getvalue())
+        self.assertIn('Total: 1 rows', out.getvalue())
+        self.assertEqual('initial', models.TestModel.objects.get().title_de)
+
+        from django.core.management.base import CommandError
+        self.assertRaises(CommandError, call_command, 'update_translation_fields',
+                          jobs=0, verbosity=0)
+
+    def test_update_command_threads(self):
+        from django.db import DatabaseError
+        from modeltranslation.management.commands.update_translation_fields import Command
+        old_uses_memory_database = Command.uses_memory_database
+        old_process_model = Command.process_model
+        Command.uses_memory_database = lambda self, model: False
+        try:
+            # Each thread connects to its own (empty) in-memory database
+            self.assertRaises(DatabaseError, call_command, 'update_translation_fields',
+                              'tests.TestModel.title', 'tests.FallbackModel', jobs=2,
+                              verbosity=0)
+
+            # Results are summarized in the order of models
+            threads = set()
+
+            def process_model(self, model, field_names):
+                threads.add(threading.current_thread())
+                return model, len(field_names), 0.0
+            Command.process_model = process_model
+            out = six.StringIO()
+            call_command('update_translation_fields', 'tests.TestModel', 'tests.FallbackModel',
+                         'tests.TestModel.title', jobs=2, stdout=out)
+            self.assertFalse(threading.current_thread() in threads)
+            summary = out.getvalue().split('Summary:\n')[1].splitlines()
+            self.assertEqual(['TestModel: 4', 'FallbackModel: 4', 'TestModel: 1', 'Total: 9'],
+                             [line.split(' rows')[0].strip() for line in summary])
+        finally:
+            Command.uses_memory_database = old_uses_memory_database
+            Command.process_model = old_process_model
+
+
+class SyncCommandTest(ModeltranslationTestBase):
+    def test_sync_command(self):
+        out = six.StringIO()
+        call_command('sync_translation_fields', interactive=False, stdout=out)
+        self.assertIn('No new translatable fields detected', out.getvalue())
+
+        out = six.StringIO()
+        call_command('sync_translation_fields', sql_only=True, stdout=out)
+        self.assertEqual('', out.getvalue())
+
+    def test_sync_sql(self):
+        from django.db import connection
+        from modeltranslation.management.commands.sync_translation_fields import Command
+        command = Command()
+        command.cursor = connection.cursor()
+        command.introspection = connection.introspection
+        command.table_fields = {}
+        db_table = models.TestModel._meta.db_table
+        self.assertEqual([], list(command.get_missing_languages('title', models.TestModel)))
+        # Table description is cached
+        command.table_fields[db_table].discard('title_en')
+        self.assertEqual(['en'],
+                         list(command.get_missing_languages('title', models.TestModel)))
+
+        # Columns of foreign keys have an "_id" suffix
+        self.assertEqual([], list(command.get_missing_languages('test',
+                                                                models.ForeignKeyModel)))
+
+        sql = command.get_sync_sql(models.TestModel, [('title', ['en']), ('text', ['de', 'en'])])
+        columns = ['title_en', 'text_de', 'text_en']
+        if connection.vendor == 'sqlite':
+            self.assertEqual(3, len(sql))
+        else:
+            self.assertEqual(1, len(sql))
+        sql = ' '.join(sql)
+        self.assertEqual(3, sql.count('ADD COLUMN'))
+        for column in columns:
+            self.assertIn(connection.ops.quote_name(column), sql)
+
 
 class TranslationAdminTest(ModeltranslationTestBase):
     def setUp(self):
@@ -1970,6 +2341,11 @@ class TranslationAdminTest(ModeltranslationTestBase):
         ma = NameModelAdmin(models.NameModel, self.site)
         self.assertEqual(ma.prepopulated_fields, {'slug': ('firstname_en', 'lastname_en',)})
 
+    def test_stored_translations(self):
+        # Translations stored as JSON or in a table have no form fields
+        for model in (models.JSONStorageModel, models.TableStorageModel):
+            self.assertRaises(ImproperlyConfigured, admin.TranslationAdmin, model, self.site)
+
 
 class ThirdPartyAppIntegrationTest(ModeltranslationTestBase):
     """
@@ -2087,6 +2463,29 @@ class TestManager(ModeltranslationTestBase):
             self.assertEqual(n.visits_en, 11)
             self.assertEqual(n.visits_de, 22)
 
+    def test_rewrite_cache(self):
+        """Check that rewritten lookup keys are cached per language."""
+        from modeltranslation.manager import (rewrite_lookup_key, rewrite_cache_info,
+                                              clear_rewrite_cache)
+        clear_rewrite_cache()
+        self.assertEqual('title_en__contains',
+                         rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+        self.assertEqual('title_en__contains',
+                         rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+        info = rewrite_cache_info()
+        self.assertEqual((1, 1, 1), (info['hits'], info['misses'], info['size']))
+        with override('de'):
+            self.assertEqual('title_de__contains',
+                             rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+        self.assertEqual(2, rewrite_cache_info()['misses'])
+
+        # Related lookups are cached as a whole
+        self.assertEqual('test_en__title_en',
+                         rewrite_lookup_key(models.ForeignKeyModel, 'test__title'))
+        self.assertEqual(3, rewrite_cache_info()['size'])
+        clear_rewrite_cache()
+        self.assertEqual(0, rewrite_cache_info()['size'])
+
     def test_order_by(self):
         """Check that field names are rewritten in order_by keys."""
         manager = models.ManagerTestModel.objects
@@ -2119,6 +2518,591 @@ class TestManager(ModeltranslationTestBase):
         self.assertEqual(titles_for_en, ('most', 'more_en', 'more_de', 'least'))
         self.assertEqual(titles_for_de, ('most', 'more_de', 'more_en', 'least'))
 
+        # Rewritten ordering is computed once per language
+        from modeltranslation.manager import _ORDERING_CACHE
+        self.assertEqual(('-visits_en',), _ORDERING_CACHE[(models.ManagerTestModel, 'en')])
+        self.assertEqual(('-visits_de',), _ORDERING_CACHE[(models.ManagerTestModel, 'de')])
+
+        # Default ordering is only applied when compiling queries that need it
+        from django.db import connection
+        qn = connection.ops.quote_name
+        qs = manager.all()
+        self.assertEqual([], qs.query.order_by)
+        self.assertIn('ORDER BY %s.%s DESC' % (qn('tests_managertestmodel'), qn('visits_en')),
+                      str(qs.query))
+        with override('de'):
+            # Ordering uses the language active when compiling, as lookups do
+            self.assertIn('%s DESC' % qn('visits_de'), str(qs.filter(title='most').query))
+            self.assertIn('%s DESC' % qn('visits_en'), str(qs.language('en').query))
+            self.assertIn('%s DESC' % qn('visits_de'), str(manager.all().query))
+            self.assertIn('%s ASC' % qn('title_de'), str(manager.order_by('title').query))
+        with self.assertNumQueries(1):
+            self.assertEqual(4, qs.count())
+            count_sql = connection.queries[-1]['sql']
+        self.assertNotIn('ORDER BY', count_sql)
+        self.assertEqual(('least', 'more_de', 'more_en', 'most'),
+                         tuple(m.title_en for m in qs.reverse()))
+
+    def test_defer_inactive_languages(self):
+        manager = models.ManagerTestModel.objects
+        pk = manager.create(title_en='en', title_de='de', visits_de=2).pk
+
+        def loaded(obj):
+            return set(f.attname for f in obj._meta.fields if f.attname in obj.__dict__)
+
+        self.assertEqual('en', get_language())
+        obj = manager.defer_inactive_languages().get(pk=pk)
+        self.assertEqual(set(['id', 'title_en', 'visits_en', 'description_en']), loaded(obj))
+        self.assertEqual('en', obj.title)
+        # Other languages are still available (loaded on demand)
+        self.assertEqual('de', obj.title_de)
+
+        # Fallback languages are loaded too
+        with default_fallback():
+            obj = manager.defer_inactive_languages().filter(pk=pk)[0]
+            self.assertTrue('title_de' in loaded(obj))
+
+        # Language is checked on evaluation
+        qs = manager.defer_inactive_languages().filter(pk=pk)
+        with override('de'):
+            obj = qs[0]
+            self.assertTrue('title_de' in loaded(obj))
+            self.assertFalse('title_en' in loaded(obj))
+            self.assertEqual(2, obj.visits)
+
+        # Works with only
+        obj = manager.defer_inactive_languages().only('title').get(pk=pk)
+        self.assertEqual(set(['id', 'title_en']), loaded(obj))
+
+        # Model default, which may be overridden
+        opts = translator.translator.get_options_for_model(models.ManagerTestModel)
+        opts.defer_inactive_languages = True
+        try:
+            self.assertFalse('title_de' in loaded(manager.get(pk=pk)))
+            obj = manager.defer_inactive_languages(False).get(pk=pk)
+            self.assertTrue('title_de' in loaded(obj))
+        finally:
+            del opts.defer_inactive_languages
+        self.assertTrue('title_de' in loaded(manager.get(pk=pk)))
+
+    def test_sql_fallbacks(self):
+        manager = models.ManagerTestModel.objects
+        m1 = manager.create(title_en='enigma', title_de='foo', visits_en=1)
+        m2 = manager.create(title_en='', title_de='enigma de', visits_en=None, visits_de=3)
+        m3 = manager.create(title_en='alpha', title_de='', visits_en=2)
+
+        def pks(qs):
+            return sorted(obj.pk for obj in qs)
+
+        # No fallback languages, no need for SQL fallbacks
+        self.assertFalse('COALESCE' in str(manager.sql_fallbacks().filter(title='x').query))
+
+        with default_fallback():
+            self.assertEqual([m1.pk], pks(manager.filter(title__contains='enigma')))
+            qs = manager.sql_fallbacks()
+            self.assertEqual([m1.pk, m2.pk], pks(qs.filter(title__contains='enigma')))
+            self.assertEqual([m2.pk], pks(qs.filter(title='enigma de', visits__gt=0)))
+            self.assertEqual([m2.pk, m3.pk], pks(qs.filter(title__in=['alpha', 'enigma de'])))
+            self.assertEqual([m1.pk, m3.pk], pks(qs.exclude(title__startswith='enigma d')))
+            self.assertEqual([], pks(qs.filter(title__isnull=True)))
+            # Lookups that can't be done in SQL are rewritten as usual
+            self.assertEqual([m1.pk], pks(qs.filter(title=F('title_en'), pk=m1.pk)))
+
+            # Ordering is consistent with values read from instances
+            self.assertEqual(['alpha', 'enigma', 'enigma de'],
+                             [m.title for m in qs.order_by('title')])
+            self.assertEqual(['enigma de', 'enigma', 'alpha'],
+                             [m.title for m in qs.order_by('-title', 'pk')])
+            # Also when just some values are selected
+            self.assertEqual(['alpha', 'enigma', 'enigma de'],
+                             list(qs.order_by('title').values_list('title', flat=True)))
+            self.assertEqual([m3.pk, m1.pk, m2.pk],
+                             list(qs.order_by('title').values_list('pk', flat=True)))
+            self.assertEqual([{'pk': m2.pk}, {'pk': m1.pk}, {'pk': m3.pk}],
+                             list(qs.order_by('-title').values('pk')))
+            self.assertEqual([m1.pk], list(manager.filter(
+                pk__in=qs.order_by('title').filter(visits_en=1).values('pk')).values_list(
+                    'pk', flat=True)))
+            # Including the default one
+            self.assertEqual([3, 2, 1], [m.visits for m in qs])
+            self.assertEqual([2, 1, 0], [m.visits_en or 0 for m in manager.all()])
+
+    def test_values(self):
+        manager = models.ManagerTestModel.objects
+        m1 = manager.create(title_en='enigma', title_de='foo', visits_en=1)
+        m2 = manager.create(title_en='', title_de='bar', visits_en=None, visits_de=3)
+        self.assertEqual([{'pk': m1.pk, 'title': 'enigma'}, {'pk': m2.pk, 'title': ''}],
+                         list(manager.order_by('pk').values('pk', 'title')))
+        self.assertEqual([(m1.pk, 1), (m2.pk, 0)],
+                         list(manager.order_by('pk').values_list('pk', 'visits')))
+        self.assertEqual(['bar'], list(manager.filter(pk=m2.pk).values_list('title_de', flat=True)))
+        self.assertRaises(TypeError, manager.values_list, 'title', 'visits', flat=True)
+        # Nothing to rewrite
+        self.assertEqual([m1.pk], list(manager.filter(pk=m1.pk).values_list('pk', flat=True)))
+
+        with default_fallback():
+            qs = manager.order_by('pk')
+            self.assertEqual(['enigma', 'bar'], list(qs.values_list('title', flat=True)))
+            self.assertEqual([{'title': 'enigma', 'visits': 1}, {'title': 'bar', 'visits': 3}],
+                             list(qs.values('title', 'visits')))
+            # Fallback columns are not part of rows
+            self.assertEqual(['title'], list(qs.values('title')[0].keys()))
+            # Aggregates are kept
+            self.assertEqual([('enigma', 1), ('bar', 1)],
+                             list(qs.values_list('title').annotate(n=Count('pk'))))
+            # Rows are grouped and made distinct by the value (not its columns)
+            manager.create(title_en='', title_de='bar', visits_de=5)
+            self.assertEqual([('bar', 2), ('enigma', 1)], list(
+                manager.values_list('title').annotate(n=Count('pk')).order_by('title')))
+            self.assertEqual(['bar', 'enigma'], sorted(
+                manager.order_by().values_list('title', flat=True).distinct()))
+            # Extra selects are kept
+            self.assertEqual([('enigma', 1), ('bar', 1)], list(
+                qs.filter(pk__in=[m1.pk, m2.pk]).extra(select={'x': '1'}).values_list(
+                    'title', 'x')))
+            # As a subquery the same values are selected
+            self.assertEqual([m1.pk], list(qs.filter(
+                title_en__in=qs.values_list('title', flat=True)).values_list('pk', flat=True)))
+            # Query sets selecting fallback expressions can be pickled
+            self.assertEqual(['enigma', 'bar'], list(pickle.loads(pickle.dumps(
+                qs.filter(pk__in=[m1.pk, m2.pk]).values_list('title', flat=True)))))
+            self.assertEqual([{'title': 'enigma'}], list(pickle.loads(pickle.dumps(
+                qs.filter(pk=m1.pk).values('title')))))
+            # As are fallbacks of relations (by primary keys) and inherited fields
+            t1 = models.TestModel.objects.create(title_de='a')
+            t2 = models.TestModel.objects.create(title_de='b')
+            fks = models.ForeignKeyModel.objects
+            fks.create(title='x', test_de=t1)
+            fks.create(title='y', test_de=t1)
+            fks.create(title='z', test_de=t1, test_en=t2)
+            self.assertEqual([(t1.pk, 2), (t2.pk, 1)], sorted(
+                fks.values_list('test').annotate(n=Count('pk'))))
+            self.assertEqual([t1.pk, t2.pk], sorted(
+                fks.values_list('test', flat=True).distinct()))
+            multitable = models.MultitableModelB.objects
+            multitable.create(titlea_de='a', titleb='b')
+            multitable.create(titlea_de='a', titleb='c')
+            multitable.create(titlea_de='a', titlea_en='d', titleb='e')
+            self.assertEqual([{'titlea': 'a'}, {'titlea': 'd'}], sorted(
+                multitable.values('titlea').distinct(), key=lambda r: r['titlea']))
+            self.assertEqual([{'titlea': 'a'}, {'titlea': 'd'}], sorted(
+                multitable.distinct().values('titlea'), key=lambda r: r['titlea']))
+            self.assertEqual([('a', 2), ('d', 1)], sorted(
+                multitable.values_list('titlea').annotate(n=Count('pk'))))
+
+    def test_language(self):
+        manager = models.ManagerTestModel.objects
+        m1 = manager.create(title_en='enigma', title_de='foo', visits_en=1, visits_de=2)
+        m2 = manager.create(title_en='alpha', title_de='', visits_en=2, visits_de=1)
+        self.assertRaises(ValueError, manager.language, 'xx')
+
+        qs = manager.language('de')
+        self.assertEqual('en', get_language())
+        self.assertEqual([m1.pk], [m.pk for m in qs.filter(title='foo')])
+        self.assertEqual([m2.pk, m1.pk], [m.pk for m in qs.order_by('title')])
+        # Default ordering (by visits)
+        self.assertEqual([m1.pk, m2.pk], [m.pk for m in qs])
+        self.assertEqual([m2.pk, m1.pk], [m.pk for m in manager.all()])
+        self.assertEqual([('foo', 2)], list(qs.filter(pk=m1.pk).values_list('title', 'visits')))
+
+        # Yielded instances resolve translated fields in the pinned language
+        m = qs.get(pk=m1.pk)
+        self.assertEqual('foo', m.title)
+        m.title = 'bar'
+        self.assertEqual('bar', m.title_de)
+        self.assertEqual('enigma', m.title_en)
+        with override('de'):
+            self.assertEqual('alpha', manager.language('en').get(pk=m2.pk).title)
+        # Restoring the active language
+        self.assertEqual('enigma', qs.language(None).get(pk=m1.pk).title)
+
+        # Lookups and ordering added before pinning the language are rewritten too
+        self.assertEqual([m1.pk], [o.pk for o in manager.filter(title='foo').language('de')])
+        self.assertEqual([m1.pk], [o.pk for o in manager.filter(
+            Q(title='foo') | Q(title='bar')).language('de')])
+        self.assertEqual([m2.pk], [o.pk for o in manager.exclude(title='foo').language('de')])
+        self.assertEqual([], list(manager.filter(title_en='foo').language('de')))
+        self.assertEqual([m1.pk], [o.pk for o in qs.filter(title='foo').language(None).language(
+            'de')])
+        self.assertEqual([m2.pk, m1.pk], [o.pk for o in manager.order_by('visits').language('de')])
+        self.assertEqual([m1.pk, m2.pk], [o.pk for o in manager.order_by('visits').language(
+            'de').language(None)])
+        with default_fallback():
+            self.assertEqual([m1.pk], [o.pk for o in pickle.loads(pickle.dumps(
+                manager.sql_fallbacks().filter(title='foo'))).language('de')])
+            self.assertEqual([m2.pk, m1.pk], [o.pk for o in manager.sql_fallbacks().order_by(
+                'visits').language('de')])
+
+        qs.filter(pk=m2.pk).update(title='beta')
+        self.assertEqual('beta', manager.get(pk=m2.pk).title_de)
+        with default_fallback():
+            m = qs.get(pk=m2.pk)
+            self.assertEqual('beta', m.title)
+            self.assertEqual(['beta'], list(qs.sql_fallbacks().filter(
+                title='beta').values_list('title', flat=True)))
+
+        # Objects are created in the pinned language
+        m = qs.create(title='Titel')
+        self.assertEqual(('Titel', None), (m.title_de, m.title_en))
+        self.assertEqual('Titel', m.title)
+        m, created = qs.get_or_create(title='Hallo', defaults={'visits': 3})
+        self.assertTrue(created)
+        self.assertEqual(('Hallo', None, 3), (m.title_de, m.title_en, m.visits_de))
+        m2, created = qs.get_or_create(title='Hallo')
+        self.assertFalse(created)
+        self.assertEqual(m.pk, m2.pk)
+        self.assertEqual('Hallo', m2.title)
+        self.assertEqual(1, manager.filter(title_de='Hallo').count())
+        with auto_populate('all'):
+            m = qs.create(title='Alle', title_en='All')
+            self.assertEqual(('Alle', 'All'), (m.title_de, m.title_en))
+            m, created = qs.get_or_create(title='Jeder')
+            self.assertEqual(('Jeder', 'Jeder'), (m.title_de, m.title_en))
+            self.assertFalse(qs.get_or_create(title='Jeder')[1])
+
+    def test_translations(self):
+        manager = models.ManagerTestModel.objects
+        m = manager.create(title_en='', title_de='enigma', visits_en=1, visits_de=2)
+        self.assertRaises(ValueError, manager.translations, 'xx')
+        self.assertEqual([{'pk': m.pk, 'title': {'en': '', 'de': 'enigma'},
+                           'visits': {'en': 1, 'de': 2}, 'description': {'en': None, 'de': None}}],
+                         list(manager.translations()))
+        with default_fallback():
+            self.assertEqual({'pk': m.pk, 'title': {'en': 'enigma'}, 'visits': {'en': 1},
+                              'description': {'en': None}},
+                             manager.filter(pk=m.pk).translations('en')[0])
+
+    def test_track_changes(self):
+        from django.db import connection
+        m = models.ChangesTrackedModel.objects.create(title_de='foo', text_en='bar', visits=1)
+
+        def save_sql(obj):
+            old_debug = connection.use_debug_cursor
+            connection.use_debug_cursor = True
+            try:
+                queries = len(connection.queries)
+                obj.save()
+                return connection.queries[queries:][0]['sql']
+            finally:
+                connection.use_debug_cursor = old_debug
+
+        m.title_de = 'baz'
+        sql = save_sql(m)
+        self.assertTrue('title_de' in sql and 'visits' in sql)
+        self.assertFalse('title_en' in sql or 'text_' in sql)
+        # Assignment through the original field
+        m.text = 'qux'
+        sql = save_sql(m)
+        self.assertTrue('text_en' in sql)
+        self.assertFalse('title_de' in sql)
+
+        m = models.ChangesTrackedModel.objects.get(pk=m.pk)
+        self.assertEqual(('baz', 'qux'), (m.title_de, m.text_en))
+        m.text_de = 'quux'
+        self.assertFalse('text_en' in save_sql(m))
+        self.assertEqual('quux', models.ChangesTrackedModel.objects.get(pk=m.pk).text_de)
+        # Original fields are always saved (their values come from translations)
+        sql = save_sql(m)
+        self.assertTrue(connection.ops.quote_name('title') in sql and
+                        connection.ops.quote_name('text') in sql)
+        # Deferred fields
+        m = models.ChangesTrackedModel.objects.defer('title').get(pk=m.pk)
+        m.text_en = 'foo'
+        self.assertFalse('title' in save_sql(m))
+        # Objects with a changed primary key (copies) are inserted
+        manager = models.ChangesTrackedModel.objects
+        m = manager.get(pk=m.pk)
+        original_pk = m.pk
+        m.pk = original_pk + 100
+        m.title_de = 'copy'
+        m.save()
+        self.assertEqual(2, manager.count())
+        self.assertEqual(('copy', 'foo'), (manager.get(pk=m.pk).title_de, m.text_en))
+        self.assertEqual('baz', manager.get(pk=original_pk).title_de)
+        m.pk = None
+        m.save()
+        self.assertEqual(3, manager.count())
+
+        # Objects whose rows were deleted in the meantime are inserted again
+        m = manager.get(pk=original_pk)
+        manager.filter(pk=original_pk).delete()
+        m.title_de = 'again'
+        m.save(update_fields=None)
+        self.assertEqual(3, manager.count())
+        self.assertEqual(('again', 'foo'), (manager.get(pk=original_pk).title_de,
+                                            manager.get(pk=original_pk).text_en))
+
+        # Translations stored as JSON are saved if any of them changed
+        m = models.JSONStorageModel.objects.create(title_de='foo', rank_en=1)
+        m = models.JSONStorageModel.objects.get(pk=m.pk)
+        self.assertFalse('_translations' in save_sql(m))
+        m.rank_de = 2
+        sql = save_sql(m)
+        self.assertTrue('rank_translations' in sql)
+        self.assertFalse('title_translations' in sql)
+        self.assertEqual((1, 2), (models.JSONStorageModel.objects.get(pk=m.pk).rank_en,
+                                  models.JSONStorageModel.objects.get(pk=m.pk).rank_de))
+
+        # Signals are sent (translations stored in a table are saved on post_save)
+        m = models.TableStorageModel.objects.create(title_de='foo')
+        m = models.TableStorageModel.objects.get(pk=m.pk)
+        m.title_en = 'bar'
+        m.save()
+        self.assertEqual('bar', models.TableStorageModel.objects.get(pk=m.pk).title_en)
+
+    def test_languages_subset(self):
+        model = models.LanguagesSubsetModel
+        field_names = [f.name for f in model._meta.fields]
+        self.assertTrue('title_en' in field_names)
+        self.assertFalse('title_de' in field_names)
+        opts = translator.translator.get_options_for_model(model)
+        self.assertEqual(('en',), opts.languages)
+        self.assertEqual(('en',), opts.get_field_languages('title'))
+        # Computed once
+        self.assertTrue(opts.get_field_languages('title') is opts.get_field_languages('title'))
+
+        # Other languages use a substitute (the only one here)
+        with override('de'):
+            m = model.objects.create(title='foo')
+            self.assertEqual('foo', m.title_en)
+            m.text = 'bar'
+            self.assertEqual('bar', m.text_en)
+            self.assertEqual('bar', m.text)
+            m.save()
+            self.assertEqual([m.pk], [n.pk for n in model.objects.filter(title='foo')])
+            self.assertEqual(['foo'], list(model.objects.values_list('title', flat=True)))
+        self.assertEqual([{'pk': m.pk, 'title': {'de': 'foo', 'en': 'foo'},
+                           'text': {'de': 'bar', 'en': 'bar'}}],
+                         list(model.objects.translations()))
+
+        # Forms unaware of translations set the substitute translation field
+        class SubsetForm(forms.ModelForm):
+            class Meta:
+                model = models.LanguagesSubsetModel
+
+        with override('de'):
+            form = SubsetForm({'title': 'baz'})
+            self.assertTrue(form.is_valid(), form.errors)
+            self.assertEqual('baz', form.save().title_en)
+
+        class SubsetAdmin(admin.TranslationAdmin):
+            fields = ('title', 'text')
+        ma = SubsetAdmin(model, AdminSite())
+        self.assertEqual(['title_en', 'text_en'], list(ma.get_form(None).base_fields.keys()))
+
+        # Languages have to be available ones
+        class UnknownLanguagesTranslationOptions(translator.TranslationOptions):
+            fields = ('title',)
+            languages = ('de', 'xx')
+        self.assertRaises(ImproperlyConfigured, translator.Translator().register,
+                          models.ManagerTestModel, UnknownLanguagesTranslationOptions)
+
+    def test_json_storage(self):
+        model = models.JSONStorageModel
+        field_names = [f.name for f in model._meta.fields]
+        self.assertTrue('title_translations' in field_names)
+        self.assertFalse('title_en' in field_names)
+
+        m = model.objects.create(title='foo', rank_de='3')
+        self.assertEqual('foo', m.title_en)
+        self.assertEqual(3, m.rank_de)
+        self.assertEqual(None, m.rank)
+        m.title_de = 'Titel'
+        m.save()
+        m = model.objects.get(pk=m.pk)
+        self.assertEqual({'de': 'Titel', 'en': 'foo'}, json.loads(m.title_translations))
+        self.assertEqual(('foo', 3), (m.title, m.rank_de))
+        with override('de'):
+            self.assertEqual(('Titel', 3), (m.title, m.rank))
+        n = model.objects.create(title_en='bar', rank=1)
+
+        # Lookups and ordering are done on the JSON column
+        self.assertEqual([m.pk], [o.pk for o in model.objects.filter(title='foo')])
+        self.assertEqual([n.pk], [o.pk for o in model.objects.exclude(title__startswith='f')])
+        self.assertEqual([n.pk, m.pk], [o.pk for o in model.objects.order_by('title')])
+        self.assertEqual([m.pk], [o.pk for o in model.objects.filter(rank__isnull=True)])
+        with override('de'):
+            self.assertEqual([m.pk], [o.pk for o in model.objects.filter(rank__gt=2)])
+            self.assertEqual([('Titel', 3), ('', None)],
+                             list(model.objects.order_by('pk').values_list('title', 'rank')))
+        self.assertEqual([{'pk': m.pk, 'title': {'de': 'Titel', 'en': 'foo'},
+                           'rank': {'de': 3, 'en': None}}],
+                         list(model.objects.filter(pk=m.pk).translations()))
+
+        # Default translations are updated in the JSON
+        model.objects.rewrite(False).update(title='baz')
+        call_command('update_translation_fields', 'tests.JSONStorageModel.title', verbosity=0)
+        self.assertEqual({'de': 'baz', 'en': 'bar'},
+                         json.loads(model.objects.get(pk=n.pk).title_translations))
+        self.assertEqual('Titel', model.objects.get(pk=m.pk).title_de)
+        model.objects.rewrite(False).update(rank=7)
+        call_command('update_translation_fields', 'tests.JSONStorageModel.rank', verbosity=0,
+                     chunk_size=1)
+        self.assertEqual([(m.pk, 3), (n.pk, 7)], list(
+            model.objects.language('de').order_by('pk').values_list('pk', 'rank')))
+
+        # Assigned values are converted, so they are compared and sorted as numbers
+        o = model.objects.create(title='', rank_en='10')
+        self.assertEqual({'en': 10}, json.loads(o.rank_translations))
+        model.objects.filter(pk=n.pk).update(rank_translations='{"en": 9}')
+        self.assertEqual(set([o.pk, n.pk]), set(p.pk for p in model.objects.filter(rank__gt=2)))
+        self.assertEqual([n.pk, o.pk], [p.pk for p in
+                                        model.objects.filter(rank__gt=2).order_by('rank')])
+
+        # Lookups within Q objects and F expressions read the JSON too
+        self.assertEqual([m.pk, n.pk], sorted(
+            p.pk for p in model.objects.filter(Q(title='foo') | Q(rank=9))))
+        self.assertEqual([o.pk], [p.pk for p in model.objects.exclude(Q(title='foo') | Q(rank=9))])
+        self.assertEqual([m.pk, n.pk], sorted(
+            p.pk for p in model.objects.exclude(Q(rank__gt=9), title='')))
+        self.assertEqual([o.pk], [p.pk for p in model.objects.filter(
+            rank__gt=F('rank_en') - 1, title_translations__isnull=False).filter(rank__gt=9)])
+        self.assertEqual([n.pk, o.pk], sorted(
+            p.pk for p in model.objects.filter(pk__lt=F('rank') + 100)))
+        self.assertEqual([m.pk], [p.pk for p in model.objects.filter(
+            Q(title_de='Titel') | Q(title_de__startswith='Z'))])
+        self.assertEqual([m.pk], [p.pk for p in model.objects.filter(title_de='Titel')])
+        self.assertRaises(FieldError, model.objects.filter, Q(title__foo__bar='x'))
+        self.assertEqual([m.pk], [p.pk for p in model.objects.filter(title='Titel').language('de')])
+        self.assertEqual([m.pk], [p.pk for p in model.objects.filter(
+            Q(title='Titel') | Q(rank=-1)).language('de')])
+        self.assertRaises(FieldError, model.objects.filter, Q(rank=F('rank_en')) | Q(pk=1))
+
+        # Translations are updated in the JSON
+        self.assertEqual(1, model.objects.filter(pk=m.pk).update(title='Foo', rank_de=4))
+        m = model.objects.get(pk=m.pk)
+        self.assertEqual(('Foo', 'Titel', 4), (m.title_en, m.title_de, m.rank_de))
+        with override('de'):
+            model.objects.filter(Q(pk=m.pk) | Q(pk=n.pk)).update(rank=F('rank_en') + 1)
+            self.assertEqual((None, 10), (model.objects.get(pk=m.pk).rank,
+                                          model.objects.get(pk=n.pk).rank))
+            self.assertEqual([m.pk, o.pk], sorted(
+                p.pk for p in model.objects.filter(rank__isnull=True)))
+        model.objects.filter(pk=o.pk).update(title_en='qux')
+        model.objects.filter(pk=o.pk).update(title_de=F('title_en'), rank='11')
+        o = model.objects.get(pk=o.pk)
+        self.assertEqual(('qux', 11), (o.title_de, o.rank_en))
+        self.assertEqual(11, json.loads(o.rank_translations)['en'])
+
+        # Meta.ordering can't use such fields
+        class OrderingTranslationOptions(translator.TranslationOptions):
+            fields = ('visits',)
+            storage = 'json'
+        self.assertRaises(ImproperlyConfigured, translator.Translator().register,
+                          models.ManagerTestModel, OrderingTranslationOptions)
+
+        # Storage has to be a known one
+        class UnknownStorageTranslationOptions(translator.TranslationOptions):
+            fields = ('title',)
+            storage = 'xml'
+        self.assertRaises(ImproperlyConfigured, translator.Translator().register,
+                          models.ManagerTestModel, UnknownStorageTranslationOptions)
+
+    def test_table_storage(self):
+        model = models.TableStorageModel
+        translation_model = model.title_en.table.model
+        self.assertEqual('tests_tablestoragemodel_translation', translation_model._meta.db_table)
+        self.assertFalse('title_en' in [f.name for f in model._meta.fields])
+
+        m = model.objects.create(title='foo', rank_de=3)
+        self.assertEqual([('en', 'foo', None), ('de', None, 3)], list(
+            translation_model.objects.order_by('-language').values_list(
+                'language', 'title', 'rank')))
+        m = model.objects.get(pk=m.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(('foo', 3), (m.title, m.rank_de))
+        m.title_de = 'Titel'
+        with self.assertNumQueries(2):
+            # The object's row (updated without a check, as changes are tracked),
+            # and only the row of the changed language
+            m.save()
+        with override('de'):
+            self.assertEqual(('Titel', 3), (model.objects.get(pk=m.pk).title, m.rank))
+        n = model.objects.create(title_en='bar', rank=1)
+
+        # Lookups and ordering use subqueries selecting the language rows
+        self.assertEqual([m.pk], [o.pk for o in model.objects.filter(title='foo')])
+        self.assertEqual([n.pk], [o.pk for o in model.objects.exclude(title__startswith='f')])
+        self.assertEqual([n.pk, m.pk], [o.pk for o in model.objects.order_by('title')])
+        with override('de'):
+            self.assertEqual([m.pk], [o.pk for o in model.objects.filter(rank__gt=2)])
+            self.assertEqual([('Titel', 3), ('', None)],
+                             list(model.objects.order_by('pk').values_list('title', 'rank')))
+        self.assertEqual([{'pk': m.pk, 'title': {'de': 'Titel', 'en': 'foo'},
+                           'rank': {'de': 3, 'en': None}}],
+                         list(model.objects.filter(pk=m.pk).translations()))
+
+        # Lookups within Q objects and F expressions select the rows too
+        self.assertEqual([m.pk, n.pk], sorted(
+            o.pk for o in model.objects.filter(Q(title='foo') | Q(title_en='bar'))))
+        self.assertEqual([n.pk], [o.pk for o in model.objects.exclude(Q(title='foo'))])
+        self.assertEqual([m.pk], [o.pk for o in model.objects.filter(
+            Q(title_de='Titel') | Q(rank_de=5))])
+        self.assertEqual([n.pk], [o.pk for o in model.objects.filter(rank__lt=F('pk') + 1)])
+        self.assertRaises(FieldError, model.objects.filter, Q(rank=F('rank_de')))
+        self.assertEqual([n.pk, m.pk], list(model.objects.order_by('title').values_list(
+            'pk', flat=True)))
+
+        # Deferred loading skips them, as they are not model fields
+        self.assertEqual('foo', model.objects.defer('title').get(pk=m.pk).title)
+        self.assertEqual(3, model.objects.only('title').get(pk=m.pk).rank_de)
+
+        # Translations of many instances can be prefetched
+        with self.assertNumQueries(2):
+            self.assertEqual(['foo', 'bar'], [o.title for o in
+                                              model.objects.prefetch_translations().order_by('pk')])
+
+        # Default translations are updated in the table (or inserted)
+        o = model.objects.create(title_de='', title_en='qux')
+        model.objects.rewrite(False).update(title='baz')
+        call_command('update_translation_fields', 'tests.TableStorageModel.title', verbosity=0,
+                     chunk_size=1)
+        self.assertEqual(('baz', 'bar', None), (model.objects.get(pk=n.pk).title_de,
+                                                model.objects.get(pk=n.pk).title_en,
+                                                model.objects.get(pk=n.pk).rank_de))
+        self.assertEqual(('baz', 'qux'), (model.objects.get(pk=o.pk).title_de,
+                                          model.objects.get(pk=o.pk).title_en))
+        self.assertEqual('Titel', model.objects.get(pk=m.pk).title_de)
+
+        # update() changes rows of the objects matched before (and inserts missing ones)
+        translation_model.objects.filter(parent=o.pk, language='de').delete()
+        self.assertEqual(2, model.objects.filter(title__in=['bar', 'qux']).update(
+            title='Baz', rank_de=2))
+        self.assertEqual([('Baz', 'baz', 2), ('Baz', None, 2)], [
+            (p.title_en, p.title_de, p.rank_de) for p in model.objects.filter(
+                pk__in=[n.pk, o.pk]).order_by('pk')])
+        with override('de'):
+            self.assertEqual(1, model.objects.filter(title='baz').update(title='Neu'))
+        self.assertEqual('Neu', model.objects.get(pk=n.pk).title_de)
+        self.assertRaises(FieldError, model.objects.update, title=F('title_de'))
+
+        # Rows are deleted with their objects
+        m.delete()
+        self.assertEqual(4, translation_model.objects.count())
+
+        # Bulk created objects get their translations inserted if their
+        # primary keys are known
+        objs = model.objects.bulk_create([model(pk=100, title='bulk', rank_de=5),
+                                          model(pk=101, rank=6)])
+        self.assertEqual(7, translation_model.objects.count())
+        self.assertEqual(('bulk', None, 5), (model.objects.get(pk=100).title_en,
+                                             model.objects.get(pk=100).title_de,
+                                             model.objects.get(pk=100).rank_de))
+        self.assertEqual(6, model.objects.get(pk=101).rank_en)
+        self.assertFalse(any(model.title_en.table.changed_name in o.__dict__ for o in objs))
+        count = model.objects.count()
+        self.assertRaises(ValueError, model.objects.bulk_create, [model(title='lost')])
+        self.assertEqual(count, model.objects.count())
+        model.objects.bulk_create([model(), model()])
+        self.assertEqual(count + 2, model.objects.count())
+
+        # Meta.ordering can't use such fields
+        class OrderingTranslationOptions(translator.TranslationOptions):
+            fields = ('visits',)
+            storage = 'table'
+        self.assertRaises(ImproperlyConfigured, translator.Translator().register,
+                          models.ManagerTestModel, OrderingTranslationOptions)
+
     def test_custom_manager(self):
         """Test if user-defined manager is still working"""
         n = models.CustomManagerTestModel(title='')
@@ -2140,6 +3124,15 @@ class TestManager(ModeltranslationTestBase):
         with override('de'):
             self.assertEqual(1, models.CustomManagerTestModel.objects.count())
 
+        # And when the language is pinned
+        manager = models.CustomManagerTestModel.objects
+        self.assertEqual(1, manager.language('de').count())
+        self.assertEqual(['bar'], [o.title for o in manager.language('de')])
+        self.assertEqual(1, manager.filter(title_en='enigma').language('de').count())
+        with override('de'):
+            self.assertEqual(2, manager.language('en').count())
+            self.assertEqual(1, manager.language('en').language(None).count())
+
     def test_custom_manager2(self):
         """Test if user-defined queryset is still working"""
         from modeltranslation.manager import MultilingualManager, MultilingualQuerySet
@@ -2150,6 +3143,35 @@ class TestManager(ModeltranslationTestBase):
         self.assertTrue(isinstance(qs, models.CustomQuerySet))
         self.assertTrue(isinstance(qs, MultilingualQuerySet))
 
+        # Combined classes are created just once
+        self.assertEqual('MultilingualCustomQuerySet', qs.__class__.__name__)
+        self.assertTrue(qs.__class__ is manager.filter(title='a').__class__)
+        self.assertTrue(qs.__class__ is manager.get_query_set().__class__)
+        self.assertTrue(manager.__class__.__name__.startswith('NewMultilingualManager'))
+
+        # And can be pickled
+        models.CustomManager2TestModel.objects.create(title='a')
+        self.assertEqual(['a'], [o.title for o in pickle.loads(pickle.dumps(qs.all()))])
+        self.assertTrue(pickle.loads(pickle.dumps(qs)).__class__ is qs.__class__)
+        self.assertTrue(pickle.loads(pickle.dumps(manager)).__class__ is manager.__class__)
+
+        # Also in a process that hasn't created the combined classes
+        import subprocess
+        import sys
+        script = (
+            'import pickle, sys\n'
+            'from django.conf import settings\n'
+            'settings.configure(INSTALLED_APPS=("modeltranslation",), '
+            'DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3"}})\n'
+            'qs = pickle.loads(sys.stdin.buffer.read() if hasattr(sys.stdin, "buffer") '
+            'else sys.stdin.read())\n'
+            'print("%s %s" % (qs.__class__.__name__, [str(o.title) for o in qs]))\n')
+        process = subprocess.Popen(
+            [sys.executable, '-c', script], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        out = process.communicate(pickle.dumps(qs.all(), pickle.HIGHEST_PROTOCOL))[0]
+        self.assertEqual(b"MultilingualCustomQuerySet ['a']", out.strip())
+
     def test_creation(self):
         """Test if field are rewritten in create."""
         self.assertEqual('en', get_language())
@@ -2255,6 +3277,37 @@ class TestManager(ModeltranslationTestBase):
         self.assertEqual('aaa', m1.title_en)
         self.assertEqual('aaa', m1.title_de)
 
+    def test_bulk_create_population(self):
+        """
+        Populate may be used with ``bulk_create``.
+        """
+        qs = models.ManagerTestModel.objects
+        qs.bulk_create([models.ManagerTestModel(title='foo')])
+        m = qs.get()
+        self.assertEqual('foo', m.title_en)
+        self.assertEqual(None, m.title_de)
+        m.delete()
+
+        qs.populate(True).bulk_create([
+            models.ManagerTestModel(title='foo', description='bar'),
+            models.ManagerTestModel(title='baz', title_de='qux'),
+        ])
+        m1 = qs.get(title='foo')
+        m2 = qs.get(title='baz')
+        self.assertEqual('foo', m1.title_de)
+        self.assertEqual('bar', m1.description_de)
+        self.assertEqual('qux', m2.title_de)
+        self.assertEqual(None, m2.description_de)
+        qs.all().delete()
+
+        # Population modes are the same as for ``create``
+        qs.populate('required').bulk_create([
+            models.ManagerTestModel(title='foo', description='bar'),
+        ])
+        m = qs.get()
+        self.assertEqual('foo', m.title_de)
+        self.assertEqual(None, m.description_de)
+
     def test_fixture_population(self):
         """
         Test that a fixture with values only for the original fields
@@ -238,6 +238,27 @@ class ManagerTestModel(models.Model):
         ordering = ('-visits',)
 
 
+class ChangesTrackedModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
+    text = models.TextField(blank=True, null=True)
+    visits = models.IntegerField(default=0)
+
+
+class LanguagesSubsetModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
+    text = models.TextField(blank=True, null=True)
+
+
+class JSONStorageModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
+    rank = models.IntegerField(blank=True, null=True)
+
+
+class TableStorageModel(models.Model):
+    title = models.CharField(ugettext_lazy('title'), max_length=255)
+    rank = models.IntegerField(blank=True, null=True)
+
+
 class CustomManager(models.Manager):
     def get_query_set(self):
         return super(CustomManager, self).get_query_set().filter(title__contains='a')
@@ -6,6 +6,7 @@ from modeltranslation.tests.models import (
     TestModel, FallbackModel, FallbackModel2, FileFieldsModel, ForeignKeyModel, OtherFieldsModel,
     DescriptorModel, AbstractModelA, AbstractModelB, Slugged, MetaData, Displayable, Page,
     RichText, RichTextPage, MultitableModelA, MultitableModelB, MultitableModelC, ManagerTestModel,
+    ChangesTrackedModel, LanguagesSubsetModel, JSONStorageModel, TableStorageModel,
     CustomManagerTestModel, CustomManager2TestModel, GroupFieldsetsModel, NameModel,
     ThirdPartyRegisteredModel)
 
@@ -121,6 +122,32 @@ class ManagerTestModelTranslationOptions(TranslationOptions):
 translator.register(ManagerTestModel, ManagerTestModelTranslationOptions)
 
 
+class ChangesTrackedModelTranslationOptions(TranslationOptions):
+    fields = ('title', 'text')
+    track_changes = True
+translator.register(ChangesTrackedModel, ChangesTrackedModelTranslationOptions)
+
+
+class LanguagesSubsetModelTranslationOptions(TranslationOptions):
+    fields = ('title', 'text')
+    languages = ('en',)
+translator.register(LanguagesSubsetModel, LanguagesSubsetModelTranslationOptions)
+
+
+class JSONStorageModelTranslationOptions(TranslationOptions):
+    fields = ('title', 'rank')
+    storage = 'json'
+    track_changes = True
+translator.register(JSONStorageModel, JSONStorageModelTranslationOptions)
+
+
+class TableStorageModelTranslationOptions(TranslationOptions):
+    fields = ('title', 'rank')
+    storage = 'table'
+    track_changes = True
+translator.register(TableStorageModel, TableStorageModelTranslationOptions)
+
+
 class CustomManagerTestModelTranslationOptions(TranslationOptions):
     fields = ('title',)
 translator.register([CustomManagerTestModel, CustomManager2TestModel],
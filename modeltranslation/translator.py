@@ -1,16 +1,24 @@
 # -*- coding: utf-8 -*-
-from django.conf import settings
+import threading
+from contextlib import contextmanager
+
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.six import with_metaclass
+from django.db import connections, router, DatabaseError
 from django.db.models import Manager, ForeignKey
 from django.db.models.base import ModelBase
-from django.db.models.signals import post_init
+from django.db.models.signals import post_init, post_save
 from django.dispatch import receiver
 
 from modeltranslation import settings as mt_settings
 from modeltranslation.fields import (TranslationFieldDescriptor, TranslatedRelationIdDescriptor,
-                                     create_translation_field)
-from modeltranslation.manager import MultilingualManager, rewrite_lookup_key
-from modeltranslation.utils import build_localized_fieldname
+                                     JSONTranslationDescriptor, TableTranslationDescriptor,
+                                     TranslationAttribute, TranslationTable,
+                                     create_translation_field, create_translations_field)
+from modeltranslation.manager import (MultilingualManager, combined_class, JSON_VENDORS,
+                                      rewrite_lookup_key, clear_rewrite_cache)
+from modeltranslation.utils import (build_localized_fieldname, get_language, auto_populate_mode,
+                                    substitute_language, build_translations_fieldname)
 
 
 class AlreadyRegistered(Exception):
@@ -43,7 +51,11 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
     Translatable fields are declared by registering a model using
     ``TranslationOptions`` class with appropriate ``fields`` attribute.
     Model-specific fallback values and languages can also be given as class
-    attributes.
+    attributes, as well as ``languages`` the fields should be translated into
+    (all available languages by default) and the ``storage`` of translations:
+    a column for each language (``'columns'``, the default), a single JSON
+    column for each field (``'json'``) or a separate table with a row for each
+    language (``'table'``).
 
     Options instances hold info about translatable fields for a model and its
     superclasses. The ``local_fields`` and ``fields`` attributes are mappings
@@ -57,18 +69,52 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
     ``related`` attribute inform whether this model is related part of some relation
     with translated model. This model may be not translated itself.
     ``related_fields`` contains names of reverse lookup fields.
+    ``json_fields`` contains names of fields with translations stored as JSON.
+    ``table_fields`` contains names of fields with translations stored in
+    ``tables`` (``TranslationTable`` instances).
     """
 
+    languages = None
+    storage = 'columns'
+
     def __init__(self, model):
         """
         Create fields dicts without any translation fields.
         """
+        if self.languages is None:
+            self.languages = tuple(mt_settings.AVAILABLE_LANGUAGES)
+        else:
+            unknown = [l for l in self.languages if l not in mt_settings.AVAILABLE_LANGUAGES]
+            if unknown or not self.languages:
+                raise ImproperlyConfigured(
+                    'Languages of %s translation options have to be a non-empty subset of'
+                    ' LANGUAGES (unknown: %s).' % (model.__name__, ', '.join(unknown)))
+            self.languages = tuple(l for l in mt_settings.AVAILABLE_LANGUAGES
+                                   if l in self.languages)
+        if self.storage not in ('columns', 'json', 'table'):
+            raise ImproperlyConfigured(
+                'Unknown translations storage of %s: %s.' % (model.__name__, self.storage))
+        if self.storage == 'json':
+            vendor = connections[router.db_for_write(model)].vendor
+            if vendor not in JSON_VENDORS:
+                raise ImproperlyConfigured(
+                    'Translations of %s can not be stored as JSON with %s databases.'
+                    % (model.__name__, vendor))
+        if self.storage == 'table' and model._meta.abstract:
+            raise ImproperlyConfigured(
+                'Translations of abstract model %s can not be stored in a table.'
+                % model.__name__)
         self.model = model
         self.registered = False
         self.related = False
         self.local_fields = dict((f, set()) for f in self.fields)
         self.fields = dict((f, set()) for f in self.fields)
         self.related_fields = []
+        self.json_fields = set()
+        self.table_fields = set()
+        self.tables = set()
+        # Field name -> (number of translation fields, languages).
+        self._field_languages = {}
 
     def update(self, other):
         """
@@ -76,6 +122,10 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
         """
         if other.model._meta.abstract:
             self.local_fields.update(other.local_fields)
+        else:
+            self.json_fields.update(other.json_fields)
+            self.table_fields.update(other.table_fields)
+            self.tables.update(other.tables)
         self.fields.update(other.fields)
 
     def add_translation_field(self, field, translation_field):
@@ -85,6 +135,21 @@ class TranslationOptions(with_metaclass(FieldsAggregationMetaClass, object)):
         self.local_fields[field].add(translation_field)
         self.fields[field].add(translation_field)
 
+    def get_field_languages(self, field_name):
+        """
+        Returns languages the field is translated into (for inherited fields
+        these may differ from ``languages``).
+        """
+        translation_fields = self.fields[field_name]
+        # Sets of inherited fields are shared with (and filled when patching)
+        # the base options, so the cache is checked against their size.
+        cached = self._field_languages.get(field_name)
+        if cached is None or cached[0] != len(translation_fields):
+            languages = set(f.language for f in translation_fields)
+            cached = self._field_languages[field_name] = (len(translation_fields), tuple(
+                l for l in mt_settings.AVAILABLE_LANGUAGES if l in languages))
+        return cached[1]
+
     def get_field_names(self):
         """
         Return name of all fields that can be used in filtering.
@@ -103,14 +168,48 @@ def add_translation_fields(model, opts):
     every language.
 
     Adds newly created translation fields to the given translation options.
+
+    With the JSON storage a single field holding all translations is added for
+    each translated field, along with descriptors taking place of translation
+    fields. With the table storage translations are kept in a generated model
+    (only descriptors are added).
     """
+    if opts.storage == 'table' and opts.local_fields:
+        table = TranslationTable(model, opts.local_fields.keys())
+        opts.tables.add(table)
+        for field_name in opts.local_fields.keys():
+            field = model._meta.get_field(field_name)
+            for lang in opts.languages:
+                descriptor = TableTranslationDescriptor(table, field, lang)
+                if hasattr(model, descriptor.name):
+                    raise ValueError(
+                        "Error adding translation field. Model '%s' already contains a field"
+                        " named '%s'." % (model._meta.object_name, descriptor.name))
+                setattr(model, descriptor.name, descriptor)
+                opts.add_translation_field(field_name, descriptor)
+            opts.table_fields.add(field_name)
+        return
     for field_name in opts.local_fields.keys():
-        for l in settings.LANGUAGES:
+        if opts.storage == 'json':
+            translations_field = create_translations_field(model, field_name)
+            translations_field_name = build_translations_fieldname(field_name)
+            if hasattr(model, translations_field_name):
+                raise ValueError(
+                    "Error adding translations field. Model '%s' already contains a field named"
+                    "'%s'." % (model._meta.object_name, translations_field_name))
+            model.add_to_class(translations_field_name, translations_field)
+            for lang in opts.languages:
+                descriptor = JSONTranslationDescriptor(translations_field, lang)
+                setattr(model, descriptor.name, descriptor)
+                opts.add_translation_field(field_name, descriptor)
+            opts.json_fields.add(field_name)
+            continue
+        for lang in opts.languages:
             # Create a dynamic translation field
             translation_field = create_translation_field(
-                model=model, field_name=field_name, lang=l[0])
+                model=model, field_name=field_name, lang=lang)
             # Construct the name for the localized field
-            localized_field_name = build_localized_fieldname(field_name, l[0])
+            localized_field_name = build_localized_fieldname(field_name, lang)
             # Check if the model already has a field by that name
             if hasattr(model, localized_field_name):
                 raise ValueError(
@@ -137,9 +236,8 @@ def add_manager(model):
     if current_manager.__class__ is Manager:
         current_manager.__class__ = MultilingualManager
     else:
-        class NewMultilingualManager(MultilingualManager, current_manager.__class__):
-            pass
-        current_manager.__class__ = NewMultilingualManager
+        current_manager.__class__ = combined_class(
+            'NewMultilingualManager', (MultilingualManager, current_manager.__class__))
 
 
 def patch_constructor(model):
@@ -156,8 +254,101 @@ def patch_constructor(model):
                 new_key = rewrite_lookup_key(model, key)
                 # Old key is intentionally left in case old_init wants to play with it
                 kwargs.setdefault(new_key, val)
+        # Translations stored as JSON or in tables are not model fields, they're
+        # set afterwards.
+        attribute_values = [(key, kwargs.pop(key)) for key in list(kwargs)
+                            if isinstance(getattr(model, key, None), TranslationAttribute)]
+        old_init(self, *args, **kwargs)
+        for key, val in attribute_values:
+            setattr(self, key, val)
+    model.__init__ = new_init
+
+
+def patch_change_tracking(model, opts):
+    """
+    Monkey patches the model to only save translation fields whose values
+    changed since the instance was loaded or saved (other fields, including
+    the original translated fields, are always saved).
+
+    With the JSON storage the JSON of translations is compared (it's saved if
+    any of its translations changed), translations stored in a table track
+    their changes on their own.
+
+    Saves are only narrowed if they go to the row the values were loaded
+    from: the primary key didn't change and the instance is saved to the
+    database it came from (otherwise Django may need to insert the row). If
+    the row was deleted in the meantime, the instance is saved in full (and
+    inserted again), as without the tracking.
+    """
+    tracked = [f for translation_fields in opts.fields.values() for f in translation_fields
+               if not isinstance(f, TranslationAttribute)]
+    json_fields = [model._meta.get_field(build_translations_fieldname(field_name))
+                   for field_name in opts.json_fields]
+    tracked.extend(json_fields)
+    tracked_attnames = set(f.attname for f in tracked)
+    # Original fields mapped to the attributes they're computed from.
+    originals = dict((model._meta.get_field(field_name).attname,
+                      [f.attname for f in tracked if f.translated_field.name == field_name])
+                     for field_name in opts.fields)
+    old_init = model.__init__
+    old_save = model.save
+
+    def get_value(instance, field):
+        value = instance.__dict__[field.attname]
+        if field in json_fields:
+            cache = instance.__dict__.get(field.cache_name)
+            if cache is not None and cache[0] is value:
+                # Translations may have been changed since they were decoded.
+                return field.encode(cache[1])
+            return value
+        return field.get_prep_value(value)
+
+    def store_values(instance):
+        # Deferred fields are not loaded, so they can't change.
+        instance._mt_saved = (instance.pk, dict((f.attname, get_value(instance, f))
+                                                for f in tracked if f.attname in instance.__dict__))
+
+    def new_init(self, *args, **kwargs):
         old_init(self, *args, **kwargs)
+        store_values(self)
+
+    def new_save(self, *args, **kwargs):
+        saved_pk, saved = self._mt_saved
+        # Loaded instances get their database after __init__, so compare to it here.
+        using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+        update_fields = []
+        if (not args and kwargs.get('update_fields') is None and not kwargs.get('force_insert')
+                and not self._state.adding and self.pk is not None and self.pk == saved_pk
+                and using == self._state.db):
+            for f in self._meta.fields:
+                if f.primary_key:
+                    continue
+                if f.attname in originals:
+                    # Values of original fields come from their translations
+                    # (unless they're deferred).
+                    sources = originals[f.attname]
+                    if not sources or any(a in self.__dict__ for a in sources):
+                        update_fields.append(f.attname)
+                elif f.attname not in self.__dict__:
+                    continue
+                elif (f.attname not in tracked_attnames or f.attname not in saved or
+                        get_value(self, f) != saved[f.attname]):
+                    update_fields.append(f.attname)
+        # An empty list would skip the save (and its signals) altogether.
+        if not update_fields:
+            old_save(self, *args, **kwargs)
+        else:
+            try:
+                old_save(self, **dict(kwargs, update_fields=update_fields))
+            except DatabaseError:
+                if self.__class__._base_manager.using(using).filter(pk=self.pk).exists():
+                    raise
+                # The row was deleted since the instance was loaded.
+                old_save(self, **kwargs)
+        store_values(self)
+
     model.__init__ = new_init
+    model.save = new_save
 
 
 @receiver(post_init)
@@ -192,6 +383,42 @@ def patch_metaclass(model):
     model.__class__ = translation_deferred_mcs
 
 
+# Class attributes which cause a lazily registered model to be patched.
+LAZY_REGISTRATION_TRIGGERS = frozenset(('_meta', 'objects', '_default_manager', '_base_manager'))
+
+
+def patch_lazy_metaclass(model):
+    """
+    Monkey patches the model metaclass to apply a pending registration when
+    the model is instantiated or its options or managers are accessed.
+    """
+    old_mcs = model.__class__
+    if old_mcs.__dict__.get('_mt_lazy', False):
+        return
+
+    class lazy_registration_mcs(old_mcs):
+        _mt_lazy = True
+
+        def __getattribute__(cls, name):
+            if name in LAZY_REGISTRATION_TRIGGERS and not translator._is_materializing():
+                translator._materialize(cls)
+            return type.__getattribute__(cls, name)
+
+        def __call__(cls, *args, **kwargs):
+            translator._materialize(cls)
+            return old_mcs.__call__(cls, *args, **kwargs)
+    model.__class__ = lazy_registration_mcs
+
+
+def unpatch_lazy_metaclass(model):
+    """
+    Restores the metaclass replaced by ``patch_lazy_metaclass`` (also for
+    subclasses created before the registration was applied).
+    """
+    while model.__class__.__dict__.get('_mt_lazy', False):
+        model.__class__ = model.__class__.__bases__[0]
+
+
 def delete_cache_fields(model):
     opts = model._meta
     cached_attrs = ('_field_cache', '_field_name_cache', '_name_map', 'fields', 'concrete_fields',
@@ -203,6 +430,40 @@ def delete_cache_fields(model):
             pass
 
 
+def delete_cache_related_objects(model):
+    opts = model._meta
+    for attr in ('_related_objects_cache', '_related_objects_proxy_cache'):
+        try:
+            delattr(opts, attr)
+        except AttributeError:
+            pass
+
+
+def get_related_targets(opts):
+    """
+    Returns models that local translation fields are relations to (their
+    caches of related objects get outdated by the new fields).
+    """
+    return set(f.rel.to for translation_fields in opts.local_fields.values()
+               for f in translation_fields if getattr(f, 'rel', None) is not None)
+
+
+def invalidate_caches(models, targets):
+    """
+    Deletes caches of related objects of ``targets`` and then caches of
+    fields of all models related to ``models`` (parents and children too),
+    outdated by translation fields added to ``models``.
+    """
+    for target in targets:
+        delete_cache_related_objects(target)
+    related = set()
+    for model in models:
+        related.update(related_obj.model for related_obj in
+                       model._meta.get_all_related_objects())
+    for model in related:
+        delete_cache_fields(model)
+
+
 def populate_translation_fields(sender, kwargs):
     """
     When models are created or loaded from fixtures, replicates values
@@ -228,7 +489,7 @@ def populate_translation_fields(sender, kwargs):
     defined (for example to make lookups / filtering without resorting to
     query fallbacks).
     """
-    populate = mt_settings.AUTO_POPULATE
+    populate = auto_populate_mode()
     if not populate:
         return
     if populate is True:
@@ -238,19 +499,62 @@ def populate_translation_fields(sender, kwargs):
     opts = translator.get_options_for_model(sender)
     for key, val in list(kwargs.items()):
         if key in opts.fields:
-            if populate == 'all':
-                # Set the value for every language.
-                for translation_field in opts.fields[key]:
-                    kwargs.setdefault(translation_field.name, val)
-            elif populate == 'default':
-                default = build_localized_fieldname(key, mt_settings.DEFAULT_LANGUAGE)
-                kwargs.setdefault(default, val)
-            elif populate == 'required':
-                default = build_localized_fieldname(key, mt_settings.DEFAULT_LANGUAGE)
-                if not sender._meta.get_field(key).null:
-                    kwargs.setdefault(default, val)
-            else:
-                raise AttributeError("Unknown population mode '%s'." % populate)
+            for translation_field in get_population_targets(sender, opts, key, populate):
+                kwargs.setdefault(translation_field.name, val)
+
+
+def populate_translation_instances(sender, objs, populate):
+    """
+    Applies population to already constructed instances of ``sender`` (used
+    by ``MultilingualQuerySet.bulk_create``).
+
+    Values of the current language translation fields (those the original
+    fields were rewritten to) are replicated to translation fields that are
+    still ``None``, according to the ``populate`` mode. The targets are
+    computed once for all the objects.
+    """
+    if not populate:
+        return
+    if populate is True:
+        populate = 'all'
+
+    opts = translator.get_options_for_model(sender)
+    lang = get_language()
+    fallback_languages = getattr(opts, 'fallback_languages', None)
+    plan = []
+    for key, translation_fields in opts.fields.items():
+        source_lang = substitute_language(lang, opts.get_field_languages(key), fallback_languages)
+        source = [f.attname for f in translation_fields if f.language == source_lang][0]
+        targets = [f.attname for f in get_population_targets(sender, opts, key, populate)
+                   if f.attname != source]
+        if targets:
+            plan.append((source, targets))
+    for obj in objs:
+        for source, targets in plan:
+            val = getattr(obj, source)
+            if val is None:
+                continue
+            for target in targets:
+                if getattr(obj, target) is None:
+                    setattr(obj, target, val)
+
+
+def get_population_targets(sender, opts, field_name, populate):
+    """
+    Returns translation fields of ``field_name`` which should receive its
+    value under the given population mode.
+    """
+    if populate == 'all':
+        # Set the value for every language.
+        return list(opts.fields[field_name])
+    elif populate in ('default', 'required'):
+        if populate == 'required' and sender._meta.get_field(field_name).null:
+            return []
+        default_lang = substitute_language(mt_settings.DEFAULT_LANGUAGE,
+                                           opts.get_field_languages(field_name))
+        return [f for f in opts.fields[field_name] if f.language == default_lang]
+    else:
+        raise AttributeError("Unknown population mode '%s'." % populate)
 
 
 class Translator(object):
@@ -261,6 +565,49 @@ class Translator(object):
     def __init__(self):
         # All seen models (model class -> ``TranslationOptions`` instance).
         self._registry = {}
+        # Registered models that are still waiting to be patched.
+        self._pending = set()
+        # Models related to by translated fields of pending models (model ->
+        # set of pending models), as patching these adds accessors to them.
+        self._pending_relations = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers invalidation of ``_meta`` caches of related models (and of
+        cached lookup rewrites) until all models registered (or patched)
+        within the block in the current thread are, so they are rebuilt once
+        instead of after every registration. Batches can be nested.
+        """
+        if self._get_batch() is not None:
+            yield
+            return
+        batch = self._local.batch = ([], set())
+        try:
+            yield
+        finally:
+            self._local.batch = None
+            models, targets = batch
+            if models:
+                invalidate_caches(models, targets)
+            clear_rewrite_cache()
+
+    def _get_batch(self):
+        """
+        Returns (patched models, relation targets) of the current batch.
+        """
+        return getattr(self._local, 'batch', None)
+
+    def register_many(self, registrations):
+        """
+        Registers models given as (model or iterable of models, options class)
+        pairs, in a batch.
+        """
+        with self.batch():
+            for model_or_iterable, opts_class in registrations:
+                self.register(model_or_iterable, opts_class)
 
     def register(self, model_or_iterable, opts_class=None, **options):
         """
@@ -294,55 +641,154 @@ class Translator(object):
             # Find inherited fields and create options instance for the model.
             opts = self._get_options_for_model(model, opts_class, **options)
 
+            # Default ordering is rewritten to translation fields, which the
+            # JSON and table storages don't add.
+            stored = set(opts.json_fields) | set(opts.table_fields)
+            if opts.storage in ('json', 'table'):
+                stored.update(opts.local_fields.keys())
+            ordered = [key for key in model._meta.ordering if key.lstrip('-') in stored]
+            if ordered:
+                del self._registry[model]
+                raise ImproperlyConfigured(
+                    'Meta.ordering of %s can not use fields with translations stored as JSON'
+                    ' or in a table (%s).' % (model.__name__, ', '.join(ordered)))
+
             # Mark the object explicitly as registered -- registry caches
             # options of all models, registered or not.
             opts.registered = True
 
-            # Add translation fields to the model.
-            add_translation_fields(model, opts)
-
-            # Delete all fields cache for related model (parent and children)
-            for related_obj in model._meta.get_all_related_objects():
-                delete_cache_fields(related_obj.model)
-
-            # Set MultilingualManager
-            add_manager(model)
-
-            # Patch __init__ to rewrite fields
-            patch_constructor(model)
+            self._pending.add(model)
+            if mt_settings.LAZY_REGISTRATION and opts.storage != 'table':
+                # Fields, descriptors and managers are added on first use (the
+                # model of a translations table has to exist for syncdb), of
+                # the model or of models its translated fields relate to.
+                for field_name in opts.local_fields.keys():
+                    target = getattr(model._meta.get_field(field_name).rel, 'to', None)
+                    if isinstance(target, ModelBase):
+                        self._pending_relations.setdefault(target, set()).add(model)
+                        patch_lazy_metaclass(target)
+                patch_lazy_metaclass(model)
+            else:
+                # Applied right away (with pending registrations of bases).
+                self._materialize(model)
 
-            # Patch __metaclass__ to allow deferring to work
-            patch_metaclass(model)
+        # Cached lookup rewrites may be outdated now.
+        if self._get_batch() is None:
+            clear_rewrite_cache()
 
-            # Substitute original field with descriptor
-            model_fallback_values = getattr(opts, 'fallback_values', None)
-            model_fallback_languages = getattr(opts, 'fallback_languages', None)
-            for field_name in opts.local_fields.keys():
-                if model_fallback_values is None:
-                    field_fallback_value = None
-                elif isinstance(model_fallback_values, dict):
-                    field_fallback_value = model_fallback_values.get(field_name, None)
-                else:
-                    field_fallback_value = model_fallback_values
-                field = model._meta.get_field(field_name)
-                descriptor = TranslationFieldDescriptor(
-                    field,
-                    fallback_value=field_fallback_value,
-                    fallback_languages=model_fallback_languages)
-                setattr(model, field_name, descriptor)
-                if isinstance(field, ForeignKey):
-                    # We need to use a special descriptor so that
-                    # _id fields on translated ForeignKeys work
-                    # as expected.
-                    desc = TranslatedRelationIdDescriptor(field_name, model_fallback_languages)
-                    setattr(model, field.get_attname(), desc)
-
-                    # Set related field names on other model
-                    if not field.rel.is_hidden():
-                        other_opts = self._get_options_for_model(field.rel.to)
-                        other_opts.related = True
-                        other_opts.related_fields.append(field.related_query_name())
-                        add_manager(field.rel.to)  # Add manager in case of non-registered model
+    def _patch_model(self, model, opts):
+        """
+        Adds translation fields, descriptors and the multilingual manager to
+        a registered model.
+        """
+        # Add translation fields to the model.
+        add_translation_fields(model, opts)
+
+        # Delete caches of related models (parent and children too), or leave
+        # it to the end of the batch
+        batch = self._get_batch()
+        if batch is None:
+            invalidate_caches([model], get_related_targets(opts))
+        else:
+            batch[0].append(model)
+            batch[1].update(get_related_targets(opts))
+
+        # Set MultilingualManager
+        add_manager(model)
+
+        # Save translations stored in tables (also inherited ones) after objects
+        for table in opts.tables:
+            post_save.connect(table.save_translations, sender=model, weak=False,
+                              dispatch_uid=table.cache_name)
+
+        # Patch __init__ to rewrite fields
+        patch_constructor(model)
+
+        # Substitute original field with descriptor
+        model_fallback_values = getattr(opts, 'fallback_values', None)
+        model_fallback_languages = getattr(opts, 'fallback_languages', None)
+        for field_name in opts.local_fields.keys():
+            if model_fallback_values is None:
+                field_fallback_value = None
+            elif isinstance(model_fallback_values, dict):
+                field_fallback_value = model_fallback_values.get(field_name, None)
+            else:
+                field_fallback_value = model_fallback_values
+            field = model._meta.get_field(field_name)
+            field_languages = opts.get_field_languages(field_name)
+            descriptor = TranslationFieldDescriptor(
+                field,
+                fallback_value=field_fallback_value,
+                fallback_languages=model_fallback_languages,
+                languages=field_languages)
+            setattr(model, field_name, descriptor)
+            if isinstance(field, ForeignKey):
+                # We need to use a special descriptor so that
+                # _id fields on translated ForeignKeys work
+                # as expected.
+                attnames = dict(
+                    (lang, model._meta.get_field(
+                        build_localized_fieldname(field_name, lang)).get_attname())
+                    for lang in field_languages)
+                desc = TranslatedRelationIdDescriptor(
+                    field_name, model_fallback_languages, attnames)
+                setattr(model, field.get_attname(), desc)
+
+                # Set related field names on other model
+                if not field.rel.is_hidden():
+                    other_opts = self._get_options_for_model(field.rel.to)
+                    other_opts.related = True
+                    other_opts.related_fields.append(field.related_query_name())
+                    add_manager(field.rel.to)  # Add manager in case of non-registered model
+
+        if getattr(opts, 'track_changes', False):
+            patch_change_tracking(model, opts)
+
+        # Patch __metaclass__ to allow deferring to work
+        unpatch_lazy_metaclass(model)
+        patch_metaclass(model)
+
+    def _materialize(self, model):
+        """
+        Applies pending (lazy) registrations of the model, its bases (also if
+        the model itself isn't registered) and of models with translated
+        relations to it.
+        """
+        with self._lock:
+            for base in reversed(model.__mro__[1:]):
+                if base in self._pending:
+                    self._materialize(base)
+            if model in self._pending:
+                self._pending.remove(model)
+                opts = self._registry.get(model)
+                if opts is not None and opts.registered:
+                    # Other pending models used while patching (for instance
+                    # when collecting related objects) are left for later.
+                    materializing = getattr(self._local, 'materializing', False)
+                    self._local.materializing = True
+                    try:
+                        self._patch_model(model, opts)
+                    finally:
+                        self._local.materializing = materializing
+                    if self._get_batch() is None:
+                        clear_rewrite_cache()
+            # Their translation fields add reverse accessors, related fields
+            # and a manager to the model.
+            for source in self._pending_relations.pop(model, ()):
+                self._materialize(source)
+            unpatch_lazy_metaclass(model)
+
+    def _is_materializing(self):
+        return getattr(self._local, 'materializing', False)
+
+    def materialize(self):
+        """
+        Applies all pending registrations (see ``LAZY_REGISTRATION``), for
+        example to avoid doing it on first requests of a web worker.
+        """
+        with self.batch():
+            for model in list(self._pending):
+                self._materialize(model)
 
     def unregister(self, model_or_iterable):
         """
@@ -370,6 +816,12 @@ class Translator(object):
                         ' unregistering its base "%s"' %
                         (desc.__name__, model.__name__))
                 del self._registry[desc]
+            if model in self._pending:
+                self._pending.remove(model)
+                unpatch_lazy_metaclass(model)
+            for sources in self._pending_relations.values():
+                sources.discard(model)
+        clear_rewrite_cache()
 
     def get_registered_models(self, abstract=True):
         """
@@ -377,7 +829,7 @@ class Translator(object):
         registered models.
         """
         return [model for (model, opts) in self._registry.items()
-                if opts.registered and (not model._meta.abstract or abstract)]
+                if opts.registered and (abstract or not model._meta.abstract)]
 
     def _get_options_for_model(self, model, opts_class=None, **options):
         """
@@ -409,6 +861,8 @@ class Translator(object):
         Thin wrapper around ``_get_options_for_model`` to preserve the
         semantic of throwing exception for models not directly registered.
         """
+        if self._pending:
+            self._materialize(model)
         opts = self._get_options_for_model(model)
         if not opts.registered and not opts.related:
             raise NotRegistered('The model "%s" is not registered for '
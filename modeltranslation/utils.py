@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import threading
 from contextlib import contextmanager
 
 from django.utils import six
@@ -9,30 +10,63 @@ from django.utils.functional import lazy
 from modeltranslation import settings
 
 
+# Maps language codes returned by Django to available languages.
+_LANGUAGES_CACHE = {}
+# Settings the cache was filled for (they are only reloaded by tests).
+_languages_cache_source = None
+
+
 def get_language():
     """
     Return an active language code that is guaranteed to be in
     settings.LANGUAGES (Django does not seem to guarantee this for us).
     """
     lang = _get_language()
-    if lang not in settings.AVAILABLE_LANGUAGES and '-' in lang:
-        lang = lang.split('-')[0]
-    if lang in settings.AVAILABLE_LANGUAGES:
-        return lang
-    return settings.DEFAULT_LANGUAGE
+    if _languages_cache_source is settings.AVAILABLE_LANGUAGES:
+        try:
+            return _LANGUAGES_CACHE[lang]
+        except KeyError:
+            pass
+    return _cache_language(lang)
+
+
+def _cache_language(lang):
+    global _languages_cache_source
+    if _languages_cache_source is not settings.AVAILABLE_LANGUAGES:
+        _LANGUAGES_CACHE.clear()
+        _languages_cache_source = settings.AVAILABLE_LANGUAGES
+    available = set(settings.AVAILABLE_LANGUAGES)
+    normalized = lang
+    if normalized not in available and '-' in normalized:
+        normalized = normalized.split('-')[0]
+    if normalized not in available:
+        normalized = settings.DEFAULT_LANGUAGE
+    _LANGUAGES_CACHE[lang] = normalized
+    return normalized
 
 
-def get_translation_fields(field):
+def get_translation_fields(field, languages=None):
     """
-    Returns a list of localized fieldnames for a given field.
+    Returns a list of localized fieldnames for a given field (in the given
+    languages, all available by default).
     """
-    return [build_localized_fieldname(field, l) for l in settings.AVAILABLE_LANGUAGES]
+    if languages is None:
+        languages = settings.AVAILABLE_LANGUAGES
+    return [build_localized_fieldname(field, l) for l in languages]
 
 
 def build_localized_fieldname(field_name, lang):
     return str('%s_%s' % (field_name, lang.replace('-', '_')))
 
 
+def build_translations_fieldname(field_name):
+    """
+    Returns the name of the field storing all translations of a field (with
+    the JSON storage).
+    """
+    return str('%s_translations' % field_name)
+
+
 def _build_localized_verbose_name(verbose_name, lang):
     return force_text('%s [%s]') % (force_text(verbose_name), lang)
 build_localized_verbose_name = lazy(_build_localized_verbose_name, six.text_type)
@@ -85,14 +119,40 @@ def unique(seq):
     return (x for x in seq if x not in seen and not seen.add(x))
 
 
-def resolution_order(lang, override=None):
+def resolution_order(lang, override=None, languages=None):
     """
     Return order of languages which should be checked for parameter language.
     First is always the parameter language, later are fallback languages.
     Override parameter has priority over FALLBACK_LANGUAGES.
+
+    If ``languages`` (of a field) are given, others are left out and the
+    parameter language is substituted if it's not among them.
     """
-    if not settings.ENABLE_FALLBACKS:
+    if languages is not None:
+        lang = substitute_language(lang, languages, override)
+    if not fallbacks_enabled():
         return (lang,)
+    order = _fallback_order(lang, override)
+    if languages is not None:
+        order = tuple(l for l in order if l in languages)
+    return order
+
+
+def substitute_language(lang, languages, override=None):
+    """
+    Returns the language to use for a field translated only into
+    ``languages``: ``lang`` itself if possible, otherwise the first of its
+    fallback languages, the default language or the first of ``languages``.
+    """
+    if lang in languages:
+        return lang
+    for l in _fallback_order(lang, override) + (settings.DEFAULT_LANGUAGE,):
+        if l in languages:
+            return l
+    return languages[0]
+
+
+def _fallback_order(lang, override=None):
     if override is None:
         override = {}
     fallback_for_lang = override.get(lang, settings.FALLBACK_LANGUAGES.get(lang, ()))
@@ -101,6 +161,60 @@ def resolution_order(lang, override=None):
     return tuple(unique(order))
 
 
+def resolution_table(attnames, override=None):
+    """
+    Precomputes resolution order for all available languages.
+
+    Takes a mapping from languages to attribute names and returns a mapping
+    from languages to tuples of attribute names that should be checked (in
+    that order). Languages missing from ``attnames`` are skipped; the first
+    name belongs to the language itself (or its substitute, if it's missing)
+    -- with fallbacks disabled just the first name should be checked.
+    """
+    languages = [l for l in settings.AVAILABLE_LANGUAGES if l in attnames]
+    table = {}
+    for lang in settings.AVAILABLE_LANGUAGES:
+        lang_order = _fallback_order(substitute_language(lang, languages, override), override)
+        table[lang] = tuple(attnames[l] for l in lang_order if l in attnames)
+    return table
+
+
+# Per-thread overrides of settings (set by ``auto_populate`` and ``fallbacks``).
+_overrides = threading.local()
+
+
+def auto_populate_mode():
+    """
+    Returns the population mode in effect in the current thread.
+    """
+    return getattr(_overrides, 'auto_populate', settings.AUTO_POPULATE)
+
+
+def fallbacks_enabled():
+    """
+    Tells if fallbacks are enabled in the current thread.
+    """
+    return getattr(_overrides, 'enable_fallbacks', settings.ENABLE_FALLBACKS)
+
+
+@contextmanager
+def _override(name, value):
+    try:
+        previous = getattr(_overrides, name)
+    except AttributeError:
+        setattr(_overrides, name, value)
+        try:
+            yield
+        finally:
+            delattr(_overrides, name)
+    else:
+        setattr(_overrides, name, value)
+        try:
+            yield
+        finally:
+            setattr(_overrides, name, previous)
+
+
 @contextmanager
 def auto_populate(mode='all'):
     """
@@ -119,13 +233,11 @@ def auto_populate(mode='all'):
 
         with auto_populate('required'):
             call_command('loaddata', 'fixture.json')
+
+    The override only applies to the current thread.
     """
-    current_population_mode = settings.AUTO_POPULATE
-    settings.AUTO_POPULATE = mode
-    try:
+    with _override('auto_populate', mode):
         yield
-    finally:
-        settings.AUTO_POPULATE = current_population_mode
 
 
 @contextmanager
@@ -140,11 +252,7 @@ def fallbacks(enable=True):
 
     May be used to enable fallbacks just when they're needed saving on some
     processing or check if there is a value for the current language (not
-    knowing the language)
+    knowing the language). The override only applies to the current thread.
     """
-    current_enable_fallbacks = settings.ENABLE_FALLBACKS
-    settings.ENABLE_FALLBACKS = enable
-    try:
+    with _override('enable_fallbacks', enable):
         yield
-    finally:
-        settings.ENABLE_FALLBACKS = current_enable_fallbacks
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+Benchmarks for modeltranslation hot paths (descriptors, queryset rewriting,
+instance creation, population and registration).
+
+Every language count is measured in a separate process, as modeltranslation
+reads its settings at import time. Results (and SQL of some of the measured
+queries) are printed or written to a file as JSON, so they can be compared
+between releases:
+
+    $ python runbenchmarks.py --languages=2,10,50 --output=results.json
+"""
+import json
+import os
+import subprocess
+import sys
+from optparse import OptionParser, SUPPRESS_HELP
+from timeit import default_timer
+
+
+LANGUAGE_COUNTS = (2, 10, 50)
+
+
+def configure(languages):
+    from django.conf import settings, global_settings
+
+    codes = ['de', 'en'] + [code for code, name in global_settings.LANGUAGES
+                            if code not in ('de', 'en')]
+    if languages > len(codes):
+        raise ValueError('At most %d languages are available.' % len(codes))
+    settings.configure(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        INSTALLED_APPS=(
+            'modeltranslation',
+            'modeltranslation.tests',
+        ),
+        LANGUAGES=tuple((code, code) for code in codes[:languages]),
+        LANGUAGE_CODE='de',
+        USE_I18N=True,
+        MODELTRANSLATION_FALLBACK_LANGUAGES=('en',),
+    )
+
+
+def create_tables(*models):
+    from django.core.management.color import no_style
+    from django.db import connection
+
+    cursor = connection.cursor()
+    for model in models:
+        sql, _ = connection.creation.sql_create_model(model, no_style(), set())
+        for statement in sql:
+            cursor.execute(statement)
+
+
+def measure(func, number, repeat):
+    """
+    Returns the best time (in seconds) of a single ``func`` call.
+    """
+    best = None
+    for _ in range(repeat):
+        start = default_timer()
+        for _ in range(number):
+            func()
+        elapsed = (default_timer() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def benchmark_register(number, repeat):
+    """
+    Registration needs a fresh model class for every call.
+    """
+    from django.db import models
+    from modeltranslation.translator import translator, TranslationOptions
+
+    class BenchmarkTranslationOptions(TranslationOptions):
+        fields = ('title', 'text', 'url', 'email')
+
+    counter = [0]
+
+    def make_model():
+        counter[0] += 1
+        attrs = {
+            '__module__': __name__,
+            'Meta': type('Meta', (), {'app_label': 'benchmarks'}),
+            'title': models.CharField(max_length=255),
+            'text': models.TextField(blank=True, null=True),
+            'url': models.URLField(blank=True, null=True),
+            'email': models.EmailField(blank=True, null=True),
+        }
+        return type('BenchmarkModel%d' % counter[0], (models.Model,), attrs)
+
+    best = None
+    for _ in range(repeat):
+        batch = [make_model() for _ in range(number)]
+        start = default_timer()
+        for model in batch:
+            translator.register(model, BenchmarkTranslationOptions)
+        elapsed = (default_timer() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def capture_sql(func):
+    """
+    Returns SQL of the last query executed by ``func``.
+    """
+    from django.db import connection
+
+    connection.use_debug_cursor = True
+    try:
+        func()
+        return connection.queries[-1]['sql']
+    finally:
+        connection.use_debug_cursor = None
+
+
+def run(languages, number, repeat, rows):
+    configure(languages)
+
+    from django.db.models import Max
+    from django.utils.translation import activate
+    from modeltranslation.tests.models import TestModel, ManagerTestModel
+    from modeltranslation.translator import populate_translation_fields
+    from modeltranslation.utils import auto_populate
+
+    create_tables(TestModel, ManagerTestModel)
+    activate('de')
+    # A larger table for count / exists / aggregate (ManagerTestModel has a
+    # default ordering on a translated field).
+    ManagerTestModel.objects.bulk_create(
+        [ManagerTestModel(title='title %d' % i, visits=i) for i in range(rows)])
+
+    instance = TestModel(title='title', text='text')
+    # A value only present in the fallback language.
+    instance.text_de = None
+    instance.text_en = 'text'
+
+    def descriptor_get():
+        instance.title
+        instance.text
+
+    def descriptor_set():
+        instance.title = 'title'
+
+    def queryset_filter():
+        TestModel.objects.filter(title='title', text__contains='text')
+
+    def queryset_order_by():
+        ManagerTestModel.objects.order_by('title', '-visits')
+
+    def queryset_update():
+        ManagerTestModel.objects.filter(title='title').update(title='new', visits=1)
+
+    def instance_creation():
+        TestModel(title='title', text='text', url_en='http://example.com/')
+
+    def populate():
+        populate_translation_fields(TestModel, {'title': 'title', 'text': 'text'})
+
+    def queryset_count():
+        ManagerTestModel.objects.filter(visits__gte=0).count()
+
+    def queryset_exists():
+        ManagerTestModel.objects.filter(visits__gte=0).exists()
+
+    def queryset_aggregate():
+        ManagerTestModel.objects.filter(visits__gte=0).aggregate(Max('visits_de'))
+
+    def queryset_subquery():
+        list(TestModel.objects.filter(pk__in=ManagerTestModel.objects.values('pk')))
+
+    benchmarks = {
+        'descriptor_get': descriptor_get,
+        'descriptor_set': descriptor_set,
+        'queryset_filter': queryset_filter,
+        'queryset_order_by': queryset_order_by,
+        'queryset_update': queryset_update,
+        'instance_creation': instance_creation,
+        'populate_translation_fields': populate,
+        'queryset_count': queryset_count,
+        'queryset_exists': queryset_exists,
+        'queryset_aggregate': queryset_aggregate,
+        'queryset_subquery': queryset_subquery,
+    }
+    timings = {}
+    with auto_populate('all'):
+        for name, func in benchmarks.items():
+            timings[name] = measure(func, number, repeat)
+    timings['register'] = benchmark_register(max(number // 100, 1), repeat)
+    sql = dict((name, capture_sql(benchmarks[name])) for name in (
+        'queryset_count', 'queryset_exists', 'queryset_aggregate', 'queryset_subquery'))
+    return {'seconds_per_call': timings, 'sql': sql}
+
+
+def main():
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('--languages', default=','.join(str(n) for n in LANGUAGE_COUNTS),
+                      help='Comma separated numbers of languages to benchmark with '
+                           '[default: %default].')
+    parser.add_option('--number', type='int', default=1000,
+                      help='Number of calls in a single measurement [default: %default].')
+    parser.add_option('--repeat', type='int', default=3,
+                      help='Number of measurements, the best one is reported '
+                           '[default: %default].')
+    parser.add_option('--rows', type='int', default=10000,
+                      help='Number of rows in the table used for count, exists and '
+                           'aggregate [default: %default].')
+    parser.add_option('--output', help='Write results to this file instead of stdout.')
+    parser.add_option('--single', type='int', help=SUPPRESS_HELP)
+    options, args = parser.parse_args()
+
+    if options.single:
+        json.dump(run(options.single, options.number, options.repeat, options.rows),
+                  sys.stdout)
+        return
+
+    import django
+    import modeltranslation
+
+    results = {
+        'modeltranslation': modeltranslation.get_version(),
+        'django': django.get_version(),
+        'python': sys.version.split()[0],
+        'number': options.number,
+        'repeat': options.repeat,
+        'rows': options.rows,
+        'seconds_per_call': {},
+        'sql': {},
+    }
+    for languages in options.languages.split(','):
+        process = subprocess.Popen([
+            sys.executable, os.path.abspath(__file__), '--single', languages,
+            '--number', str(options.number), '--repeat', str(options.repeat),
+            '--rows', str(options.rows)],
+            stdout=subprocess.PIPE)
+        output = process.communicate()[0]
+        if process.returncode:
+            sys.exit(process.returncode)
+        single = json.loads(output.decode('utf-8'))
+        results['seconds_per_call'][languages] = single['seconds_per_call']
+        results['sql'][languages] = single['sql']
+
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()